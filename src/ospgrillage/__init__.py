@@ -1,4 +1,5 @@
 from ospgrillage.static import *
+from ospgrillage.command import *
 from ospgrillage.mesh import *
 from ospgrillage.load import *
 from ospgrillage.material import *
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""
+This module contains the internal representation of `OpenSeesPy` commands used by ospgrillage. Model and analysis
+commands (e.g. node, element, load) are stored as a command name plus its numeric arguments. These are executed by
+calling the `OpenSeesPy` function directly when creating a model instance, and are rendered as text only when writing
+an executable py file (pyfile=True).
+"""
+from collections import namedtuple
+
+import numpy as np
+import openseespy.opensees as ops
+
+
+class OpsCommand(namedtuple("OpsCommand", ["function", "args"])):
+    """
+    Class for a single `OpenSeesPy` command. The command is a tuple of the `OpenSeesPy` function name (`str`) and
+    a tuple of its arguments, for example ``OpsCommand("node", (1, 0.0, 0.0, 0.0))`` for ``ops.node(1, 0.0, 0.0, 0.0)``.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, function: str, args: tuple = ()):
+        return super().__new__(cls, function, tuple(args))
+
+    def execute(self):
+        """
+        Function to call the `OpenSeesPy` command in the current OpenSees model space.
+
+        :return: return value of the `OpenSeesPy` function
+        """
+        return getattr(ops, self.function)(*self.args)
+
+    def render(self) -> str:
+        """
+        Function to render the command as a line of executable python code, e.g. for writing to py file.
+
+        :return: str of command e.g. "ops.node(1, 0.0, 0.0, 0.0)\\n"
+        """
+        return "ops.{function}({args})\n".format(
+            function=self.function,
+            args=", ".join([_render_argument(arg) for arg in self.args]),
+        )
+
+    def __str__(self):
+        return self.render()
+
+
+def _render_argument(arg) -> str:
+    # render argument of OpsCommand as python code
+    if isinstance(arg, str):
+        return '"{}"'.format(arg)
+    elif isinstance(arg, (list, tuple)):
+        return "[{}]".format(", ".join([_render_argument(a) for a in arg]))
+    elif isinstance(arg, np.integer):
+        return repr(int(arg))
+    elif isinstance(arg, np.floating):
+        return repr(float(arg))
+    return repr(arg)
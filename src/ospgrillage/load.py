@@ -8,11 +8,9 @@ moving load and moving load path.
 import pprint
 from collections import namedtuple
 from collections.abc import Iterable
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Union
 
-from scipy import interpolate
-
 from ospgrillage.mesh import *
 
 
@@ -124,7 +122,7 @@ def create_load(**kwargs):
         return PointLoad(**kwargs)
     elif vertice_count == 2:
         return LineLoading(**kwargs)
-    elif vertice_count >= 4:
+    elif vertice_count >= 3:
         return PatchLoading(**kwargs)
     elif type == "nodal":
         fx = kwargs.get("Fx", 0)
@@ -146,7 +144,7 @@ def create_load(**kwargs):
     else:
         raise TypeError(
             'load_type must either be "nodal" or number of load points is incorrect. hint:'
-            " number of load points must either be 1 (point), 2 (line) or 4 (patch)"
+            " number of load points must either be 1 (point), 2 (line), 3 or 4 (patch)"
         )
 
 
@@ -186,9 +184,9 @@ def create_moving_path(**kwargs):
 
 
 # named tuple definition
-LoadPoint = namedtuple("Point", ["x", "y", "z", "p"])
-NodeForces = namedtuple("node_forces", ["Fx", "Fy", "Fz", "Mx", "My", "Mz"])
-Line = namedtuple("line", ["m", "c", "phi"])
+LoadPoint = namedtuple("LoadPoint", ["x", "y", "z", "p"])
+NodeForces = namedtuple("NodeForces", ["Fx", "Fy", "Fz", "Mx", "My", "Mz"])
+Line = namedtuple("Line", ["m", "c", "phi"])
 
 
 # ----------------------------------------------------------------------------------------------------------------
@@ -277,6 +275,13 @@ class Loads:
     def move_load(self, ref_point: Point):
         """
         Function to move each load point of load type by a reference coordinate. This function is handled by OpsGrillage
+
+        .. note::
+            Load points are replaced with new LoadPoint tuples, and no other attribute is modified. Moving loads rely on
+            this to move shallow copies of the base load objects - attributes shared with the base load object (e.g.
+            line_1 to line_4 of PatchLoading) must not be mutated in place, here or by load distribution. See
+            :func:`~ospgrillage.load.MovingLoad.get_increment_loads`.
+
         :param ref_point: coordinate to be moved
         :type ref_point: namedTuple Point(x,y,z)
         :return: increment each load point by +x, +y, +z where (x,y,z) is the coordinate prescribed by ref_point
@@ -442,14 +447,28 @@ class NodalLoad(Loads):
                 "Mz": self.Mz,
             }
 
-    def get_nodal_load_str(self):
+    def get_nodal_load_array(self):
+        """
+        Returns the nodal load array of the NodalLoad, each row is [node_tag, Fx, Fy, Fz, Mx, My, Mz].
+        """
+        node_list = (
+            self.node_tag if isinstance(self.node_tag, Iterable) else [self.node_tag]
+        )
+        load_value = [self.Fx, self.Fy, self.Fz, self.Mx, self.My, self.Mz]
+        return np.array([[node, *load_value] for node in node_list], dtype=float)
+
+    def get_nodal_load_command(self):
         """
-        Returns an ops.load() command for the NodalLoad.
+        Returns an ops.load() command (OpsCommand) for the NodalLoad.
         """
-        # get str for ops.load() function.
         load_value = [self.Fx, self.Fy, self.Fz, self.Mx, self.My, self.Mz]
-        load_str = "ops.load({pt}, *{val})\n".format(pt=self.node_tag, val=load_value)
-        return load_str
+        return OpsCommand("load", (self.node_tag, *load_value))
+
+    def get_nodal_load_str(self):
+        """
+        Returns an ops.load() command str for the NodalLoad.
+        """
+        return self.get_nodal_load_command().render()
 
 
 class PointLoad(Loads):
@@ -619,20 +638,8 @@ class PatchLoading(Loads):
         """
         super().__init__(**kwargs)
         if not all(v is None for v in self.point_list):
-            a, _ = sort_vertices(
-                [
-                    self.load_point_2,
-                    self.load_point_3,
-                    self.load_point_1,
-                    self.load_point_4,
-                ]
-            )
-            match = [
-                self.load_point_1,
-                self.load_point_2,
-                self.load_point_3,
-                self.load_point_4,
-            ]
+            match = self.get_patch_vertices()
+            a, _ = sort_vertices(match[1:3] + match[:1] + match[3:])
             # if len(self.point_list) < 4:
             #     raise ValueError("invalid number of vertices. Hint:  either 4 or 8 is accepted for patch")
 
@@ -655,83 +662,21 @@ class PatchLoading(Loads):
         # create each line
         self.line_1 = LineLoading(point1=self.load_point_1, point2=self.load_point_2)
         self.line_2 = LineLoading(point1=self.load_point_2, point2=self.load_point_3)
-        self.line_3 = LineLoading(point1=self.load_point_3, point2=self.load_point_4)
 
-        # if only four point is define , patch load is a four point straight line quadrilateral
-        if self.load_point_5 is None:
-            # create fourth line
-            self.line_4 = LineLoading(
-                point1=self.load_point_4, point2=self.load_point_1
-            )
-
-            # create equation of plane from four straight lines
-
-            # create interpolate object f
-            p = np.array(
-                [
-                    [self.load_point_1.p, self.load_point_2.p],
-                    [self.load_point_3.p, self.load_point_4.p],
-                ]
-            )
-            x = np.array(
-                [
-                    [self.load_point_1.x, self.load_point_2.x],
-                    [self.load_point_3.x, self.load_point_4.x],
-                ]
-            )
-            z = np.array(
-                [
-                    [self.load_point_1.z, self.load_point_2.z],
-                    [self.load_point_3.z, self.load_point_4.z],
-                ]
-            )
-
-            # create function to get interpolation of p
-            self.patch_mag_interpolate = interpolate.interp2d(x, z, p)
-            mod_list = [ls for ls in self.point_list if ls is not None]
-            self.patch_min_dim = min(
-                [
-                    get_distance(p1, p2)
-                    for (p1, p2) in zip(mod_list, mod_list[1:] + [mod_list[0]])
-                    if all([p1 is not None, p2 is not None])
-                ]
-            )
-        elif self.load_point_4 is None:
-            # update line 3
+        # if only three point is define, patch load is a triangle
+        if self.load_point_4 is None:
+            # create third line
             self.line_3 = LineLoading(
                 point1=self.load_point_3, point2=self.load_point_1
             )
-
-            # TODO create equation of plane from 3 points
-            # create interpolate object f
-            p = np.array(
-                [
-                    [self.load_point_1.p, self.load_point_2.p],
-                    [self.load_point_3.p, self.load_point_4.p],
-                ]
-            )
-            x = np.array(
-                [
-                    [self.load_point_1.x, self.load_point_2.x],
-                    [self.load_point_3.x, self.load_point_4.x],
-                ]
-            )
-            z = np.array(
-                [
-                    [self.load_point_1.z, self.load_point_2.z],
-                    [self.load_point_3.z, self.load_point_4.z],
-                ]
+        # if only four point is define , patch load is a four point straight line quadrilateral
+        elif self.load_point_5 is None:
+            self.line_3 = LineLoading(
+                point1=self.load_point_3, point2=self.load_point_4
             )
-
-            # create function to get interpolation of p
-            self.patch_mag_interpolate = interpolate.interp2d(x, z, p)
-            mod_list = [ls for ls in self.point_list if ls is not None]
-            self.patch_min_dim = min(
-                [
-                    get_distance(p1, p2)
-                    for (p1, p2) in zip(mod_list, mod_list[1:] + [mod_list[0]])
-                    if all([p1 is not None, p2 is not None])
-                ]
+            # create fourth line
+            self.line_4 = LineLoading(
+                point1=self.load_point_4, point2=self.load_point_1
             )
         elif self.load_point_8 is not None:
             # TODO
@@ -745,6 +690,60 @@ class PatchLoading(Loads):
             raise ValueError(
                 "Patch load points for patch load {} not valid".format(self.name)
             )
+        mod_list = self.get_patch_vertices()
+        self.patch_min_dim = min(
+            [
+                get_distance(p1, p2)
+                for (p1, p2) in zip(mod_list, mod_list[1:] + [mod_list[0]])
+            ]
+        )
+
+    def get_patch_vertices(self) -> list:
+        """
+        Function to get the vertices of the patch, in counterclockwise order starting from load_point_1.
+
+        :returns: list of LoadPoint of the 3 (triangle) or 4 (quadrilateral) vertices
+        """
+        return [
+            point
+            for point in [
+                self.load_point_1,
+                self.load_point_2,
+                self.load_point_3,
+                self.load_point_4,
+            ]
+            if point is not None
+        ]
+
+    def patch_mag_interpolate(self, x, z) -> np.ndarray:
+        """
+        Function to interpolate the magnitude of patch load at points (x, z). For a quadrilateral patch, the magnitude
+        is the bilinear surface p = a + b*x + c*z + d*x*z through the four vertices; for a triangle patch, the plane
+        p = a + b*x + c*z through the three vertices. Vertices are read when called, hence the interpolation follows
+        the patch when moved.
+
+        :param x: x coordinate or array of x coordinates
+        :param z: z coordinate or array of z coordinates
+        :returns: array of magnitudes, at least 1-D
+        """
+        vertex = np.array(
+            [[point.x, point.z, point.p] for point in self.get_patch_vertices()]
+        )
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        z = np.atleast_1d(np.asarray(z, dtype=float))
+
+        def basis(x_array, z_array):
+            terms = [np.ones_like(x_array), x_array, z_array]
+            if len(vertex) > 3:
+                terms.append(x_array * z_array)
+            return np.stack(terms, axis=-1)
+
+        # least squares gives exact coefficients through vertices, and a best fit plane where the bilinear terms are
+        # degenerate (e.g. vertices of a rhombus about the axes)
+        coefficient, _, _, _ = np.linalg.lstsq(
+            basis(vertex[:, 0], vertex[:, 1]), vertex[:, 2], rcond=None
+        )
+        return basis(x, z) @ coefficient
 
 
 # ---------------------------------------------------------------------------------------------------------------
@@ -997,51 +996,111 @@ class MovingLoad:
             )
         self.load_case_dict_list.append(load_pair_path)
 
-    # function to create incremental load cases for each step of the moving loads. Function handled by OspGrillage
+    # function to parse increments of the moving loads. Function handled by OspGrillage
     def parse_moving_load_cases(self):
+        """
+        Function to parse the load groups of moving load into a compact representation of its increments. For each
+        load group, the base load object is kept once with an array of path positions (offsets) of the increments,
+        and the base geometry of its point loads as an array. No load case is created for the increments - see
+        :func:`~ospgrillage.load.MovingLoad.get_increment_loads` and
+        :func:`~ospgrillage.load.MovingLoad.get_increment_load_case`.
+
+        :returns: list of dict for each load group, with keys:
+
+            * load: base load object of load group
+            * offset: array of path positions of increments (n_steps, 3)
+            * name: list of name str of increments
+            * point: array of base point loads [x, y, z, p] (k, 4)
+            * shape_function: list of shape function str of point loads
+            * load_list: list of base load objects other than point loads (e.g. line, patch loads)
+        """
         # loop through all load-path pairs and identify static loads
+        self.static_load_case = [
+            load_pair_dict["load"]
+            for load_pair_dict in self.load_case_dict_list
+            if not load_pair_dict["path"]  # empty path, load is static
+        ]
+        self.moving_load_case = []
         for load_pair_dict in self.load_case_dict_list:
-            if not load_pair_dict["path"]:  # empty path, load is static
-                self.static_load_case.append(load_pair_dict["load"])
-
-        # create load case obj for each step in the move
-        for load_pair_dict in self.load_case_dict_list:
-            path_list = load_pair_dict["path"]  # extract path_list of load object
             load_obj = load_pair_dict["load"]
-            # loop to create a load case for each increment of the path obj
-            load_case_list = []
-            for steps in path_list:
-                load_step_lc = LoadCase(
-                    name="{} at global position [{:.2f},{:.2f},{:.2f}]".format(
-                        self.name, steps[0], steps[1], steps[2]
+            offset = np.array(load_pair_dict["path"], dtype=float).reshape(-1, 3)
+            moving_load_group = {
+                "load": load_obj,
+                "offset": offset,
+                "name": [
+                    "{} at global position [{:.2f},{:.2f},{:.2f}]".format(
+                        self.name, *steps
                     )
-                )  # _lc in name stands for load case
-                load_obj_copy = deepcopy(
-                    load_obj
-                )  # Use deepcopy module to copy instance of load
-                load_step_lc.add_load(
-                    load_obj_copy
-                )  # and add load to newly created load case
-                # add entries of static load to load groups
-                step_point = Point(
-                    steps[0], steps[1], steps[2]
-                )  # convert increment position into Point tuple
-                load_step_lc.move_load_group(
-                    step_point
-                )  # increment the load groups by step point
-                # static load not used
-                for (
-                    static_load
-                ) in (
-                    self.static_load_case
-                ):  # add static load portions to each incremental load case
-                    static_load_copy = deepcopy(static_load)
-                    load_step_lc.add_load(static_load_copy)
-                load_case_list.append(load_step_lc)
-            self.moving_load_case.append(load_case_list)
-            self.parse = True
+                    for steps in load_pair_dict["path"]
+                ],
+            }
+            moving_load_group.update(_split_point_loads(load_obj))
+            self.moving_load_case.append(moving_load_group)
+        # static loads are added to each increment of load groups
+        self.static_load_group = _split_point_loads(*self.static_load_case)
+        self.parse = True
         return self.moving_load_case
 
+    def get_increment_loads(self, group_index: int, step: int):
+        """
+        Function to get the loads of an increment of a load group, moved to the path position of the increment. The
+        base load objects are not copied: point loads are returned as an array, and other loads (e.g. line, patch
+        loads) as shallow copies of the base load objects. Static loads of the moving load are appended.
+
+        :param group_index: Index of load group in moving_load_case
+        :type group_index: int
+        :param step: Index of increment along path of load group
+        :type step: int
+        :returns: tuple of (list of load objects other than point loads, array of point loads [x, y, z, p],
+                  list of shape function str of point loads)
+        """
+        moving_load_group = self.moving_load_case[group_index]
+        position = Point(*moving_load_group["offset"][step])
+        load_list = []
+        for load_obj in moving_load_group["load_list"]:
+            load_obj = copy(
+                load_obj
+            )  # move_load() replaces, and does not modify, load points
+            load_obj.move_load(position)
+            load_list.append(load_obj)
+        point = moving_load_group["point"].copy()
+        point[:, 0] += position.x
+        point[:, 2] += position.z
+        return (
+            load_list + self.static_load_group["load_list"],
+            np.vstack([point, self.static_load_group["point"]]),
+            moving_load_group["shape_function"]
+            + self.static_load_group["shape_function"],
+        )
+
+    def get_increment_load_case(self, incremental_lc_name: str) -> LoadCase:
+        """
+        Function to create the load case of an increment of moving load.
+
+        :param incremental_lc_name: Name string of increment
+        :type incremental_lc_name: str
+        :returns: :class:`~ospgrillage.load.LoadCase` object. None if no increment of the name
+        """
+        for moving_load_group in self.moving_load_case:
+            if incremental_lc_name not in moving_load_group["name"]:
+                continue
+            steps = moving_load_group["offset"][
+                moving_load_group["name"].index(incremental_lc_name)
+            ]
+            load_step_lc = LoadCase(
+                name=incremental_lc_name
+            )  # _lc in name stands for load case
+            load_step_lc.add_load(
+                moving_load_group["load"]
+            )  # add copy of load to newly created load case
+            load_step_lc.move_load_group(
+                Point(*steps)
+            )  # increment the load groups by step point
+            # add static load portions to the incremental load case
+            for static_load in self.static_load_case:
+                load_step_lc.add_load(static_load)
+            return load_step_lc
+
     def query(self, incremental_lc_name, **kwargs):
         """
         Function to query properties of moving load
@@ -1064,15 +1123,8 @@ class MovingLoad:
         index = kwargs.get("index", 0)
         option = kwargs.get("option", "position")
 
-        # instantiate variables
-        query_load_case = []
-        # get incremental load cases based on incremental names provided by users
-        for ml in self.moving_load_case:
-            for incremental_lc in ml:
-                if self.incremental_name == incremental_lc.name:
-                    query_load_case = incremental_lc
-                    break
-            break
+        # create incremental load case based on incremental names provided by users
+        query_load_case = self.get_increment_load_case(self.incremental_name)
         # get load groups within moving load and its respective path
         if load_group_name:
             selected_load_groups = [
@@ -1141,6 +1193,31 @@ class Path:
         return path_point_list
 
 
+def _split_point_loads(*load_objs) -> dict:
+    # split load objects (and load objects within compound loads) into an array of point loads [x, y, z, p] with
+    # their shape functions, and a list of the other load objects
+    point = []
+    shape_function = []
+    load_list = []
+    for load_obj in load_objs:
+        nested_list_of_load = (
+            load_obj.compound_load_obj_list
+            if isinstance(load_obj, CompoundLoad)
+            else [load_obj]
+        )
+        for nested_load in nested_list_of_load:
+            if isinstance(nested_load, PointLoad):
+                point.append(list(nested_load.load_point_1))
+                shape_function.append(nested_load.shape_function)
+            else:
+                load_list.append(nested_load)
+    return {
+        "point": np.array(point, dtype=float).reshape(-1, 4),
+        "shape_function": shape_function,
+        "load_list": load_list,
+    }
+
+
 # ---------------------------------------------------------------------------------------------------------------
 def create_load_model(**kwargs):
     """
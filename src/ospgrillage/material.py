@@ -7,6 +7,8 @@ This module contains the user interface function and class to manage
 
 import json
 
+from ospgrillage.command import OpsCommand
+
 
 def create_material(**kwargs):
     """
@@ -293,18 +295,18 @@ class Material:
         :param material_tag: tag of material defined in in OpenSeesPy space
         :type material_tag: int
 
-        :return: Str of OpenSees command to create material in OpenSeesPy
+        :return: OpsCommand to create material in OpenSeesPy
 
         """
         # e.g. concrete01 or steel01
-        mat_str = None
+        mat_command = None
         if (
             self.ops_mat_type == "Concrete01"
             or self.ops_mat_type == "Steel01"
             or self.ops_mat_type == "Elastic"
         ):
-            mat_str = 'ops.uniaxialMaterial("{type}", {tag}, *{vec})\n'.format(
-                type=self.ops_mat_type, tag=material_tag, vec=self.op_mat_arg
+            mat_command = OpsCommand(
+                "uniaxialMaterial", (self.ops_mat_type, material_tag, *self.op_mat_arg)
             )
 
-        return mat_str
+        return mat_command
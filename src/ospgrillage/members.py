@@ -5,8 +5,11 @@ grillage members. In our terminology, we define a section as the geometrical
 properties of the structural elements, and the member as the combination of
 the section and material properties.
 """
+import math
 from typing import TYPE_CHECKING
 
+from ospgrillage.command import OpsCommand
+
 # if TYPE_CHECKING:
 #     from material import Material
 
@@ -248,7 +251,8 @@ class GrillageMember:
         """
         Returns the element arguments based on the op_element_type of the GrillageMember.
 
-        :return: str containing member properties in accordance with convention of OpenSees element type
+        :return: list containing member properties in accordance with convention of OpenSees element type. Properties
+                 are rounded to 4 significant figures.
         """
 
         asterisk_input = None
@@ -270,7 +274,7 @@ class GrillageMember:
                         self.section.op_ele_type
                     )
                 )
-            asterisk_input = "[{:.3e}, {:.3e}, {:.3e}, {:.3e}, {:.3e}, {:.3e}, {:.3e}, {:.3e}]".format(
+            asterisk_input = [
                 self.material.elastic_modulus,
                 self.material.shear_modulus,
                 self.section.A * width,
@@ -279,7 +283,7 @@ class GrillageMember:
                 self.section.Iz * width,
                 self.section.Ay * width,
                 self.section.Az * width,
-            )
+            ]
         elif self.section.op_ele_type == "elasticBeamColumn":  # eleColumn
             if None in [
                 self.material.elastic_modulus,
@@ -295,14 +299,14 @@ class GrillageMember:
                     )
                 )
 
-            asterisk_input = "[{:.3e}, {:.3e}, {:.3e}, {:.3e}, {:.3e}, {:.3e}]".format(
+            asterisk_input = [
                 self.section.A * width,
                 self.material.elastic_modulus,
                 self.material.shear_modulus,
                 self.section.J * width,
                 self.section.Iy * width,
                 self.section.Iz * width,
-            )
+            ]
 
         elif self.section.op_ele_type == "ModElasticBeam2d":
             if None in [
@@ -318,17 +322,22 @@ class GrillageMember:
                         self.section.op_section_type
                     )
                 )
-            asterisk_input = "[{:.3e}, {:.3e}, {:.3e}, {:.3e}, {:.3e}, {:.3e}]".format(
+            asterisk_input = [
                 self.section.A * width,
                 self.material.elastic_modulus,
                 self.section.Iz * width,
                 self.section.K11,
                 self.section.K33,
                 self.section.K44,
-            )
+            ]
 
         # TO be populated with more inputs for various element types
-
+        if asterisk_input is not None:
+            # round to 4 significant figures
+            asterisk_input = [
+                round(val, 3 - math.floor(math.log10(abs(val)))) if val else val
+                for val in asterisk_input
+            ]
         return asterisk_input
 
     # Function to return argument, handled by OspGrillage
@@ -361,38 +370,34 @@ class GrillageMember:
         """
         Returns the ``OpenSeesPy`` Section command for the Section type
 
-        :return: str containing the ``OpenSeesPy`` Section command
+        :return: OpsCommand of the ``OpenSeesPy`` Section command
         """
-        sec_str = None
+        sec_command = None
         section_type = self.section.op_section_type
         if section_type == "Elastic":
             # section type, section tag, argument entries from self.get_asterisk_input()
             sec_arg = self.get_section_arguments(ele_width=ele_width)
-            sec_str = 'ops.section("{type}", {tag}, *{arg})\n'.format(
-                type=section_type, tag=section_tag, arg=repr(sec_arg)
-            )
+            sec_command = OpsCommand("section", (section_type, section_tag, *sec_arg))
         elif section_type == "ElasticMembranePlateSection":
             # section type, section tag, E_mod, nu, h, rho
-            sec_str = (
-                'ops.section("{type}", {tag}, {E_mod}, {nu}, {h}, {rho})\n'.format(
-                    type=section_type,
-                    tag=section_tag,
-                    E_mod=self.material.elastic_modulus,
-                    nu=self.material.poisson_ratio,
-                    h=self.section.h_depth,
-                    rho=self.material.density,
-                )
+            sec_command = OpsCommand(
+                "section",
+                (
+                    section_type,
+                    section_tag,
+                    self.material.elastic_modulus,
+                    self.material.poisson_ratio,
+                    self.section.h_depth,
+                    self.material.density,
+                ),
             )
         elif section_type == "PlateFiber":
             # section type, section tag, E_mod, nu, h, rho
-            sec_str = 'ops.section("{type}", {tag}, {mat_tag}, {h})\n'.format(
-                type=section_type,
-                tag=section_tag,
-                h=self.section.h_depth,
-                mat_tag=material_tag,
+            sec_command = OpsCommand(
+                "section", (section_type, section_tag, material_tag, self.section.h_depth)
             )
 
-        return sec_str
+        return sec_command
 
     def get_element_command_str(
         self,
@@ -403,7 +408,28 @@ class GrillageMember:
         materialtag: int = None,
         sectiontag: int = None,
     ) -> str:
-        """Return a list of OpenSeesPy element command for the member.
+        """Return the OpenSeesPy element command for the member as a str. See
+        :func:`~ospgrillage.members.GrillageMember.get_element_command`
+        """
+        return self.get_element_command(
+            ele_tag=ele_tag,
+            node_tag_list=node_tag_list,
+            transf_tag=transf_tag,
+            ele_width=ele_width,
+            materialtag=materialtag,
+            sectiontag=sectiontag,
+        ).render()
+
+    def get_element_command(
+        self,
+        ele_tag: int,
+        node_tag_list: list,
+        transf_tag: int = None,
+        ele_width: float = 1,
+        materialtag: int = None,
+        sectiontag: int = None,
+    ) -> OpsCommand:
+        """Return the OpenSeesPy element command (OpsCommand) for the member.
         This function is handled by OspGrillage class.
         """
         # ```
@@ -413,63 +439,60 @@ class GrillageMember:
         #
         # Procedure to be called
         # 1) OpsGrillage assigns the material and section first, then returns the tag of material and section
-        # 2) OpsGrillage calls get_element_command_str of GrillageMember, then it takes in material section and returns
+        # 2) OpsGrillage calls get_element_command of GrillageMember, then it takes in material section and returns
         #  the element command ops.element() for the respective grillage member
 
         # format of each ele sublist
         # [node i, node j, ele group, ele tag, transtag]
         # ```
         section_input = None
-        ele_str = None
-        if self.section.op_ele_type == "ElasticTimoshenkoBeam":
+        ele_command = None
+        if self.section.op_ele_type in ["ElasticTimoshenkoBeam", "elasticBeamColumn"]:
             section_input = self.get_member_prop_arguments(ele_width)
-            ele_str = 'ops.element("{type}", {tag}, *{node_tag_list}, *{memberprop}, {transftag}, {mass})\n'.format(
-                type=self.section.op_ele_type,
-                tag=ele_tag,
-                node_tag_list=node_tag_list,
-                memberprop=section_input,
-                transftag=transf_tag,
-                mass=self.mass,
-            )
-        elif self.section.op_ele_type == "elasticBeamColumn":
-            section_input = self.get_member_prop_arguments(ele_width)
-            ele_str = 'ops.element("{type}", {tag}, *{node_tag_list}, *{memberprop}, {transftag}, {mass})\n'.format(
-                type=self.section.op_ele_type,
-                tag=ele_tag,
-                node_tag_list=node_tag_list,
-                memberprop=section_input,
-                transftag=transf_tag,
-                mass=self.mass,
+            ele_command = OpsCommand(
+                "element",
+                (
+                    self.section.op_ele_type,
+                    ele_tag,
+                    *node_tag_list,
+                    *section_input,
+                    transf_tag,
+                    self.mass,
+                ),
             )
         elif self.section.op_ele_type == "nonlinearBeamColumn":
-            ele_str = 'ops.element("{type}",{tag},*{node_tag_list},{num_int_pt},{sectag},{transftag},{mass})\n'.format(
-                type=self.section.op_ele_type,
-                tag=ele_tag,
-                node_tag_list=node_tag_list,
-                num_int_pt=self.section.num_int_pt,
-                sectag=sectiontag,
-                transftag=transf_tag,
-                mass=self.mass,
+            ele_command = OpsCommand(
+                "element",
+                (
+                    self.section.op_ele_type,
+                    ele_tag,
+                    *node_tag_list,
+                    self.section.num_int_pt,
+                    sectiontag,
+                    transf_tag,
+                    self.mass,
+                ),
             )
         elif self.section.op_ele_type == "zeroLength":
-            ele_str = "ops.element(\"{linktype}\",{ele_tag},*[{rNodetag},{cNodetag}],'-mat',{mat_tag},'-dir',{dirs})\n".format(
-                linktype=self.section.op_ele_type,
-                rNodetag=node_tag_list[0],
-                cNodetag=node_tag_list[1],
-                dirs=6,
-                mat_tag=materialtag,
-                ele_tag=ele_tag,
+            ele_command = OpsCommand(
+                "element",
+                (
+                    self.section.op_ele_type,
+                    ele_tag,
+                    node_tag_list[0],
+                    node_tag_list[1],
+                    "-mat",
+                    materialtag,
+                    "-dir",
+                    6,
+                ),
             )
 
         # for shell element option
-        elif self.section.op_ele_type == "ShellMITC4":
-            ele_str = (
-                'ops.element("{type}", {tag}, *{node_tag_list}, {sectag})\n'.format(
-                    type=self.section.op_ele_type,
-                    tag=ele_tag,
-                    node_tag_list=node_tag_list,
-                    sectag=sectiontag,
-                )
+        elif self.section.op_ele_type in ["ShellMITC4", "ShellDKGT"]:
+            ele_command = OpsCommand(
+                "element",
+                (self.section.op_ele_type, ele_tag, *node_tag_list, sectiontag),
             )
 
         elif self.section.op_ele_type == "ShellDKGQ":
@@ -477,23 +500,8 @@ class GrillageMember:
                 ele_type = "ShellDKGT"
             else:  # 4 node
                 ele_type = "ShellDKGQ"
-            ele_str = (
-                'ops.element("{type}", {tag}, *{node_tag_list}, {sectag})\n'.format(
-                    type=ele_type,
-                    tag=ele_tag,
-                    node_tag_list=node_tag_list,
-                    sectag=sectiontag,
-                )
-            )
-
-        elif self.section.op_ele_type == "ShellDKGT":
-            ele_str = (
-                'ops.element("{type}", {tag}, *{node_tag_list}, {sectag})\n'.format(
-                    type=self.section.op_ele_type,
-                    tag=ele_tag,
-                    node_tag_list=node_tag_list,
-                    sectag=sectiontag,
-                )
+            ele_command = OpsCommand(
+                "element", (ele_type, ele_tag, *node_tag_list, sectiontag)
             )
 
-        return ele_str
+        return ele_command
@@ -5,11 +5,17 @@ information about the grillage mesh such as nodes, elements, and grids. Addition
 mesh grillages, either orthogonal or oblique. Unlike other modules, the constructor of Mesh class is handled exclusively
 by OspGrillage class.
 """
+import json
 import math
 
 from ospgrillage.static import *
+from ospgrillage.command import *
 from collections import namedtuple
+from collections.abc import Mapping, Sequence
+from itertools import combinations
 
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import reverse_cuthill_mckee
 
 def create_point(**kwargs):
     """
@@ -34,6 +40,67 @@ def create_point(**kwargs):
 Point = namedtuple("Point", ["x", "y", "z"])
 
 
+class NodeSpecView(Mapping):
+    """
+    Read-only view of the compact node arrays of a :class:`Mesh` with the same layout as the node_spec dict, i.e.
+    key: node tag, val: dict of node details {"tag", "coordinate", "x_group", "z_group"}.
+    """
+
+    def __init__(self, mesh):
+        self.mesh = mesh
+
+    def __getitem__(self, tag):
+        row = self.mesh.node_tag_to_row[tag]
+        return {
+            "tag": tag,
+            "coordinate": list(self.mesh.node_coordinate_array[row]),
+            "x_group": self.mesh.node_group_label_dict["x_group"].get(
+                tag, int(self.mesh.node_x_group_array[row])
+            ),
+            "z_group": self.mesh.node_group_label_dict["z_group"].get(
+                tag, int(self.mesh.node_z_group_array[row])
+            ),
+        }
+
+    def __iter__(self):
+        return iter(self.mesh.node_tag_array.tolist())
+
+    def __len__(self):
+        return len(self.mesh.node_tag_array)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+class ElementListView(Sequence):
+    """
+    Read-only view of a compact element connectivity array of a :class:`Mesh` with the same layout as element lists,
+    i.e. list of [tag, node i, node j, group, transform tag].
+    """
+
+    def __init__(self, mesh, kind: str):
+        self.mesh = mesh
+        self.kind = kind
+
+    def __getitem__(self, index):
+        return self.mesh.ele_connectivity_dict[self.kind][index].tolist()
+
+    def __len__(self):
+        return len(self.mesh.ele_connectivity_dict[self.kind])
+
+    def __add__(self, other):
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self)
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+
 class Mesh:
     """
     Class for Mesh.
@@ -97,6 +164,9 @@ class Mesh:
         self.global_x_grid_count = global_x_grid_count
         self.global_z_grid_count = None
         self.assigned_node_coord_dict = dict()
+        self.assigned_coord_to_node_dict = (
+            dict()
+        )  # key: tuple of node coordinate, val: node tag
         # edge construction line variables
         self.global_edge_count = global_edge_count
         self.edge_node_recorder = dict()  # key: node tag, val: unique tag for edge
@@ -112,12 +182,42 @@ class Mesh:
         self.trans_ele = []
         self.edge_span_ele = []
         self.connect_ele = []
-        self.link_str_list = []
+        self.link_str_list = []  # list of OpsCommand of rigidLink()
+        self.node_pair_to_element = (
+            dict()
+        )  # key: frozenset of node i and j, val: (element kind, index) - see _create_node_pair_element_index()
+        self.node_to_grids = dict()  # key: node tag, val: set of grid numbers
         # dict for node and ele transform
-        self.transform_dict = dict()  # key: vector xz, val: transform tag
+        self.transform_dict = (
+            dict()
+        )  # key: tuple of (vector xz, global offset of node i and j), val: transform tag
         self.node_spec = (
             dict()
         )  # key: node tag, val: dict of node details - see technical notes
+        # compact array storage of nodes and elements - see compact_mesh_storage()
+        self.node_tag_array = np.zeros(0, dtype=int)
+        self.node_coordinate_array = np.zeros((0, 3))  # rows of [x, y, z]
+        self.node_x_group_array = np.zeros(0, dtype=int)  # -1 for str groups
+        self.node_z_group_array = np.zeros(0, dtype=int)  # -1 for str groups
+        self.node_group_label_dict = {
+            "x_group": dict(),
+            "z_group": dict(),
+        }  # key: "x_group" or "z_group", val: dict of node tag to str group
+        self.node_tag_to_row = dict()  # key: node tag, val: row of node arrays
+        self.ele_attribute_dict = {
+            "long": "long_ele",
+            "trans": "trans_ele",
+            "edge": "edge_span_ele",
+            "connect": "connect_ele",
+        }  # key: element kind, val: attribute of element list
+        self.ele_connectivity_dict = (
+            dict()
+        )  # key: element kind, val: array (M,5) of [tag, node i, node j, group, transform tag]
+        # spatial index of grids - see _create_grid_spatial_index()
+        self.grid_bucket_dict = dict()  # key: (i, k) bucket index, val: list of grids
+        self.grid_bucket_size = 1.0  # size of square bucket in x-z plane
+        self.grid_bucket_origin = [0, 0]  # x, z of bucket (0,0) corner
+        self.grid_unbounded_list = []  # degenerate grids (zero area) - always searched
         # variables for curve mesh
         # if multiple curve centers are presented, assign each curve to respective spans of multi_span_dist_list
         self.curve_center = []
@@ -391,6 +491,381 @@ class Mesh:
         self._identify_member_groups()
         # model plane
         self.model_plane_z_groups = list(self.z_group_to_ele.keys())
+        # index grids for point-in-grid search
+        self._create_grid_spatial_index()
+
+    def _create_grid_spatial_index(self):
+        # Function to create a bucket grid over the bounding boxes of grids in grid_number_dict. Buckets are squares
+        # in the x-z plane with size of the median grid dimension, so a point query checks only the few grids whose
+        # bounding box overlaps the bucket of the point instead of all grids of the mesh.
+        # Vertex arrays of grids (row = grid number) are also stored here for vectorised point location - see
+        # OspGrillage.locate_points().
+        self.grid_bucket_dict = dict()
+        self.grid_unbounded_list = []
+        num_grid = len(self.grid_number_dict)
+        self.grid_node_array = -np.ones((num_grid, 4), dtype=int)  # -1 for no node
+        self.grid_vertex_array = np.zeros((num_grid, 4, 2))  # [x, z] of nodes
+        self.grid_signed_area = np.zeros(num_grid)
+        self.grid_sorted_node_array = -np.ones((num_grid, 4), dtype=int)
+        self.grid_sorted_vertex_array = np.full((num_grid, 4, 2), np.nan)
+        grid_bounds = dict()  # key: grid, val: [x_min, x_max, z_min, z_max]
+        for grid, grid_nodes in self.grid_number_dict.items():
+            grid_nodes = [node for node in grid_nodes if node != []]
+            if not grid_nodes:
+                self.grid_unbounded_list.append(grid)
+                continue
+            point_list = [
+                Point(*self.node_spec[node]["coordinate"]) for node in grid_nodes
+            ]
+            coord = np.array([[point.x, point.z] for point in point_list])
+            signed_area = check_points_direction(point_list)
+            # store grid vertices, padded with the last vertex (zero length edge) for grids with less than four nodes
+            num_node = len(grid_nodes)
+            self.grid_node_array[grid, :num_node] = grid_nodes
+            self.grid_vertex_array[grid, :num_node] = coord
+            self.grid_vertex_array[grid, num_node:] = coord[-1]
+            self.grid_signed_area[grid] = signed_area
+            sorted_point, sorted_node = sort_vertices(point_list, grid_nodes)
+            self.grid_sorted_node_array[grid, :num_node] = sorted_node
+            self.grid_sorted_vertex_array[grid, :num_node] = [
+                [point.x, point.z] for point in sorted_point
+            ]
+            # zero area grids (colinear nodes) do not bound points in check_point_in_grid, always searched
+            if num_node < 3 or signed_area == 0:
+                self.grid_unbounded_list.append(grid)
+                continue
+            grid_bounds[grid] = [
+                min(coord[:, 0]),
+                max(coord[:, 0]),
+                min(coord[:, 1]),
+                max(coord[:, 1]),
+            ]
+        # congruence class of grids - grids with the same sorted vertices relative to their first sorted vertex (e.g.
+        # grids of uniform spacing on a straight deck) share a class, and hence share the nodal weights of a point
+        # load at the same position relative to the grid. See OspGrillage._assign_points_to_four_node()
+        relative_vertex = (
+            self.grid_sorted_vertex_array - self.grid_sorted_vertex_array[:, :1]
+        )
+        self.grid_shape_decimal = (
+            self.decimal_lim + 6
+        )  # decimals of relative coordinates
+        relative_vertex = np.nan_to_num(
+            np.round(relative_vertex, self.grid_shape_decimal) + 0.0, nan=np.inf
+        )  # + 0.0 for -0.0, inf for no vertex
+        self.grid_shape_class = np.unique(
+            relative_vertex.reshape(num_grid, 8), axis=0, return_inverse=True
+        )[1].ravel()
+        # bucket grid in compressed sparse row (CSR) form - grids of bucket b are
+        # grid_bucket_indices[grid_bucket_indptr[b]:grid_bucket_indptr[b + 1]], see get_candidate_grid_pairs()
+        self.grid_bucket_index_min = np.zeros(2, dtype=int)  # (i, k) of first bucket
+        self.grid_bucket_shape = np.zeros(2, dtype=int)  # number of buckets in (i, k)
+        self.grid_bucket_indptr = np.zeros(1, dtype=int)
+        self.grid_bucket_indices = np.zeros(0, dtype=int)
+        if not grid_bounds:
+            return
+        bounds = np.array(list(grid_bounds.values()))
+        self.grid_bucket_origin = [min(bounds[:, 0]), min(bounds[:, 2])]
+        grid_size = np.maximum(bounds[:, 1] - bounds[:, 0], bounds[:, 3] - bounds[:, 2])
+        self.grid_bucket_size = float(np.median(grid_size))
+        # pad bounding boxes for floating point error of points lying on grid edges
+        pad = 10 ** (-self.decimal_lim) * self.grid_bucket_size
+        for grid, (x_min, x_max, z_min, z_max) in grid_bounds.items():
+            i_min, k_min = self._get_grid_bucket(x_min - pad, z_min - pad)
+            i_max, k_max = self._get_grid_bucket(x_max + pad, z_max + pad)
+            for i in range(i_min, i_max + 1):
+                for k in range(k_min, k_max + 1):
+                    self.grid_bucket_dict.setdefault((i, k), []).append(grid)
+        bucket_index = np.array(list(self.grid_bucket_dict.keys()), dtype=int)
+        self.grid_bucket_index_min = bucket_index.min(axis=0)
+        self.grid_bucket_shape = bucket_index.max(axis=0) - self.grid_bucket_index_min + 1
+        bucket_grids = [[] for _ in range(np.prod(self.grid_bucket_shape))]
+        for (i, k), grids in self.grid_bucket_dict.items():
+            bucket_grids[
+                (i - self.grid_bucket_index_min[0]) * self.grid_bucket_shape[1]
+                + k
+                - self.grid_bucket_index_min[1]
+            ] = grids
+        self.grid_bucket_indptr = np.cumsum(
+            [0] + [len(grids) for grids in bucket_grids]
+        )
+        self.grid_bucket_indices = np.array(
+            [grid for grids in bucket_grids for grid in grids], dtype=int
+        )
+
+    def _get_grid_bucket(self, x: float, z: float):
+        # returns (i, k) index of bucket containing point x, z
+        return (
+            int(np.floor((x - self.grid_bucket_origin[0]) / self.grid_bucket_size)),
+            int(np.floor((z - self.grid_bucket_origin[1]) / self.grid_bucket_size)),
+        )
+
+    def get_candidate_grids(self, x: float, z: float) -> list:
+        """
+        Function to get grids which may contain the point (x, z) using the spatial index of grids. Candidate grids are
+        to be checked with :func:`check_point_in_grid`.
+
+        :param x: x coordinate of point
+        :param z: z coordinate of point
+        :returns: list of grid numbers, in order of grid_number_dict
+        """
+        candidate_grids = (
+            self.grid_bucket_dict.get(self._get_grid_bucket(x, z), [])
+            + self.grid_unbounded_list
+        )
+        return sorted(candidate_grids)
+
+    def get_candidate_grid_pairs(self, x: np.ndarray, z: np.ndarray):
+        """
+        Function to get grids which may contain each of the points (x, z), vectorised over arrays of points. Buckets
+        of all points are computed in one pass and their grids gathered from the CSR arrays of the spatial index of
+        grids. Candidate grids are to be checked with :func:`check_point_in_grid`.
+
+        :param x: Array of x coordinates of points
+        :param z: Array of z coordinates of points
+        :returns: tuple of arrays (point index, grid number) of each candidate pair
+        """
+        x = np.asarray(x, dtype=float)
+        z = np.asarray(z, dtype=float)
+        num_point = len(x)
+        num_bucket_grids = np.zeros(num_point, dtype=int)
+        bucket_start = np.zeros(num_point, dtype=int)
+        if len(self.grid_bucket_indices) > 0:
+            i = (
+                np.floor((x - self.grid_bucket_origin[0]) / self.grid_bucket_size)
+                - self.grid_bucket_index_min[0]
+            )
+            k = (
+                np.floor((z - self.grid_bucket_origin[1]) / self.grid_bucket_size)
+                - self.grid_bucket_index_min[1]
+            )
+            # points outside the bucket grid have no bucket
+            in_grid = (
+                (0 <= i)
+                & (i < self.grid_bucket_shape[0])
+                & (0 <= k)
+                & (k < self.grid_bucket_shape[1])
+            )
+            bucket = (
+                i[in_grid].astype(int) * self.grid_bucket_shape[1]
+                + k[in_grid].astype(int)
+            )
+            bucket_start[in_grid] = self.grid_bucket_indptr[bucket]
+            num_bucket_grids[in_grid] = self.grid_bucket_indptr[bucket + 1] - (
+                bucket_start[in_grid]
+            )
+        # gather grids of each bucket, i.e. position of pair within its bucket added to start of bucket
+        point_index = np.repeat(np.arange(num_point), num_bucket_grids)
+        position = np.arange(len(point_index)) - np.repeat(
+            np.cumsum(num_bucket_grids) - num_bucket_grids, num_bucket_grids
+        )
+        grid = self.grid_bucket_indices[
+            np.repeat(bucket_start, num_bucket_grids) + position
+        ]
+        # grids without bounding box are candidates of all points
+        unbounded = np.array(self.grid_unbounded_list, dtype=int)
+        return (
+            np.concatenate([point_index, np.repeat(np.arange(num_point), len(unbounded))]),
+            np.concatenate([grid, np.tile(unbounded, num_point)]),
+        )
+
+    def get_candidate_grids_along_line(
+        self, x1: float, z1: float, x2: float, z2: float
+    ) -> list:
+        """
+        Function to get grids which may intersect the line segment between points (x1, z1) and (x2, z2). The function
+        walks the buckets of the spatial index of grids crossed by the line segment, from the start point to the end
+        point.
+
+        :returns: list of grid numbers, in order of grid_number_dict
+        """
+        size = self.grid_bucket_size
+        # line in bucket units, padded for points lying on bucket edges
+        pad = 10 ** (-self.decimal_lim)
+        u1 = (x1 - self.grid_bucket_origin[0]) / size
+        u2 = (x2 - self.grid_bucket_origin[0]) / size
+        v1 = (z1 - self.grid_bucket_origin[1]) / size
+        v2 = (z2 - self.grid_bucket_origin[1]) / size
+        candidate_grids = set(self.grid_unbounded_list)
+        # walk each column of buckets crossed by line, get range of rows crossed by line within the column
+        for i in range(
+            int(np.floor(min(u1, u2) - pad)), int(np.floor(max(u1, u2) + pad)) + 1
+        ):
+            if u1 == u2:  # line parallel to bucket column
+                v_start, v_end = v1, v2
+            else:
+                # clip line to column i <= u <= i + 1
+                t_start = min(max((i - u1) / (u2 - u1), 0), 1)
+                t_end = min(max((i + 1 - u1) / (u2 - u1), 0), 1)
+                v_start = v1 + t_start * (v2 - v1)
+                v_end = v1 + t_end * (v2 - v1)
+            for k in range(
+                int(np.floor(min(v_start, v_end) - pad)),
+                int(np.floor(max(v_start, v_end) + pad)) + 1,
+            ):
+                candidate_grids.update(self.grid_bucket_dict.get((i, k), []))
+        return sorted(candidate_grids)
+
+    def compact_mesh_storage(self):
+        """
+        Function to convert the node and element storage of the mesh to NumPy arrays once meshing procedures are
+        complete. Nodes are stored as a coordinate array (N,3) with group arrays (N,), elements as connectivity arrays
+        (M,5) of [tag, node i, node j, group, transform tag]. ``node_spec`` and the element lists (e.g. ``long_ele``)
+        are replaced with read-only views of the arrays, so existing callers are unchanged.
+        """
+        if isinstance(self.node_spec, NodeSpecView):
+            return  # already compact
+        node_list = list(self.node_spec.values())
+        self.node_tag_array = np.array([node["tag"] for node in node_list], dtype=int)
+        self.node_coordinate_array = np.array(
+            [node["coordinate"] for node in node_list], dtype=float
+        ).reshape(-1, 3)
+        # group of nodes created for offsets (e.g. offset beams, supports) are str, stored separately with -1 in array
+        self.node_group_label_dict = {"x_group": dict(), "z_group": dict()}
+        for group, label_dict in self.node_group_label_dict.items():
+            label_dict.update(
+                {
+                    node["tag"]: node[group]
+                    for node in node_list
+                    if isinstance(node[group], str)
+                }
+            )
+        self.node_x_group_array = np.array(
+            [
+                -1 if isinstance(node["x_group"], str) else node["x_group"]
+                for node in node_list
+            ],
+            dtype=int,
+        )
+        self.node_z_group_array = np.array(
+            [
+                -1 if isinstance(node["z_group"], str) else node["z_group"]
+                for node in node_list
+            ],
+            dtype=int,
+        )
+        self.node_tag_to_row = {
+            tag: row for row, tag in enumerate(self.node_tag_array.tolist())
+        }
+        self.node_spec = NodeSpecView(self)
+        # element connectivity arrays, key: element kind
+        for kind, attribute in self.ele_attribute_dict.items():
+            self.ele_connectivity_dict[kind] = np.array(
+                [list(ele) for ele in getattr(self, attribute)], dtype=int
+            ).reshape(-1, 5)
+            setattr(self, attribute, ElementListView(self, kind))
+
+    def add_node(self, tag: int, coordinate: list, x_group: int, z_group):
+        """
+        Function to add a node to the compact node storage of the mesh, e.g. for nodes of spring supports created
+        after meshing.
+
+        :param tag: Node tag
+        :param coordinate: list of [x, y, z] coordinate of node
+        :param x_group: x group of node
+        :param z_group: z group of node
+        """
+        if tag in self.node_tag_to_row:
+            return  # node exist, same as setdefault of node_spec dict
+        self.node_tag_to_row[tag] = len(self.node_tag_array)
+        self.node_tag_array = np.append(self.node_tag_array, tag)
+        self.node_coordinate_array = np.vstack(
+            [self.node_coordinate_array, np.array(coordinate, dtype=float)]
+        )
+        if isinstance(x_group, str):
+            self.node_group_label_dict["x_group"][tag] = x_group
+            x_group = -1
+        if isinstance(z_group, str):
+            self.node_group_label_dict["z_group"][tag] = z_group
+            z_group = -1
+        self.node_x_group_array = np.append(self.node_x_group_array, x_group)
+        self.node_z_group_array = np.append(self.node_z_group_array, z_group)
+
+    def get_node_coordinates(self, node_tags: list) -> np.ndarray:
+        """
+        Function to get coordinates of nodes from the compact node storage.
+
+        :param node_tags: list of node tags
+        :returns: Array of node coordinates (k, 3), each row is [x, y, z]
+        """
+        rows = [self.node_tag_to_row[tag] for tag in node_tags]
+        return self.node_coordinate_array[rows]
+
+    def get_node_adjacency_matrix(self):
+        """
+        Function to get the adjacency matrix of nodes connected by elements, rigid links or grids (e.g. shell elements)
+        of the mesh.
+
+        :returns: Sparse matrix (N,N) where row and column are the rows of node arrays (see compact_mesh_storage())
+        """
+        node_pair_list = [ele[:, 1:3] for ele in self.ele_connectivity_dict.values()]
+        # rigid links
+        node_pair_list.append(
+            np.array(
+                [link_command.args[1:3] for link_command in self.link_str_list],
+                dtype=int,
+            ).reshape(-1, 2)
+        )
+        node_pair_list.append(
+            np.array(
+                [
+                    [c_node, r_node]
+                    for c_node, r_node_list in getattr(self, "link_dict", {}).items()
+                    for r_node in r_node_list
+                ],
+                dtype=int,
+            ).reshape(-1, 2)
+        )
+        # nodes of grids
+        node_pair_list.append(
+            np.array(
+                [
+                    node_pair
+                    for grid_nodes in self.grid_number_dict.values()
+                    for node_pair in combinations(
+                        [node for node in grid_nodes if node != []], 2
+                    )
+                ],
+                dtype=int,
+            ).reshape(-1, 2)
+        )
+        node_pair = np.vstack(node_pair_list)
+        num_node = len(self.node_tag_array)
+        rows = np.array(
+            [self.node_tag_to_row[tag] for tag in node_pair.ravel().tolist()],
+            dtype=int,
+        ).reshape(-1, 2)
+        adjacency = coo_matrix(
+            (np.ones(len(rows)), (rows[:, 0], rows[:, 1])), shape=(num_node, num_node)
+        )
+        return (adjacency + adjacency.T).tocsr()
+
+    def get_node_bandwidth(self, ordering: np.ndarray = None) -> int:
+        """
+        Function to get the bandwidth (maximum difference of numbering between connected nodes) of the mesh.
+
+        :param ordering: Array of rows of node arrays in order of numbering. Default None, i.e. numbering in order of
+                         node tags
+        :returns: bandwidth of node numbering
+        """
+        adjacency = self.get_node_adjacency_matrix().tocoo()
+        num_node = adjacency.shape[0]
+        if ordering is None:
+            ordering = np.arange(num_node)
+        number = np.empty(num_node, dtype=int)
+        number[ordering] = np.arange(num_node)  # number of each node row
+        if adjacency.nnz == 0:
+            return 0
+        return int(np.max(np.abs(number[adjacency.row] - number[adjacency.col])))
+
+    def get_rcm_ordering(self) -> np.ndarray:
+        """
+        Function to get the reverse Cuthill-McKee ordering of nodes, which minimises the bandwidth of node numbering.
+
+        :returns: Array of rows of node arrays in order of numbering
+        """
+        return reverse_cuthill_mckee(
+            self.get_node_adjacency_matrix(), symmetric_mode=True
+        )
 
     def create_control_points(self, **kwargs):
         # base version creating standard node points of control points - either start or end edge -
@@ -401,24 +876,20 @@ class Mesh:
 
     # main meshing algorithms (straight mesh)
     def _fixed_sweep_node_meshing(self):
-        assigned_node_tag = []
-        previous_node_tag = []
-
-        # begin creating nodes, assigning long members / stitch slab long elements between nodes
-        for x_count, x_inc in enumerate(self.nox):
-            # store x_group based on span group
-            span_group_key = [
-                i
-                for i, point_x in enumerate(self.mesh_edge_x_positions[1:])
-                if x_inc <= point_x
-            ][0]
-            x_group_list = self.span_group_to_x_groups[span_group_key]
-            x_group_list.append(x_count)
-
-            # create nodes and store in node spec
-            for z_count, ref_point in enumerate(self.sweeping_nodes):
-                # offset x and y in all points in ref points
-                z_inc = np.round(
+        # nodes of the straight sweep mesh are an outer sum of the sweep nodes (z) and the x increments (x), arrays
+        # below are arranged as row = x group (x count), column = z group (z count)
+        num_x = len(self.nox)
+        num_z = len(self.sweeping_nodes)
+        nox = np.array(self.nox, dtype=float)
+        sweep_coordinate = np.array(self.sweeping_nodes, dtype=float).reshape(-1, 3)
+        # span group of each x increment, first span whose end position is greater or equal to x increment
+        span_group_keys = np.searchsorted(
+            self.mesh_edge_x_positions[1:], nox, side="left"
+        ).tolist()
+        # offset z of sweep path at each x increment
+        z_inc = np.array(
+            [
+                np.round(
                     select_segment_function(
                         curve_flag=self.curve,
                         d=self.d,
@@ -429,144 +900,88 @@ class Mesh:
                     ),
                     self.decimal_lim,
                 )
-                node_coordinate = [
-                    ref_point[0] + x_inc,
-                    ref_point[1],
-                    ref_point[2] + z_inc,
-                ]
+                for x_inc in self.nox
+            ],
+            dtype=float,
+        )
+        node_x = (sweep_coordinate[:, 0] + nox[:, None]).tolist()
+        node_z = (sweep_coordinate[:, 2] + z_inc[:, None]).tolist()
+        node_y = [ref_point[1] for ref_point in self.sweeping_nodes]  # model plane
+        # assign node tags in bulk and store in node spec
+        node_tag = self.node_counter + np.arange(num_x * num_z).reshape(num_x, num_z)
+        self.node_counter += num_x * num_z
+        node_tag_list = node_tag.tolist()
+        for x_count in range(num_x):
+            for z_count, tag in enumerate(node_tag_list[x_count]):
                 self.node_spec.setdefault(
-                    self.node_counter,
+                    tag,
                     {
-                        "tag": self.node_counter,
-                        "coordinate": node_coordinate,
+                        "tag": tag,
+                        "coordinate": [
+                            node_x[x_count][z_count],
+                            node_y[z_count],
+                            node_z[x_count][z_count],
+                        ],
                         "x_group": x_count,
                         "z_group": z_count,
                     },
                 )
-                assigned_node_tag.append(self.node_counter)
-                self.node_counter += 1
-                # link transverse elements
-                if z_count > 0:
-                    # element list [element tag, node i, node j, x/z group]
-                    if not self.beam_element_flag:
-                        continue
-                    tag = self._get_geo_transform_tag(
-                        [assigned_node_tag[z_count - 1], assigned_node_tag[z_count]]
-                    )
+        # node pairs [node i, node j] of transverse elements (along z) and longitudinal elements (along x)
+        trans_node_pair = np.stack(
+            [node_tag[:, :-1], node_tag[:, 1:]], axis=-1
+        ).tolist()
+        long_node_pair = np.stack([node_tag[:-1], node_tag[1:]], axis=-1).tolist()
+
+        # assign elements, x step by x step for element tags to follow transverse then longitudinal members of step
+        for x_count, x_inc in enumerate(self.nox):
+            span_group_key = span_group_keys[x_count]
+            self.span_group_to_x_groups[span_group_key].append(x_count)
+            # link transverse elements - element list [element tag, node i, node j, x/z group, transform tag]
+            if self.beam_element_flag:
+                for node_i, node_j in trans_node_pair[x_count]:
+                    tag = self._get_geo_transform_tag([node_i, node_j])
                     self.trans_ele.append(
-                        [
-                            self.element_counter,
-                            assigned_node_tag[z_count - 1],
-                            assigned_node_tag[z_count],
-                            x_count,
-                            tag,
-                        ]
+                        [self.element_counter, node_i, node_j, x_count, tag]
                     )
-                    self._store_ele_tag_respect_to_mesh_group(
-                        counter=self.element_counter, span_group=span_group_key
+                    self.span_group_to_ele_tag[span_group_key].append(
+                        self.element_counter
                     )
                     self.element_counter += 1
 
-            # create longitudinal ele by linking assigned nodes @ current step with assigned nodes from previous step
             if x_count == 0:
-                previous_node_tag = assigned_node_tag
                 # record all nodes in first x count as support - edge count 0
-                for nodes in previous_node_tag:
+                for nodes in node_tag_list[x_count]:
                     self.edge_node_recorder.setdefault(nodes, self.global_edge_count)
                 self.global_edge_count += 1
-            elif x_count > 0:
-                # create longitudinal elements
-
-                for previous_node in previous_node_tag:
-                    for current_node in assigned_node_tag:
-                        current_z_group = self.node_spec[current_node]["z_group"]
-                        previous_z_group = self.node_spec[previous_node]["z_group"]
-                        current_x_group = self.node_spec[current_node]["x_group"]
-                        previous_x_group = self.node_spec[previous_node]["x_group"]
-                        # check for non-continuous, if elements are between two support points,
-                        # either: (1) do not assign long ele or (2) assign a connector beam element to represent
-                        # some form of continuity e.g. stitch slabs
-                        previous_x_span_group = [
-                            key
-                            for key, value in self.span_group_to_x_groups.items()
-                            if previous_x_group in value
-                        ][0]
-                        current_x_span_group = [
-                            key
-                            for key, value in self.span_group_to_x_groups.items()
-                            if current_x_group in value
-                        ][0]
-
-                        if current_z_group == previous_z_group:
-                            tag = self._get_geo_transform_tag(
-                                [previous_node, current_node]
-                            )
-                            if not previous_x_span_group == current_x_span_group:
-                                # current step is in between two span groups
-                                # check to either create
-                                if (
-                                    not self.continuous
-                                    and self.stitch_element_spacing_x
-                                ):
-                                    # create beam element between supports
-                                    x_start = self.node_spec[current_node][
-                                        "coordinate"
-                                    ][0]
-                                    x_end = self.node_spec[previous_node]["coordinate"][
-                                        0
-                                    ]
-
-                                    self.connect_ele.append(
-                                        [
-                                            self.element_counter,
-                                            previous_node,
-                                            current_node,
-                                            current_z_group,
-                                            tag,
-                                        ]
-                                    )
-                                else:
-                                    self.long_ele.append(
-                                        [
-                                            self.element_counter,
-                                            previous_node,
-                                            current_node,
-                                            current_z_group,
-                                            tag,
-                                        ]
-                                    )
-
-                            else:
-                                self.long_ele.append(
-                                    [
-                                        self.element_counter,
-                                        previous_node,
-                                        current_node,
-                                        current_z_group,
-                                        tag,
-                                    ]
-                                )
-
-                            self._store_ele_tag_respect_to_mesh_group(
-                                counter=self.element_counter,
-                                span_group=current_x_span_group,
-                            )
-
-                            self.element_counter += 1
-                            break  # break assign long ele loop (cur node)
-                # here updates the record for previous node tag step
-                previous_node_tag = assigned_node_tag
-                if (
-                    x_inc in self.support_points
-                ):  # if x inc is a support roll (intermediate) set all nodes as support
-                    for nodes in previous_node_tag:
-                        self.edge_node_recorder.setdefault(
-                            nodes, self.global_edge_count
-                        )
-                    self.global_edge_count += 1
-            # reset counter and recorder for next loop x increment
-            self.global_x_grid_count += 1
-            assigned_node_tag = []
+                continue
+            # create longitudinal elements by linking nodes @ current step with nodes of same z group @ previous step
+            # check for non-continuous, if elements are between two support points, either: (1) do not assign
+            # long ele or (2) assign a connector beam element to represent some form of continuity e.g. stitch slabs
+            if (
+                span_group_keys[x_count - 1] != span_group_key
+                and not self.continuous
+                and self.stitch_element_spacing_x
+            ):
+                ele_list = self.connect_ele
+            else:
+                ele_list = self.long_ele
+            for z_count, (previous_node, current_node) in enumerate(
+                long_node_pair[x_count - 1]
+            ):
+                tag = self._get_geo_transform_tag([previous_node, current_node])
+                ele_list.append(
+                    [self.element_counter, previous_node, current_node, z_count, tag]
+                )
+                self.span_group_to_ele_tag[span_group_key].append(self.element_counter)
+                self.element_counter += 1
+            if (
+                x_inc in self.support_points
+            ):  # if x inc is a support roll (intermediate) set all nodes as support
+                for nodes in node_tag_list[x_count]:
+                    self.edge_node_recorder.setdefault(nodes, self.global_edge_count)
+                self.global_edge_count += 1
+        # update counter for next meshing step
+        self.global_x_grid_count += num_x
 
     def _store_ele_tag_respect_to_mesh_group(self, counter: int, span_group: int):
         ele_tag_list = self.span_group_to_ele_tag[span_group]
@@ -580,7 +995,9 @@ class Mesh:
         exist_node = None
         self.assigned_node_tag.append(self.node_counter)
         assigned_node = self.node_counter
-        if not node_coordinate in self.assigned_node_coord_dict.values():
+        # look up coordinate in dict of assigned coordinates (hashed tuple of coordinate)
+        coordinate_key = tuple(node_coordinate)
+        if coordinate_key not in self.assigned_coord_to_node_dict:
             self.node_spec.setdefault(
                 self.node_counter,
                 {
@@ -592,13 +1009,10 @@ class Mesh:
             )
 
             self.assigned_node_coord_dict[self.node_counter] = node_coordinate
+            self.assigned_coord_to_node_dict[coordinate_key] = self.node_counter
             self.node_counter += 1
         else:
-            exist_node = [
-                i
-                for i in self.assigned_node_coord_dict
-                if self.assigned_node_coord_dict[i] == node_coordinate
-            ][0]
+            exist_node = self.assigned_coord_to_node_dict[coordinate_key]
 
         return exist_node, assigned_node
 
@@ -670,11 +1084,10 @@ class Mesh:
             else:  # perform edge meshing with variable distance between transverse members by looping through all control
                 # points of edgecontrolline
                 # loop for each control point of edge line with sweep nodes
+                # search points on sweep path line whose normal intersects each control point of edge line
+                ref_point_list = self._search_x_points(start_edge_line.node_list)
                 for z_count, int_point in enumerate(start_edge_line.node_list):
-                    # search point on sweep path line whose normal intersects int_point.
-                    ref_point_x, ref_point_z = self._search_x_point(
-                        int_point,
-                    )
+                    ref_point_x, ref_point_z = ref_point_list[z_count]
                     # record points
                     self.sweep_path_points.append(
                         [ref_point_x, self.y_elevation, ref_point_z]
@@ -861,11 +1274,10 @@ class Mesh:
                 self.global_x_grid_count += 1
                 self.global_edge_count += 1
             else:
+                # search points on sweep path line whose normal intersects each control point of edge line
+                ref_point_list = self._search_x_points(end_edge_line.node_list)
                 for z_count, int_point in enumerate(end_edge_line.node_list):
-                    # search point on sweep path line whose normal intersects int_point.
-                    ref_point_x, ref_point_z = self._search_x_point(
-                        int_point,
-                    )
+                    ref_point_x, ref_point_z = ref_point_list[z_count]
                     # record points
                     self.sweep_path_points.append(
                         [ref_point_x, self.y_elevation, ref_point_z]
@@ -1153,11 +1565,9 @@ class Mesh:
         # user mp constraint object
         # function to create ops rigid link command and store to variable
 
-        link_str = 'ops.rigidLink("{linktype}",{rNodetag},{cNodetag})\n'.format(
-            linktype=self.link_type, rNodetag=cNode, cNodetag=rNode
-        )
+        link_command = OpsCommand("rigidLink", (self.link_type, cNode, rNode))
 
-        self.link_str_list.append(link_str)
+        self.link_str_list.append(link_command)
 
     # ------------------------------------------------------------------------------------------
     def _identify_common_z_group(self):
@@ -1197,58 +1607,15 @@ class Mesh:
         :return: Set variable `group_ele_dict` according to
         """
 
+        # node incidence table, key: node tag, val: dict of element kind ("long", "trans", "edge") to list of indices of
+        # incident elements. Also get absolute [dx, dy, dz] of all elements as arrays
+        self._create_node_incidence()
         # dict node tag to width in z direction , and neighbouring node
         self.node_width_z_dict = dict()
         self.node_connect_z_dict = dict()
-        for ele in self.long_ele:
-            d1 = []  # d for distance
-            d2 = []
-            p1 = []
-            p2 = []
-            n1 = [
-                trans_ele
-                for trans_ele in self.trans_ele
-                if trans_ele[1] == ele[1] or trans_ele[2] == ele[1]
-            ]
-            n2 = [
-                trans_ele
-                for trans_ele in self.trans_ele
-                if trans_ele[1] == ele[2] or trans_ele[2] == ele[2]
-            ]
-            for item in n1:
-                d1.append(
-                    [
-                        np.abs(a - b)
-                        for (a, b) in zip(
-                            self.node_spec[item[1]]["coordinate"],
-                            self.node_spec[item[2]]["coordinate"],
-                        )
-                    ]
-                )
-                if item[1] != ele[1] and item[1] != ele[2]:
-                    p1.append(item[1])
-                if item[2] != ele[1] and item[2] != ele[2]:
-                    p1.append(item[2])
-
-            for item in n2:
-                d2.append(
-                    [
-                        np.abs(a - b)
-                        for (a, b) in zip(
-                            self.node_spec[item[1]]["coordinate"],
-                            self.node_spec[item[2]]["coordinate"],
-                        )
-                    ]
-                )
-                if item[1] != ele[1] and item[1] != ele[2]:
-                    p2.append(item[1])
-                if item[2] != ele[1] and item[2] != ele[2]:
-                    p2.append(item[2])
-            # list, [ele tag, ele width (left and right)]
-            self.node_width_z_dict.setdefault(ele[1], d1)
-            self.node_width_z_dict.setdefault(ele[2], d2)
-            self.node_connect_z_dict.setdefault(ele[1], p1)
-            self.node_connect_z_dict.setdefault(ele[2], p2)
+        self._set_node_width_and_connect(
+            self.long_ele, "trans", self.node_width_z_dict, self.node_connect_z_dict
+        )
 
         # dict z to long ele
         self.z_group_to_ele = dict()
@@ -1273,105 +1640,30 @@ class Mesh:
         # dict node tag to width in x direction
         self.node_width_x_dict = dict()
         self.node_connect_x_dict = dict()
-        for ele in self.trans_ele:
-            d1 = []
-            d2 = []
-            p1 = []
-            p2 = []
-            n1 = [
-                long_ele
-                for long_ele in self.long_ele
-                if long_ele[1] == ele[1] or long_ele[2] == ele[1]
-            ]
-            n2 = [
-                long_ele
-                for long_ele in self.long_ele
-                if long_ele[1] == ele[2] or long_ele[2] == ele[2]
-            ]
-            for item in n1:
-                d1.append(
-                    [
-                        np.abs(a - b)
-                        for (a, b) in zip(
-                            self.node_spec[item[1]]["coordinate"],
-                            self.node_spec[item[2]]["coordinate"],
-                        )
-                    ]
-                )
-                if item[1] != ele[1] and item[1] != ele[2]:
-                    p1.append(item[1])
-                if item[2] != ele[1] and item[2] != ele[2]:
-                    p1.append(item[2])
-            for item in n2:
-                d2.append(
-                    [
-                        np.abs(a - b)
-                        for (a, b) in zip(
-                            self.node_spec[item[1]]["coordinate"],
-                            self.node_spec[item[2]]["coordinate"],
-                        )
-                    ]
-                )
-                if item[1] != ele[1] and item[1] != ele[2]:
-                    p2.append(item[1])
-                if item[2] != ele[1] and item[2] != ele[2]:
-                    p2.append(item[2])
-            # list, [ele tag, ele width (left and right)]
-            self.node_width_x_dict.setdefault(ele[1], d1)
-            self.node_width_x_dict.setdefault(ele[2], d2)
-            self.node_connect_x_dict.setdefault(ele[1], p1)
-            self.node_connect_x_dict.setdefault(ele[2], p2)
-
-        for ele in self.edge_span_ele:
-            d1 = []
-            d2 = []
-            p1 = []
-            p2 = []
-            n1 = [
-                long_ele
-                for long_ele in self.long_ele
-                if long_ele[1] == ele[1] or long_ele[2] == ele[1]
-            ]
-            n2 = [
-                long_ele
-                for long_ele in self.long_ele
-                if long_ele[1] == ele[2] or long_ele[2] == ele[2]
-            ]
-            for item in n1:
-                d1.append(
-                    [
-                        np.abs(a - b)
-                        for (a, b) in zip(
-                            self.node_spec[item[1]]["coordinate"],
-                            self.node_spec[item[2]]["coordinate"],
-                        )
-                    ]
-                )
-                if item[1] != ele[1] and item[1] != ele[2]:
-                    p1.append(item[1])
-                if item[2] != ele[1] and item[2] != ele[2]:
-                    p1.append(item[2])
-            for item in n2:
-                d2.append(
-                    [
-                        np.abs(a - b)
-                        for (a, b) in zip(
-                            self.node_spec[item[1]]["coordinate"],
-                            self.node_spec[item[2]]["coordinate"],
-                        )
-                    ]
-                )
-                if item[1] != ele[1] and item[1] != ele[2]:
-                    p2.append(item[1])
-                if item[2] != ele[1] and item[2] != ele[2]:
-                    p2.append(item[2])
-            # list, [ele tag, ele width (left and right)]
-            self.node_width_x_dict.setdefault(ele[1], d1)
-            self.node_width_x_dict.setdefault(ele[2], d2)
-            self.node_connect_x_dict.setdefault(ele[1], p1)
-            self.node_connect_x_dict.setdefault(ele[2], p2)
+        for ele_list in [self.trans_ele, self.edge_span_ele]:
+            self._set_node_width_and_connect(
+                ele_list, "long", self.node_width_x_dict, self.node_connect_x_dict
+            )
+        # unit width (in x direction) of nodes for unit width members, average length of first two incident long
+        # elements. None if node has no incident long element
+        self.node_unit_width_x_dict = dict()
+        for node, width in self.node_width_x_dict.items():
+            length = np.sqrt(width[:, 0] ** 2 + width[:, 1] ** 2 + width[:, 2] ** 2)
+            self.node_unit_width_x_dict[node] = (
+                np.sum(length[:2]) / 2 if len(length) > 0 else None
+            )
         # create self.grid_number_dict, dict key = grid number, val = long and trans ele in grid
         self.grid_number_dict = dict()
+        # index of node tag given x and z group of node, for first node (in node_spec) of each x and z group pair
+        self.node_group_to_tag = dict()
+        for node in self.node_spec.values():
+            self.node_group_to_tag.setdefault(
+                (node["x_group"], node["z_group"]), node["tag"]
+            )
+        grid_key_list = []  # canonical key of each grid - frozenset of grid nodes
+        self.node_to_grids = (
+            dict()
+        )  # key: node tag, val: set of grid numbers containing the node
         counter = 0
         for node_tag in self.node_spec.keys():
             # get the surrounding nodes
@@ -1382,101 +1674,139 @@ class Mesh:
                 for z_node in z_vicinity_nodes:
                     zg = self.node_spec[z_node]["z_group"]
                     # find the 3rd bounding node
-                    n3 = [
-                        n["tag"]
-                        for n in self.node_spec.values()
-                        if n["x_group"] == xg and n["z_group"] == zg
-                    ]
-                    if n3:
-                        n3 = n3[0]
-                        if not any(
-                            [
-                                node_tag in d
-                                and x_node in d
-                                and z_node in d
-                                and n3 in d
-                                for d in self.grid_number_dict.values()
-                            ]
-                        ):
-                            self.grid_number_dict.setdefault(
-                                counter, [node_tag, x_node, n3, z_node]
-                            )
-                            counter += 1
-                    else:  # list is empty
-                        if not any(
-                            [
-                                node_tag in d and x_node in d and z_node in d
-                                for d in self.grid_number_dict.values()
-                            ]
-                        ):
-                            self.grid_number_dict.setdefault(
-                                counter, [node_tag, x_node, n3, z_node]
-                            )
-                            counter += 1
+                    n3 = self.node_group_to_tag.get((xg, zg), [])
+                    if n3 != []:
+                        grid_nodes = {node_tag, x_node, n3, z_node}
+                    else:  # no node, grid with three nodes
+                        grid_nodes = {node_tag, x_node, z_node}
+                    # skip grid if its nodes are within an existing grid, only grids containing node_tag are checked
+                    if any(
+                        [
+                            grid_nodes <= grid_key_list[grid]
+                            for grid in self.node_to_grids.get(node_tag, [])
+                        ]
+                    ):
+                        continue
+                    self.grid_number_dict.setdefault(
+                        counter, [node_tag, x_node, n3, z_node]
+                    )
+                    grid_key_list.append(frozenset(grid_nodes))
+                    for node in grid_nodes:
+                        self.node_to_grids.setdefault(node, set()).add(counter)
+                    counter += 1
 
         # dict of grid number return vicinity grid number in a subdict {'x-1': 'x+1', 'z-1' , 'z+1'}
         self.grid_vicinity_dict = dict()
         for k, grid in self.grid_number_dict.items():
-            current_x_group = []
-            current_z_group = []
-            current_x = []
-            current_z = []
-
-            grid_number_record = []
             if [] in grid:
                 grid.remove([])
-            for node in grid:
-                grid_number_record += [
-                    i
-                    for i, x in enumerate(
-                        [node in n for n in self.grid_number_dict.values()]
-                    )
-                    if x
-                ]
-                current_x_group.append(self.node_spec[node]["x_group"])
-                current_z_group.append(self.node_spec[node]["z_group"])
-                current_x.append(self.node_spec[node]["coordinate"][0])
-                current_z.append(self.node_spec[node]["coordinate"][2])
-            current_x_group = list(np.unique(current_x_group))
-            current_z_group = list(np.unique(current_z_group))
-            current_x = list(np.unique(current_x))
-            current_z = list(np.unique(current_z))
-            grid_number_record = np.unique(grid_number_record)
+            current_x_group = {self.node_spec[node]["x_group"] for node in grid}
+            current_z_group = {self.node_spec[node]["z_group"] for node in grid}
+            current_x = [self.node_spec[node]["coordinate"][0] for node in grid]
+            current_z = [self.node_spec[node]["coordinate"][2] for node in grid]
+            # grids sharing at least one node with current grid, from node to grid index
+            grid_number_record = sorted(
+                set().union(*[self.node_to_grids[node] for node in grid])
+            )
             # loop to characterize the grid for current
             subdict = {}
             for neighbour in grid_number_record:
                 if neighbour == k:  # identical , current grid
                     continue
-                x_group = []  # initialize variables
-                x_coor = []
-                z_group = []
-                z_coor = []
-                # loop each node in the vicintiy grids
-                for nodes in self.grid_number_dict[neighbour]:
-                    if not nodes:
-                        continue
-                    x_group.append(self.node_spec[nodes]["x_group"])
-                    z_group.append(self.node_spec[nodes]["z_group"])
-                    x_coor.append(self.node_spec[nodes]["coordinate"][0])
-                    z_coor.append(self.node_spec[nodes]["coordinate"][2])
-                x_group = list(np.unique(x_group))
-                z_group = list(np.unique(z_group))
-                x_coor = list(np.unique(x_coor))
-                z_coor = list(np.unique(z_coor))
+                # nodes in the vicintiy grids
+                neighbour_nodes = [
+                    nodes for nodes in self.grid_number_dict[neighbour] if nodes
+                ]
+                x_group = {
+                    self.node_spec[nodes]["x_group"] for nodes in neighbour_nodes
+                }
+                z_group = {
+                    self.node_spec[nodes]["z_group"] for nodes in neighbour_nodes
+                }
+                x_coor = [
+                    self.node_spec[nodes]["coordinate"][0] for nodes in neighbour_nodes
+                ]
+                z_coor = [
+                    self.node_spec[nodes]["coordinate"][2] for nodes in neighbour_nodes
+                ]
                 # if x groups are identical, neighbour grid is either top or bottom of the element
-                if all(a in current_x_group for a in x_group):
+                if x_group <= current_x_group:
                     # compare z max
                     if max(z_coor) > max(current_z):
                         subdict["top"] = neighbour
                     else:
                         subdict["bottom"] = neighbour
                 # if x groups are identical, neighbour grid is either left or right of the element
-                if all(a in current_z_group for a in z_group):
+                if z_group <= current_z_group:
                     if max(x_coor) > max(current_x):
                         subdict["right"] = neighbour
                     else:
                         subdict["left"] = neighbour
             self.grid_vicinity_dict.setdefault(k, subdict)
+        # index elements by their nodes
+        self._create_node_pair_element_index()
+
+    def _create_node_incidence(self):
+        # create node incidence table and arrays of absolute [dx, dy, dz] of elements for each element kind
+        self.node_incidence_dict = dict()
+        self.ele_abs_delta = dict()
+        for element_kind, ele_list in [
+            ("long", self.long_ele),
+            ("trans", self.trans_ele),
+            ("edge", self.edge_span_ele),
+        ]:
+            for index, ele in enumerate(ele_list):
+                for node in set(ele[1:3]):
+                    self.node_incidence_dict.setdefault(
+                        node, {"long": [], "trans": [], "edge": []}
+                    )[element_kind].append(index)
+            coord_i = np.array(
+                [self.node_spec[ele[1]]["coordinate"] for ele in ele_list], dtype=float
+            ).reshape(-1, 3)
+            coord_j = np.array(
+                [self.node_spec[ele[2]]["coordinate"] for ele in ele_list], dtype=float
+            ).reshape(-1, 3)
+            self.ele_abs_delta[element_kind] = np.abs(coord_i - coord_j)
+
+    def _set_node_width_and_connect(
+        self, ele_list: list, incident_kind: str, width_dict: dict, connect_dict: dict
+    ):
+        # for the two nodes of each element in ele_list, set the absolute [dx, dy, dz] of incident elements of
+        # incident_kind (array of width) and the nodes connected by the incident elements, not including the two nodes
+        incident_ele_list = {
+            "long": self.long_ele,
+            "trans": self.trans_ele,
+            "edge": self.edge_span_ele,
+        }[incident_kind]
+        for ele in ele_list:
+            for node in ele[1:3]:
+                if node in width_dict:
+                    continue  # width and connected nodes already set
+                incident_index = self.node_incidence_dict.get(node, {}).get(
+                    incident_kind, []
+                )
+                width_dict[node] = self.ele_abs_delta[incident_kind][incident_index]
+                connect_dict[node] = [
+                    item[count]
+                    for item in [incident_ele_list[index] for index in incident_index]
+                    for count in [1, 2]
+                    if item[count] != ele[1] and item[count] != ele[2]
+                ]
+
+    def _create_node_pair_element_index(self):
+        # create dict of node pair to element, where key is frozenset of element node i and j, and val is a tuple of
+        # (element kind, index of element). Element kind is "long", "trans" or "edge" for elements in self.long_ele,
+        # self.trans_ele and self.edge_span_ele respectively.
+        self.node_pair_to_element = dict()
+        for element_kind, ele_list in [
+            ("long", self.long_ele),
+            ("trans", self.trans_ele),
+            ("edge", self.edge_span_ele),
+        ]:
+            for index, ele in enumerate(ele_list):
+                self.node_pair_to_element.setdefault(
+                    frozenset(ele[1:3]), (element_kind, index)
+                )
 
     def _get_geo_transform_tag(self, ele_nodes: list, offset=None):
         # offset is not used in version 0.1.0
@@ -1486,9 +1816,10 @@ class Mesh:
         node_i = self.node_spec[ele_nodes[0]]["coordinate"]
         node_j = self.node_spec[ele_nodes[1]]["coordinate"]
         vxz = self._get_vector_xz(node_i, node_j)
-        vxz = [np.round(num, decimals=self.decimal_lim) for num in vxz]
+        vxz = tuple(float(np.round(num, decimals=self.decimal_lim)) for num in vxz)
         tag_value = self.transform_dict.setdefault(
-            repr(vxz) + "|" + repr(offset), self.transform_counter + 1
+            (vxz, tuple(tuple(float(x) for x in point) for point in offset)),
+            self.transform_counter + 1,
         )
         if tag_value > self.transform_counter:
             self.transform_counter = tag_value
@@ -1616,6 +1947,37 @@ class Mesh:
         return current_sweep_nodes_rotated
 
     def _search_x_point(self, int_point, start_point_y=0, line_function=None):
+        # search point on sweep path whose normal intersects int_point. The point is found by projecting int_point on
+        # the sweep path, snapped to the increment of search_x_inc from int_point closest to the projection - i.e. the
+        # search resolution of the increment search (see _search_x_point_increment())
+        return self._search_x_points([int_point])[0]
+
+    def _search_x_points(self, int_point_list):
+        # vectorised _search_x_point() for a row of points (e.g. control points of an edge line) - projection of all
+        # points on sweep path is computed in one call. Returns list of (x, z) tuples
+        int_points = np.asarray(int_point_list, dtype=float)
+        start_point_x = int_points[:, 0]
+        inc = self.search_x_inc
+        projected_x = np.atleast_1d(
+            self.sweep_path.get_projected_x(start_point_x, int_points[:, 2])
+        )
+        num_inc = np.rint((projected_x - start_point_x) / inc)
+        ref_point_x = start_point_x + num_inc * inc
+        ref_point_list = []
+        for int_point, x, finite in zip(
+            int_point_list, ref_point_x, np.isfinite(projected_x)
+        ):
+            if not finite:
+                # no unique projection (e.g. point at curve center), fall back to increment search
+                ref_point_list.append(self._search_x_point_increment(int_point))
+            else:
+                x = float(x)
+                ref_point_list.append((x, self.sweep_path.get_line_function(x)))
+        return ref_point_list
+
+    def _search_x_point_increment(self, int_point):
+        # increment search of point on sweep path whose normal intersects int_point, by stepping x in increments of
+        # search_x_inc until distance to int_point is minimum
         start_point_x = int_point[0]
         min_found = False
         max_loop = 1000
@@ -1974,6 +2336,22 @@ class SweepPath:
                 x=x,
             )
 
+    def get_projected_x(self, x, z):
+        """
+        Returns the x position of the point on the sweep path closest to the point x, z, i.e. the point on sweep path
+        whose normal intersects point x, z. x and z can be arrays of points.
+        """
+        x = np.asarray(x, dtype=float)
+        z = np.asarray(z, dtype=float)
+        if not self.mesh_radius:
+            # straight line, foot of perpendicular from point to line
+            return (x + self.m * (z - self.c)) / (1 + self.m**2)
+        else:
+            # curve line, point on circle along line from circle center to point
+            h, v = self.curve_center_xz
+            with np.errstate(invalid="ignore", divide="ignore"):
+                return h + np.abs(self.mesh_radius) * (x - h) / np.hypot(x - h, z - v)
+
     def get_tangent_gradient(self, x: float):
         # get the tangent gradient at point x , where point x lies on a circle described by center self.curve_center_xz
         # and radius (self.mesh_radius).
@@ -2178,9 +2556,10 @@ class BeamLinkMesh(Mesh):
                 global_offset_i = [a + b for a, b in zip(node_i, local_offset)]
                 global_offset_j = [a - b for a, b in zip(node_j, local_offset)]
             global_offset = [global_offset_i, global_offset_j]
-        vxz = [np.round(num, decimals=self.decimal_lim) for num in vxz]
+        vxz = tuple(float(np.round(num, decimals=self.decimal_lim)) for num in vxz)
         tag_value = self.transform_dict.setdefault(
-            repr(vxz) + "|" + repr(global_offset), self.transform_counter + 1
+            (vxz, tuple(tuple(float(x) for x in point) for point in global_offset)),
+            self.transform_counter + 1,
         )
         if tag_value > self.transform_counter:
             self.transform_counter = tag_value
@@ -2262,6 +2641,7 @@ class ShellLinkMesh(Mesh):
 
         # meshing procedure to create beam offset element and tie it with rigid links to master nodes of model plane y=0
         self._create_offset_beam_element()
+        self._create_node_pair_element_index()  # update index with offset beam elements
 
         # overwrite procedure to identify
         self._identify_common_z_group()
@@ -2365,95 +2745,55 @@ class ShellLinkMesh(Mesh):
         z_count = "offset_beam_group_z{}"  # proxy
         # get groups of node master pairs
         z_pair = self.start_edge_line.z_group_master_pair_list
-        # loop each z pair
+        # index nodes of model plane by x and z group, and edge nodes by z group
+        group_to_nodes = dict()  # key: (x_group, z_group), val: list of node tags
+        edge_z_group_to_nodes = dict()  # key: z_group, val: list of edge node tags
+        for key, n in self.node_spec.items():
+            group_to_nodes.setdefault((n["x_group"], n["z_group"]), []).append(key)
+            if key in self.edge_node_recorder:
+                edge_z_group_to_nodes.setdefault(n["z_group"], []).append(key)
+        # list of [x group of offset node, beam group, master node 1, master node 2]
+        offset_node_list = []
         # loop each x group
+        # loop each z pair
         for x_group in range(0, self.global_x_grid_count):
             for beam_group, z_pair_group in enumerate(z_pair):
-                n1 = [
-                    key
-                    for key, n in self.node_spec.items()
-                    if n["x_group"] == x_group and n["z_group"] == z_pair_group[0]
-                ]
-                n2 = [
-                    key
-                    for key, n in self.node_spec.items()
-                    if n["x_group"] == x_group and n["z_group"] == z_pair_group[1]
-                ]
-
+                n1 = group_to_nodes.get((x_group, z_pair_group[0]), [])
+                n2 = group_to_nodes.get((x_group, z_pair_group[1]), [])
                 if not len(n1) == 1 or not len(n2) == 1:
                     continue
-                n1_coord = self.node_spec[n1[0]]["coordinate"]
-                n2_coord = self.node_spec[n2[0]]["coordinate"]
-
-                # create offset node
-                mid_pt = [(a + b) / 2 for a, b in zip(n1_coord, n2_coord)]
-                node_coordinate = [mid_pt[0], mid_pt[1] + self.y_offset, mid_pt[2]]
-                self.node_spec.setdefault(
-                    self.node_counter,
-                    {
-                        "tag": self.node_counter,
-                        "coordinate": node_coordinate,
-                        "x_group": x_group,
-                        "z_group": z_count.format(beam_group),
-                    },
-                )
-
-                # store offset node rigid details
-                master_node_list = [n1[0], n2[0]]  # list of list
-                self.link_dict.setdefault(self.node_counter, master_node_list)
-
-                # store node - beam group detail
-                # beam_group = [ind for ind, i in enumerate([self.node_spec in z for z in z_pair]) if i][0]  # numbering of beam group
-                self.offset_node_group_dict.setdefault(
-                    self.node_counter, beam_group
-                )  # c node is key, group num is val
-                self.node_counter += 1
+                offset_node_list.append([x_group, beam_group, n1[0], n2[0]])
 
         # generate for edge nodes - only for orthogonal mesh
         if self.orthogonal:
             for edge_group in range(0, self.global_edge_count):
                 for beam_group, z_pair_group in enumerate(z_pair):
-                    n1 = [
-                        key
-                        for key, n in self.node_spec.items()
-                        if key in self.edge_node_recorder.keys()
-                        and n["z_group"] == z_pair_group[0]
-                    ]
-                    n2 = [
-                        key
-                        for key, n in self.node_spec.items()
-                        if key in self.edge_node_recorder.keys()
-                        and n["z_group"] == z_pair_group[1]
-                    ]
-
+                    n1 = edge_z_group_to_nodes.get(z_pair_group[0], [])
+                    n2 = edge_z_group_to_nodes.get(z_pair_group[1], [])
                     if not len(n1) == 1 or not len(n2) == 1:
                         continue
-                    n1_coord = self.node_spec[n1[0]]["coordinate"]
-                    n2_coord = self.node_spec[n2[0]]["coordinate"]
-
-                    # create offset node
-                    mid_pt = [(a + b) / 2 for a, b in zip(n1_coord, n2_coord)]
-                    node_coordinate = [mid_pt[0], mid_pt[1] + self.y_offset, mid_pt[2]]
-                    self.node_spec.setdefault(
-                        self.node_counter,
-                        {
-                            "tag": self.node_counter,
-                            "coordinate": node_coordinate,
-                            "x_group": x_count,
-                            "z_group": z_count.format(beam_group),
-                        },
-                    )
-
-                    # store offset node rigid details
-                    master_node_list = [n1[0], n2[0]]  # list of list
-                    self.link_dict.setdefault(self.node_counter, master_node_list)
-
-                    # store node - beam group detail
-                    # beam_group = [ind for ind, i in enumerate([self.node_spec in z for z in z_pair]) if i][0]  # numbering of beam group
-                    self.offset_node_group_dict.setdefault(
-                        self.node_counter, beam_group
-                    )  # c node is key, group num is val
-                    self.node_counter += 1
+                    offset_node_list.append([x_count, beam_group, n1[0], n2[0]])
+
+        # create offset nodes at mid point of master nodes
+        for x_group, beam_group, n1, n2 in offset_node_list:
+            n1_coord = self.node_spec[n1]["coordinate"]
+            n2_coord = self.node_spec[n2]["coordinate"]
+            mid_pt = [(a + b) / 2 for a, b in zip(n1_coord, n2_coord)]
+            node_coordinate = [mid_pt[0], mid_pt[1] + self.y_offset, mid_pt[2]]
+            self.node_spec.setdefault(
+                self.node_counter,
+                {
+                    "tag": self.node_counter,
+                    "coordinate": node_coordinate,
+                    "x_group": x_group,
+                    "z_group": z_count.format(beam_group),
+                },
+            )
+            # store offset node rigid details
+            self.link_dict.setdefault(self.node_counter, [n1, n2])
+            # store node - beam group detail, c node is key, group num is val
+            self.offset_node_group_dict.setdefault(self.node_counter, beam_group)
+            self.node_counter += 1
 
 
 class BeamMeshWithSpringSupports(BeamMesh):
@@ -2558,3 +2898,154 @@ class BeamMeshWithSpringSupports(BeamMesh):
 
 # -----------------------------------------------------------------------------------------------------------------
 # concrete classes for mesh elements
+
+
+# -----------------------------------------------------------------------------------------------------------------
+# mesh cache files
+# version of the mesh cache file layout - increment when attributes of mesh classes change, so that cache files of
+# previous layouts are not loaded
+MESH_CACHE_VERSION = 3
+
+# classes which are rebuilt from mesh cache files, no other class is created on loading a cache file
+_MESH_CACHE_CLASSES = {
+    cls.__name__: cls
+    for cls in [
+        Mesh,
+        BeamMesh,
+        BeamLinkMesh,
+        ShellLinkMesh,
+        BeamMeshWithSpringSupports,
+        EdgeControlLine,
+        ShellEdgeControlLine,
+        SweepPath,
+    ]
+}
+_MESH_CACHE_TUPLES = {cls.__name__: cls for cls in [Point, OpsCommand]}
+
+
+def save_mesh_cache(mesh_obj: Mesh, file_handle):
+    """
+    Function to write a mesh to a compressed .npz cache file. Arrays of the mesh (e.g. node coordinates, element
+    connectivity, grids) are stored as arrays of the file, and all other attributes are stored as a JSON string.
+
+    :param mesh_obj: Mesh object
+    :param file_handle: file path or binary file object to write to
+    """
+    arrays = dict()
+    state = _encode_mesh_state(mesh_obj, arrays)
+    np.savez_compressed(file_handle, __state__=np.array(json.dumps(state)), **arrays)
+
+
+def load_mesh_cache(file_handle) -> Mesh:
+    """
+    Function to read a mesh from a cache file written by :func:`save_mesh_cache`. The file is read without pickle,
+    and only mesh classes of ospgrillage are created, hence cache files do not run code when loaded.
+
+    :param file_handle: file path or binary file object to read from
+    :returns: Mesh object
+    """
+    with np.load(file_handle, allow_pickle=False) as data:
+        arrays = {key: data[key] for key in data.files}
+    return _decode_mesh_state(json.loads(str(arrays.pop("__state__"))), arrays, {})
+
+
+def _encode_mesh_state(obj, arrays: dict, mesh_obj: Mesh = None):
+    # encode obj as JSON compatible data, with arrays stored in arrays dict
+    if isinstance(obj, np.generic):  # before float, as np.float64 is a subclass of float
+        return {"__scalar__": obj.dtype.str, "value": obj.item()}
+    if obj is None or isinstance(obj, (bool, int, float, str)):
+        return obj
+    if isinstance(obj, np.ndarray):
+        if obj.dtype.hasobject:
+            raise TypeError("Array of objects can not be stored in mesh cache")
+        key = "array_{}".format(len(arrays))
+        arrays[key] = obj
+        return {"__array__": key}
+    if isinstance(obj, NodeSpecView):
+        return {"__view__": "node_spec"}
+    if isinstance(obj, ElementListView):
+        return {"__view__": obj.kind}
+    if isinstance(obj, tuple) and type(obj).__name__ in _MESH_CACHE_TUPLES:
+        return {
+            "__namedtuple__": type(obj).__name__,
+            "items": [_encode_mesh_state(item, arrays, mesh_obj) for item in obj],
+        }
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        item_list = list(obj)
+        if isinstance(obj, (set, frozenset)):
+            try:
+                item_list.sort()  # same file for equal sets
+            except TypeError:
+                pass
+        items = [_encode_mesh_state(item, arrays, mesh_obj) for item in item_list]
+        if isinstance(obj, list):
+            return items
+        return {"__" + type(obj).__name__ + "__": items}
+    if isinstance(obj, dict):
+        return {
+            "__dict__": [
+                [
+                    _encode_mesh_state(key, arrays, mesh_obj),
+                    _encode_mesh_state(val, arrays, mesh_obj),
+                ]
+                for key, val in obj.items()
+            ]
+        }
+    if type(obj).__name__ in _MESH_CACHE_CLASSES:
+        if isinstance(obj, Mesh):
+            if mesh_obj is not None:
+                raise TypeError("Mesh cache stores a single Mesh object")
+            mesh_obj = obj
+        return {
+            "__object__": type(obj).__name__,
+            "state": _encode_mesh_state(obj.__dict__, arrays, mesh_obj),
+        }
+    raise TypeError(
+        "Attribute of type {} can not be stored in mesh cache".format(
+            type(obj).__name__
+        )
+    )
+
+
+def _decode_mesh_state(data, arrays: dict, context: dict):
+    # decode data of _encode_mesh_state(), context holds the Mesh object being decoded for its views
+    if isinstance(data, list):
+        return [_decode_mesh_state(item, arrays, context) for item in data]
+    if not isinstance(data, dict):
+        return data
+    if "__array__" in data:
+        return arrays[data["__array__"]]
+    if "__scalar__" in data:
+        return np.dtype(data["__scalar__"]).type(data["value"])
+    if "__view__" in data:
+        if data["__view__"] == "node_spec":
+            return NodeSpecView(context["mesh"])
+        return ElementListView(context["mesh"], data["__view__"])
+    if "__namedtuple__" in data:
+        return _MESH_CACHE_TUPLES[data["__namedtuple__"]](
+            *[_decode_mesh_state(item, arrays, context) for item in data["items"]]
+        )
+    for tag, container in [
+        ("__tuple__", tuple),
+        ("__set__", set),
+        ("__frozenset__", frozenset),
+    ]:
+        if tag in data:
+            return container(
+                [_decode_mesh_state(item, arrays, context) for item in data[tag]]
+            )
+    if "__dict__" in data:
+        return {
+            _decode_mesh_state(key, arrays, context): _decode_mesh_state(
+                val, arrays, context
+            )
+            for key, val in data["__dict__"]
+        }
+    if "__object__" in data:
+        cls = _MESH_CACHE_CLASSES[data["__object__"]]
+        obj = cls.__new__(cls)
+        if isinstance(obj, Mesh):
+            context["mesh"] = obj
+        obj.__dict__.update(_decode_mesh_state(data["state"], arrays, context))
+        return obj
+    raise ValueError("Invalid data in mesh cache: {}".format(sorted(data)))
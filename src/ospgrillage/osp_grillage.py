@@ -5,9 +5,13 @@ or executable py file. This is done by wrapping `OpenSeesPy` commands for creati
 This module also handles all load case assignment, analysis, and results by wrapping `OpenSeesPy` command for analysis
 """
 import dataclasses
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from itertools import combinations
+from functools import partial
+from itertools import combinations, groupby
 from typing import List, Tuple, TYPE_CHECKING
 
 import openseespy.opensees as ops
@@ -54,6 +58,8 @@ def create_grillage(**kwargs):
     * ext_to_int_dist: (Int or Float, or a List of Int or Float) distance between internal beams and
     exterior main beams. If list is provided (usually size 2), apply each distinct distance to left and right
          side respectively.
+    * mesh_cache_dir: (str) Directory of mesh cache files. Models with the same meshing inputs load the mesh from
+    the cache file instead of meshing.
 
 
     Depending on the ``model_type`` argument, this function returns the relevant concrete class of
@@ -136,6 +142,12 @@ class OspGrillage:
         * stitch_slab_elements: (Bool) To set stictch elements between spans. Elements are set using `set_member()` with
           member= "stich_elements"
         * non_cont_spacing_x: (float) sets spacing or length of stitch elements.
+        * numberer: (str) Numberer of DOFs for analysis, either "Plain" (default), "RCM" (reverse Cuthill-McKee, banded
+          system), "AMD" (approximate minimum degree, sparse system), or "auto" to select based on bandwidth of mesh.
+        * mesh_cache_dir: (str) Directory of mesh cache files. If provided, the mesh is stored in a compressed .npz
+          cache file named by the hash of meshing inputs, and later models with the same meshing inputs load the mesh
+          from the file instead of meshing. Cache files are read without pickle, see
+          :func:`~ospgrillage.mesh.load_mesh_cache`.
 
         :raises ValueError: If skew angle is greater than 90. If number of transverse grid line is less than 2.
 
@@ -180,9 +192,9 @@ class OspGrillage:
         self.global_mat_object = []  # material matrix
         self.global_line_int_dict = []
         # list of components tags
-        self.element_command_list = dict()  # list of str of ops.element() commands
-        self.section_command_list = []  # list of str of ops.section() commands
-        self.material_command_list = []  # list of str of ops.material() commands
+        self.element_command_list = dict()  # dict of ele tag to OpsCommand of ops.element()
+        self.section_command_list = []  # list of OpsCommand of ops.section()
+        self.material_command_list = []  # list of OpsCommand of ops.material()
         # list of common grillage elements - base class variable
         self.common_grillage_element_keys = [
             "edge_beam",
@@ -241,15 +253,22 @@ class OspGrillage:
         self.global_patch_int_dict = dict()  # store patch intersection grid information
         self.load_case_list = (
             []
-        )  # list of dict, example [{'loadcase':LoadCase object, 'load_command': list of str}..]
+        )  # list of dict, example [{'loadcase':LoadCase object, 'load_command': nodal load array}..]
         self.load_combination_dict = (
             dict()
-        )  # example {0:[{'loadcase':LoadCase object, 'load_command': list of str},
-        # {'loadcase':LoadCase object, 'load_command': list of str}....]}
+        )  # example {0:[{'loadcase':LoadCase object, 'load_command': nodal load array},
+        # {'loadcase':LoadCase object, 'load_command': nodal load array}....]}
         self.moving_load_case_dict = dict()  # example [ list of load_case_dict]\
+        self.moving_load_obj_dict = dict()  # moving load name to MovingLoad object, for deferred distribution
+        self.moving_load_workers_dict = dict()  # moving load name to number of worker processes for distribution
         # counters to keep track of ops time series and ops pattern objects for loading
         self.global_time_series_counter = 1
         self.global_pattern_counter = 1
+        # dict of unit load response matrices, see compute_influence_surfaces()
+        self.influence_surfaces = None
+        # cache of nodal weights of point loads, cleared after distribution of load cases - see
+        # _assign_points_to_four_node()
+        self._point_weight_cache = dict()
 
         # file name for output py file
         self.filename = "{}_op.py".format(self.model_name)
@@ -323,10 +342,27 @@ class OspGrillage:
         }
         self.edge_support_type_dict.update({0: self.fixity_vector["pin"]})
 
+        # numberer of DOFs and matching system of equations for analysis
+        self.numberer, self.system = self._select_numberer(
+            kwargs.get("numberer", "Plain")
+        )
+
     def _create_mesh(self, **kwargs):
         """
-        Create the :class:~ospgrillage.mesh.Mesh class.
+        Create the :class:~ospgrillage.mesh.Mesh class. If mesh_cache_dir kwarg is provided, the mesh is loaded from the
+        cache file of the meshing inputs if it exist, else the created mesh is stored in the cache file.
         """
+        mesh_cache_dir = kwargs.pop("mesh_cache_dir", None)
+        cache_file = None
+        if mesh_cache_dir is not None:
+            cache_file = os.path.join(
+                mesh_cache_dir, "mesh_{}.npz".format(self._get_mesh_cache_key(**kwargs))
+            )
+            if os.path.isfile(cache_file):
+                mesh_obj = load_mesh_cache(cache_file)
+                if self.diagnostics:
+                    print("Mesh loaded from cache: {}".format(cache_file))
+                return mesh_obj
         if self.model_type == "beam_link":
             mesh_obj = BeamLinkMesh(**kwargs)
         elif self.model_type == "shell_beam":
@@ -335,10 +371,88 @@ class OspGrillage:
             mesh_obj = BeamMesh(**kwargs)
         else:
             mesh_obj = None
+        if mesh_obj is not None:
+            # convert node and element storage to arrays once all meshing procedures (incl. sub classes) are complete
+            mesh_obj.compact_mesh_storage()
+        if cache_file is not None and mesh_obj is not None:
+            os.makedirs(mesh_cache_dir, exist_ok=True)
+            # write to temporary file then rename, so other processes never read a partially written cache file
+            temp_file = "{}.{}.tmp".format(cache_file, os.getpid())
+            with open(temp_file, "wb") as file_handle:
+                save_mesh_cache(mesh_obj, file_handle)
+            os.replace(temp_file, cache_file)
         if self.diagnostics:
             print("Meshing complete")
         return mesh_obj
 
+    def _select_numberer(self, numberer: str):
+        """
+        Function to select the `OpenSeesPy` numberer of DOFs and the matching system of equations. Band minimising
+        numbering (RCM) is solved with a banded system, while fill-in minimising numbering (AMD) is solved with a
+        sparse system.
+
+        :param numberer: Name string of numberer, either "Plain", "RCM", "AMD", or "auto". If "auto", RCM is selected if
+                         it reduces the bandwidth of mesh to a narrow band (bandwidth squared less than number of nodes),
+                         AMD is selected if the reduced bandwidth is still wide, else Plain is kept.
+        :returns: tuple of numberer and system name strings
+
+        .. note::
+            The "auto" cutoff is a heuristic from the cost of banded factorisation, which grows with nodes x
+            bandwidth squared: once bandwidth squared exceeds the number of nodes, the band holds more entries than a
+            sparse factorisation with fill-in reducing (AMD) ordering typically needs. The cutoff is checked against
+            ``test_numberer_benchmark`` in tests/test_benchmark.py (28m Super-T model scaled up tenfold, 770 nodes):
+            RCM is fastest for a reduced bandwidth of 13 (13**2 <= 770), and AMD for a reduced bandwidth of 43
+            (43**2 > 770).
+        """
+        system_dict = {"Plain": "BandGeneral", "RCM": "BandGeneral", "AMD": "UmfPack"}
+        if numberer == "auto":
+            plain_bandwidth = self.Mesh_obj.get_node_bandwidth()
+            rcm_bandwidth = self.Mesh_obj.get_node_bandwidth(
+                self.Mesh_obj.get_rcm_ordering()
+            )
+            if rcm_bandwidth >= plain_bandwidth:
+                numberer = "Plain"
+            elif rcm_bandwidth**2 <= len(self.Mesh_obj.node_tag_array):
+                numberer = "RCM"
+            else:
+                numberer = "AMD"
+            if self.diagnostics:
+                print(
+                    "Numberer {} selected: bandwidth Plain = {}, RCM = {}".format(
+                        numberer, plain_bandwidth, rcm_bandwidth
+                    )
+                )
+        if numberer not in system_dict:
+            raise ValueError(
+                "numberer must be either Plain, RCM, AMD or auto: got {}".format(
+                    numberer
+                )
+            )
+        return numberer, system_dict[numberer]
+
+    def _get_mesh_cache_key(self, **kwargs) -> str:
+        """
+        Function to get the hash of meshing inputs, used as name of mesh cache file.
+        """
+        from ospgrillage import __version__
+
+        # kwargs which do not affect the mesh
+        ignore_kwargs = ["diagnostics", "numberer", "mesh_cache_dir"]
+        mesh_inputs = [
+            __version__,
+            MESH_CACHE_VERSION,
+            self.model_type,
+            sorted(
+                [
+                    (key, _get_cache_key_value(val))
+                    for key, val in kwargs.items()
+                    if key not in ignore_kwargs
+                ],
+                key=lambda item: item[0],
+            ),
+        ]
+        return hashlib.sha256(repr(mesh_inputs).encode()).hexdigest()
+
     # interface function
     def create_osp_model(self, pyfile: bool = False):
         """
@@ -372,9 +486,10 @@ class OspGrillage:
         self._write_op_model()
         # run model generation in OpenSees or write generation command to py file
         self._run_mesh_generation()
-        
+
         # create the result object for the grillage model
         self.results = Results(self.Mesh_obj)
+        self.influence_surfaces = None  # reset influence surfaces of previous model
         self._write_rigid_link()
 
     # function to run mesh generation
@@ -390,37 +505,36 @@ class OspGrillage:
         # write / execute variable definition command
 
         # write / execute material and sections
-        for mat_str in self.material_command_list:
+        for mat_command in self.material_command_list:
             if self.pyfile:
                 with open(self.filename, "a") as file_handle:
                     file_handle.write("# Material definition \n")
-                    file_handle.write(mat_str)
+                    file_handle.write(mat_command.render())
             else:
-                eval(mat_str)
-                self.model_command_list.append(mat_str)
+                mat_command.execute()
+                self.model_command_list.append(mat_command)
 
-        for sec_str in self.section_command_list:
+        for sec_command in self.section_command_list:
             if self.pyfile:
                 with open(self.filename, "a") as file_handle:
                     file_handle.write("# Create section: \n")
-                    file_handle.write(sec_str)
+                    file_handle.write(sec_command.render())
             else:
-                eval(sec_str)
-                self.model_command_list.append(sec_str)
+                sec_command.execute()
+                self.model_command_list.append(sec_command)
         # write /execute element commands
 
-        for ele_tag, ele_str in self.element_command_list.items():
+        for ele_tag, ele_command in self.element_command_list.items():
             if self.pyfile:
                 with open(self.filename, "a") as file_handle:
-                    file_handle.write(ele_str)
+                    file_handle.write(ele_command.render())
             else:
-                eval(ele_str)
-                self.model_command_list.append(ele_str)
+                ele_command.execute()
+                self.model_command_list.append(ele_command)
 
-        
         # write equalDOF commands
         self._write_equal_dof(node_tag_list=self.spring_node_pairs.items())
-        
+
         # if created OpenSees instance, set instance flag
         if not self.pyfile:
             self.model_instance = True
@@ -464,46 +578,45 @@ class OspGrillage:
         """
         # loop all transform dict items,
         print("inside _write_geom_transf function")
-        for k, v in mesh_obj.transform_dict.items():
-            vxz = k.split("|")[0]  # first substring is vector xz
-            offset = k.split("|")[1]  # second substring is global offset of node i and j of element
+        for (vxz, offset_list), v in mesh_obj.transform_dict.items():
+            # key is tuple of vector xz, and global offset of node i (entry 0) and node j (entry 1) of element
             print(vxz)
-            print(offset)
+            print(offset_list)
             print("-------")
-            if eval(offset):
-                offset_list = eval(
-                    offset
-                )  # list of global offset of node i entry 0 and node j entry 1
-                geom_tranfs_str = 'ops.geomTransf("{type}", {tag}, *{vxz}, {offset_i}, {offset_j})\n'.format(
-                    type=transform_type,
-                    tag=v,
-                    vxz=eval(vxz),
-                    offset_i=offset_list[0],
-                    offset_j=offset_list[1],
+            if offset_list:
+                geom_transf_command = OpsCommand(
+                    "geomTransf",
+                    (
+                        transform_type,
+                        v,
+                        *vxz,
+                        list(offset_list[0]),
+                        list(offset_list[1]),
+                    ),
                 )
-                print(geom_tranfs_str)
+                print(geom_transf_command.render())
                 print("-------------")
 
                 if self.pyfile:
                     with open(self.filename, "a") as file_handle:
-                        file_handle.write(geom_tranfs_str)
+                        file_handle.write(geom_transf_command.render())
                 else:
-                    eval(geom_tranfs_str)
+                    geom_transf_command.execute()
 
             else:
-                geom_tranfs_str = 'ops.geomTransf("{type}", {tag}, *{vxz})\n'.format(
-                    type=transform_type, tag=v, vxz=eval(vxz)
+                geom_transf_command = OpsCommand(
+                    "geomTransf", (transform_type, v, *vxz)
                 )
                 if self.pyfile:
                     with open(self.filename, "a") as file_handle:
                         file_handle.write("# create transformation {}\n".format(v))
-                        file_handle.write(geom_tranfs_str)
+                        file_handle.write(geom_transf_command.render())
 
                 else:
-                    eval(geom_tranfs_str)
+                    geom_transf_command.execute()
 
             # store to global list
-            self.model_command_list.append(geom_tranfs_str)
+            self.model_command_list.append(geom_transf_command)
 
     def _write_op_model(self):
         """
@@ -514,20 +627,21 @@ class OspGrillage:
             For 3-D model, the default model dimension and node degree-of-freedoms are 3 and 6 respectively.
             This method automatically sets the aforementioned parameters to 2 and 4 respectively, for a 2-D problem.
         """
-        wipe_str = "ops.wipe()\n"
-        model_str = "ops.model('basic', '-ndm', {ndm}, '-ndf', {ndf})\n".format(
-            ndm=self.__ndm, ndf=self.__ndf
+        wipe_command = OpsCommand("wipe")
+        model_command = OpsCommand(
+            "model", ("basic", "-ndm", self.__ndm, "-ndf", self.__ndf)
         )
-        # check if write or eval command
+        # check if write or execute command
         if self.pyfile:
             with open(self.filename, "a") as file_handle:
-                file_handle.write(wipe_str)
-                file_handle.write(model_str)
+                file_handle.write(wipe_command.render())
+                file_handle.write(model_command.render())
         else:
-            eval(wipe_str)
-            eval(model_str)
-            self.model_command_list.append(wipe_str)
-            self.model_command_list.append(model_str)
+            wipe_command.execute()
+            model_command.execute()
+            self.model_command_list = []  # reset commands of previous model
+            self.model_command_list.append(wipe_command)
+            self.model_command_list.append(model_command)
 
     def _write_op_node(self, mesh_obj: Mesh):
         """
@@ -537,24 +651,26 @@ class OspGrillage:
         if self.pyfile:
             with open(self.filename, "a") as file_handle:
                 file_handle.write("# Model nodes\n")
-        # loop all node in dict, write or eval node command
-        for (
-            k,
-            nested_v,
-        ) in mesh_obj.node_spec.items():
-            coordinate = nested_v["coordinate"]
-            node_str = "ops.node({tag}, {x:.4f}, {y:.4f}, {z:.4f})\n".format(
-                tag=nested_v["tag"],
-                x=coordinate[0],
-                y=coordinate[1],
-                z=coordinate[2],
+        # loop all node in dict, write or execute node command
+        for node_tag, coordinate in zip(
+            mesh_obj.node_tag_array.tolist(), mesh_obj.node_coordinate_array
+        ):
+            # indices correspondence . 0 - x , 1 - y, 2 - z. Coordinates rounded to 4 decimal places
+            node_command = OpsCommand(
+                "node",
+                (
+                    node_tag,
+                    round(float(coordinate[0]), 4),
+                    round(float(coordinate[1]), 4),
+                    round(float(coordinate[2]), 4),
+                ),
             )
             if self.pyfile:
                 with open(self.filename, "a") as file_handle:
-                    file_handle.write(node_str)
-            else:  # indices correspondence . 0 - x , 1 - y, 2 - z
-                eval(node_str)
-                self.model_command_list.append(node_str)
+                    file_handle.write(node_command.render())
+            else:
+                node_command.execute()
+                self.model_command_list.append(node_command)
 
     def _write_op_fix(self, mesh_obj):
         """
@@ -572,15 +688,15 @@ class OspGrillage:
             ):  # here [0] is first group
                 pass  # move to next node in edge recorder
             else:
-                fix_str = "ops.fix({}, *{})\n".format(
-                    node_tag, self.edge_support_type_dict[edge_group_num]
+                fix_command = OpsCommand(
+                    "fix", (node_tag, *self.edge_support_type_dict[edge_group_num])
                 )
                 if self.pyfile:  # if writing py file
                     with open(self.filename, "a") as file_handle:
-                        file_handle.write(fix_str)
+                        file_handle.write(fix_command.render())
                 else:  # run instance
-                    eval(fix_str)
-                    self.model_command_list.append(fix_str)
+                    fix_command.execute()
+                    self.model_command_list.append(fix_command)
 
     def _write_equal_dof(self, node_tag_list: list, dof: list = None):
         """
@@ -590,16 +706,14 @@ class OspGrillage:
             dof = [1, 2, 3, 4, 5]  # default
         # key is supported node , slave is non supported node
         for master_node, slave_node in node_tag_list:
-            equaldof_str = "ops.equalDOF({rNodetag},{cNodetag},*{dofs})\n".format(
-                rNodetag=master_node, cNodetag=slave_node, dofs=dof
-            )
+            equaldof_command = OpsCommand("equalDOF", (master_node, slave_node, *dof))
 
             if self.pyfile:
                 with open(self.filename, "a") as file_handle:
-                    file_handle.write(equaldof_str)
+                    file_handle.write(equaldof_command.render())
             else:
-                eval(equaldof_str)
-                self.model_command_list.append(equaldof_str)
+                equaldof_command.execute()
+                self.model_command_list.append(equaldof_command)
 
     def _write_material(
         self, member: GrillageMember = None, material: Material = None
@@ -637,10 +751,10 @@ class OspGrillage:
         )  # set key for material
         # check if the material_tag is a previously assigned key, if not, append to material_command_list variable
         if material_tag != lastmaterialtag:
-            mat_str = member.material.get_ops_material_command(
+            mat_command = member.material.get_ops_material_command(
                 material_tag=material_tag
             )
-            self.material_command_list.append(mat_str)
+            self.material_command_list.append(mat_command)
         else:  # material tag defined, skip, print to terminal
             if self.diagnostics:
                 print(
@@ -684,10 +798,10 @@ class OspGrillage:
         )
 
         if sectiontagcounter not in previously_defined_section:
-            sec_str = grillage_member_obj.get_ops_section_command(
+            sec_command = grillage_member_obj.get_ops_section_command(
                 section_tag=sectiontagcounter
             )
-            self.section_command_list.append(sec_str)
+            self.section_command_list.append(sec_command)
 
             # print to terminal
             if self.diagnostics:
@@ -746,13 +860,14 @@ class OspGrillage:
         """
         Write/execute OpenSeesPy rigidLink() command.
         """
-        # loop all rigidLink command, write or eval rigid link command. note link_str is already formatted
-        for link_str in self.Mesh_obj.link_str_list:
+        # loop all rigidLink command, write or execute rigid link command
+        for link_command in self.Mesh_obj.link_str_list:
             if self.pyfile:
                 with open(self.filename, "a") as file_handle:
-                    file_handle.write(link_str)
+                    file_handle.write(link_command.render())
             else:
-                eval(link_str)
+                link_command.execute()
+                self.model_command_list.append(link_command)
 
     # interface function
     def set_member(
@@ -825,41 +940,20 @@ class OspGrillage:
                     n1 = ele[1]  # node i
                     n2 = ele[2]  # node j
                     node_tag_list = [n1, n2]
-                    # get node width of node_i and node_j
-                    lis_1 = self.Mesh_obj.node_width_x_dict[n1]
-                    lis_2 = self.Mesh_obj.node_width_x_dict[n2]
+                    # get unit width of node_i and node_j, from distances to vicinity nodes in x direction
                     ele_width = 1
                     ele_width_record = []
-                    # for the two list of vicinity nodes, find their distance and store in ele_width_record
-                    for lis in [lis_1, lis_2]:
-                        if len(lis) == 1:
-                            ele_width_record.append(
-                                np.sqrt(
-                                    lis[0][0] ** 2 + lis[0][1] ** 2 + lis[0][2] ** 2
-                                )
-                                / 2
-                            )
-                        elif len(lis) >= 2:
-                            ele_width_record.append(
-                                (
-                                    np.sqrt(
-                                        lis[0][0] ** 2 + lis[0][1] ** 2 + lis[0][2] ** 2
-                                    )
-                                    + np.sqrt(
-                                        lis[1][0] ** 2 + lis[1][1] ** 2 + lis[1][2] ** 2
-                                    )
-                                )
-                                / 2
-                            )
-                        else:
-                            #
+                    for node in node_tag_list:
+                        node_width = self.Mesh_obj.node_unit_width_x_dict[node]
+                        if node_width is None:
                             break  # has assigned element, continue to next check
+                        ele_width_record.append(node_width)
                     ele_width = np.mean(
                         ele_width_record
                     )  # if node lies between a triangular and quadrilateral grid, get mean between
                     # both width
                     # here take the average width in x directions
-                    ele_str = grillage_member_obj.get_element_command_str(
+                    ele_command = grillage_member_obj.get_element_command(
                         ele_tag=ele[0],
                         node_tag_list=node_tag_list,
                         transf_tag=ele[4],
@@ -867,15 +961,15 @@ class OspGrillage:
                         materialtag=material_tag,
                         sectiontag=section_tag,
                     )
-                    ele_command_list.append(ele_str)
-                    ele_tag_to_command_dict[ele[0]] = ele_str
+                    ele_command_list.append(ele_command)
+                    ele_tag_to_command_dict[ele[0]] = ele_command
 
             elif member == "start_edge" or member == "end_edge":
                 for edge_group in self.common_grillage_element_z_group[member]:
                     for edge_ele in self.Mesh_obj.edge_group_to_ele[edge_group]:
                         edge_ele_width = 0.5  # nominal half -m width
                         node_tag_list = [edge_ele[1], edge_ele[2]]
-                        ele_str = grillage_member_obj.get_element_command_str(
+                        ele_command = grillage_member_obj.get_element_command(
                             ele_tag=edge_ele[0],
                             node_tag_list=node_tag_list,
                             transf_tag=edge_ele[4],
@@ -883,8 +977,8 @@ class OspGrillage:
                             materialtag=material_tag,
                             sectiontag=section_tag,
                         )
-                        ele_command_list.append(ele_str)
-                        ele_tag_to_command_dict[edge_ele[0]] = ele_str
+                        ele_command_list.append(ele_command)
+                        ele_tag_to_command_dict[edge_ele[0]] = ele_command
 
             ele_group_to_command_dict[0] = ele_command_list
         else:  # non-unit width member assignment
@@ -994,17 +1088,9 @@ class OspGrillage:
             x_group = self.Mesh_obj.node_spec[node_tag]["x_group"]
             z_group = self.Mesh_obj.node_spec[node_tag]["z_group"]
             # create new node tag after last node tag in node_spec +=1
-            node_counter = list(self.Mesh_obj.node_spec.keys())[-1] + 1
+            node_counter = int(self.Mesh_obj.node_tag_array[-1]) + 1
             # create a second node with the same coordinate x y z - new label # add to node spec
-            self.Mesh_obj.node_spec.setdefault(
-                node_counter,
-                {
-                    "tag": node_counter,
-                    "coordinate": node_coord,
-                    "x_group": x_group,
-                    "z_group": z_group,
-                },
-            )
+            self.Mesh_obj.add_node(node_counter, node_coord, x_group, z_group)
             # store new node information
             new_node_list.append(node_counter)
             edge_node_dict[node_counter] = edge_num
@@ -1012,14 +1098,14 @@ class OspGrillage:
             ele_count = self.global_ele_counter
             nodes = [node_counter, node_tag]
             ele_command_list.append(
-                spring_member.get_element_command_str(
+                spring_member.get_element_command(
                     ele_tag=ele_count,
                     node_tag_list=nodes,
                     materialtag=material_tag,
                 )
             )
 
-            ele_tag_to_command_dict[ele_count] = spring_member.get_element_command_str(
+            ele_tag_to_command_dict[ele_count] = spring_member.get_element_command(
                 ele_tag=ele_count,
                 node_tag_list=nodes,
                 materialtag=material_tag,
@@ -1049,7 +1135,7 @@ class OspGrillage:
         :param list_of_ele: List of element tags
         :param material_tag: tag of material object command
         :param section_tag: tag of section object command
-        :return: list of string containing OpenSeesPy element() commands for creating the element in model space
+        :return: list of OpsCommand of OpenSeesPy element() commands for creating the element in model space
         """
         ele_command_list = []
         for ele in list_of_ele:
@@ -1057,7 +1143,7 @@ class OspGrillage:
             n2 = ele[2]  # node j
             node_tag_list = [n1, n2]
             ele_width = 1
-            ele_str = grillage_member_obj.get_element_command_str(
+            ele_command = grillage_member_obj.get_element_command(
                 ele_tag=ele[0],
                 node_tag_list=node_tag_list,
                 transf_tag=ele[4],
@@ -1065,7 +1151,7 @@ class OspGrillage:
                 materialtag=material_tag,
                 sectiontag=section_tag,
             )
-            ele_command_list.append(ele_str)
+            ele_command_list.append(ele_command)
         return ele_command_list
 
     # ---------------------------------------------------------------
@@ -1076,46 +1162,89 @@ class OspGrillage:
     def _get_elements(self, node_tag_combo):
         """Query the element tags for grillage members."""
         # abstracted procedure to find and return the long and trans elements within a grid of 4 or 3 nodes
-        record_long = []
-        record_trans = []
-        record_edge = []
+        record = {"long": [], "trans": [], "edge": []}
         for combi in node_tag_combo:
-            long_mem_index = [
-                i
-                for i, x in enumerate(
-                    [
-                        combi[0] in n[1:3] and combi[1] in n[1:3]
-                        for n in self.Mesh_obj.long_ele
-                    ]
-                )
-                if x
-            ]
-            trans_mem_index = [
-                i
-                for i, x in enumerate(
-                    [
-                        combi[0] in n[1:3] and combi[1] in n[1:3]
-                        for n in self.Mesh_obj.trans_ele
-                    ]
-                )
-                if x
-            ]
-            edge_mem_index = [
-                i
-                for i, x in enumerate(
-                    [
-                        combi[0] in n[1:3] and combi[1] in n[1:3]
-                        for n in self.Mesh_obj.edge_span_ele
-                    ]
-                )
-                if x
-            ]
-            record_long = record_long + long_mem_index  # record
-            record_trans = record_trans + trans_mem_index  # record
-            record_edge = record_edge + edge_mem_index
-        return record_long, record_trans, record_edge
+            # look up element joining the two nodes
+            element = self.Mesh_obj.node_pair_to_element.get(frozenset(combi), None)
+            if element is not None:
+                element_kind, index = element
+                record[element_kind].append(index)
+        return record["long"], record["trans"], record["edge"]
 
     # Getter for Points Loads nodes
+    def locate_points(self, points: np.ndarray, grid_hint: np.ndarray = None):
+        """
+        Function to locate multiple points on the grillage mesh in a single vectorised call. For each point, the
+        function returns the grid which contains the point, the node tags of the grid sorted counterclockwise from the
+        bottom left node, and the natural coordinates (eta, zeta) of the point within the grid.
+
+        :param points: Array of point coordinates, each row is [x, y, z]
+        :type points: numpy.ndarray
+        :param grid_hint: Array of grid number (N,) to check first for each point, e.g. the grid of the point in the
+                          previous increment of a moving load. -1 for no hint. Points not strictly inside their hinted
+                          grid are searched using the spatial index of mesh. Default None
+        :type grid_hint: numpy.ndarray
+        :returns: tuple of arrays:
+
+            * grid number of each point (N,). -1 for points outside the mesh.
+            * sorted node tags of the grid (N, 4). -1 for no node (e.g. three node grids or points outside mesh).
+            * natural coordinates [eta, zeta] of each point (N, 2). NaN for three node grids or points outside mesh.
+        """
+        mesh = self.Mesh_obj
+        points = np.atleast_2d(np.asarray(points, dtype=float))
+        num_point = len(points)
+        xp = points[:, 0]
+        zp = points[:, 2]
+        grid = -np.ones(num_point, dtype=int)
+        search = np.isfinite(xp) & np.isfinite(zp)
+        # points strictly inside their hinted grid are not on an edge shared with other grids, hence take the grid
+        if grid_hint is not None and len(grid_hint) == num_point:
+            hinted = np.flatnonzero(search & (grid_hint >= 0))
+            vertex = mesh.grid_vertex_array[grid_hint[hinted]]
+            edge = np.roll(vertex, -1, axis=1) - vertex
+            side = (zp[hinted, None] - vertex[:, :, 1]) * edge[:, :, 0] - (
+                xp[hinted, None] - vertex[:, :, 0]
+            ) * edge[:, :, 1]
+            side = side * mesh.grid_signed_area[grid_hint[hinted], None]
+            # zero length edges of grids with less than four nodes are skipped
+            inside = np.all((side > 0) | np.all(edge == 0, axis=2), axis=1)
+            grid[hinted[inside]] = grid_hint[hinted[inside]]
+            search[hinted[inside]] = False
+        # get candidate grids of each point from the spatial index of mesh, as (point, grid) pairs
+        search = np.flatnonzero(search)
+        point_index, candidate_grid = mesh.get_candidate_grid_pairs(
+            xp[search], zp[search]
+        )
+        point_index = search[point_index]
+        # point in grid check of all pairs, see check_point_in_grid()
+        vertex = mesh.grid_vertex_array[candidate_grid]  # (pairs, 4, [x,z])
+        next_vertex = np.roll(vertex, -1, axis=1)
+        side = (zp[point_index, None] - vertex[:, :, 1]) * (
+            next_vertex[:, :, 0] - vertex[:, :, 0]
+        ) - (xp[point_index, None] - vertex[:, :, 0]) * (
+            next_vertex[:, :, 1] - vertex[:, :, 1]
+        )
+        signed_area = mesh.grid_signed_area[candidate_grid, None]
+        outside = np.any(
+            ((side < 0) & (0 <= signed_area)) | ((side > 0) & (0 > signed_area)),
+            axis=1,
+        )
+        # for points on shared edges of grids, the last grid (in grid_number_dict) containing the point is returned
+        np.maximum.at(grid, point_index[~outside], candidate_grid[~outside])
+        located = grid >= 0
+        sorted_node = -np.ones((num_point, 4), dtype=int)
+        sorted_node[located] = mesh.grid_sorted_node_array[grid[located]]
+        # natural coordinates of points in quadrilateral grids
+        natural_coordinate = np.full((num_point, 2), np.nan)
+        quad = located & (sorted_node[:, 3] >= 0)
+        sorted_vertex = mesh.grid_sorted_vertex_array[grid[quad]]
+        eta, zeta = solve_zeta_eta_array(
+            xp[quad], zp[quad], sorted_vertex[:, :, 0], sorted_vertex[:, :, 1]
+        )
+        natural_coordinate[quad, 0] = eta
+        natural_coordinate[quad, 1] = zeta
+        return grid, sorted_node, natural_coordinate
+
     def _get_point_load_nodes(self, point: Union[Tuple, list]):
         """Query the nodes in grid which encompass the point load"""
         # procedure
@@ -1131,16 +1260,25 @@ class OspGrillage:
             loading_point = Point(x, y, z)
         elif isinstance(point, LoadPoint):
             loading_point = point
-        for grid_tag, grid_nodes in self.Mesh_obj.grid_number_dict.items():
+        if loading_point.z is None:
+            candidate_grids = []
+        else:
+            # search only grids within the vicinity of point using spatial index of mesh
+            candidate_grids = self.Mesh_obj.get_candidate_grids(
+                loading_point.x, loading_point.z
+            )
+        # for points on shared edges of grids, the last grid (in grid_number_dict) containing the point is returned
+        for grid_tag in reversed(candidate_grids):
             # get grid nodes coordinate as named tuple Point
-            point_list = []
-            for node_tag in grid_nodes:
-                coord = self.Mesh_obj.node_spec[node_tag]["coordinate"]
-                coord_point = Point(coord[0], coord[1], coord[2])
-                point_list.append(coord_point)
+            point_list = [
+                Point(*coord)
+                for coord in self.Mesh_obj.get_node_coordinates(
+                    self.Mesh_obj.grid_number_dict[grid_tag]
+                )
+            ]
             if check_point_in_grid(loading_point, point_list):
-                node_list = point_list
                 grid = grid_tag
+                break
 
         node_list = self.Mesh_obj.grid_number_dict.get(grid, None)
         return node_list, grid  # grid = grid number
@@ -1182,14 +1320,19 @@ class OspGrillage:
         last_nd, last_grid = self._get_point_load_nodes(end_load_vertex)
 
         line_grid_intersect = dict()
-        # loop each grid check if line segment lies in grid
-        for grid_tag, grid_nodes in self.Mesh_obj.grid_number_dict.items():
-            point_list = []
+        # loop each grid crossed by the line (from spatial index of mesh), check if line segment lies in grid
+        for grid_tag in self.Mesh_obj.get_candidate_grids_along_line(
+            start_load_vertex.x,
+            start_load_vertex.z,
+            end_load_vertex.x,
+            end_load_vertex.z,
+        ):
+            grid_nodes = self.Mesh_obj.grid_number_dict[grid_tag]
             # get coordinates of all nodes in grid
-            for node_tag in grid_nodes:
-                coord = self.Mesh_obj.node_spec[node_tag]["coordinate"]
-                coord_point = Point(coord[0], coord[1], coord[2])
-                point_list.append(coord_point)
+            point_list = [
+                Point(*coord)
+                for coord in self.Mesh_obj.get_node_coordinates(grid_nodes)
+            ]
             # get long, trans and edge elements in the grids. This is for searching intersection later on
             element_combi = combinations(grid_nodes, 2)
             long_ele_index, trans_ele_index, edge_ele_index = self._get_elements(
@@ -1240,9 +1383,18 @@ class OspGrillage:
         # grids are returned with same values
         removed_key = []
         edited_dict = line_grid_intersect.copy()
-        # if line does not intersect any grid, overwrite edited_dict
+        # if line does not intersect any grid, overwrite edited_dict with grids which may contain the ends of line
         if not edited_dict:
-            for key in self.Mesh_obj.grid_number_dict.keys():
+            for key in sorted(
+                set(
+                    self.Mesh_obj.get_candidate_grids(
+                        start_load_vertex.x, start_load_vertex.z
+                    )
+                    + self.Mesh_obj.get_candidate_grids(
+                        end_load_vertex.x, end_load_vertex.z
+                    )
+                )
+            ):
                 edited_dict.setdefault(
                     key,
                     {"long_intersect": [], "trans_intersect": [], "edge_intersect": []},
@@ -1250,12 +1402,13 @@ class OspGrillage:
 
         # update line_grid_intersect adding start and end points of line segment to the dict within grid key
         for grid_key, int_list in edited_dict.items():
-            point_tuple_list = []
             int_list.setdefault("ends", [])  # set the key pair to empty list
-            for node_tag in self.Mesh_obj.grid_number_dict[grid_key]:
-                coord = self.Mesh_obj.node_spec[node_tag]["coordinate"]
-                coord_point = Point(coord[0], coord[1], coord[2])
-                point_tuple_list.append(coord_point)
+            point_tuple_list = [
+                Point(*coord)
+                for coord in self.Mesh_obj.get_node_coordinates(
+                    self.Mesh_obj.grid_number_dict[grid_key]
+                )
+            ]
 
             if check_point_in_grid(start_load_vertex, point_tuple_list):
                 # int_list.setdefault("ends", [[line_load_obj.load_point_1.x, line_load_obj.load_point_1.y,
@@ -1335,11 +1488,12 @@ class OspGrillage:
         # get line equation for checking intersections
         L2 = line([p_1.x, p_1.z], [p_2.x, p_2.z])
         # loop through long elements in grid, find intersection points
-        for long_ele in [self.Mesh_obj.long_ele[i] for i in long_ele_index]:
-            pz1 = self.Mesh_obj.node_spec[long_ele[1]]["coordinate"]  # point z 1
-            pz2 = self.Mesh_obj.node_spec[long_ele[2]]["coordinate"]  # point z 2
-            pz1 = Point(pz1[0], pz1[1], pz1[2])  # convert to point namedtuple
-            pz2 = Point(pz2[0], pz2[1], pz2[2])  # convert to point namedtuple
+        long_ele_list = [self.Mesh_obj.long_ele[i] for i in long_ele_index]
+        for long_ele, (pz1, pz2) in zip(
+            long_ele_list, self._get_ele_node_coordinates(long_ele_list)
+        ):
+            pz1 = Point(*pz1)  # convert to point namedtuple
+            pz2 = Point(*pz2)  # convert to point namedtuple
             # get the line segment within the grid. Line segment defined by two points assume model plane = 0 [x_1, z_1
             # ], and [x_2, z_2]
 
@@ -1367,11 +1521,12 @@ class OspGrillage:
                 R_z = intersection(L1, L2)
                 Rz.append([R_z[0], pz1.y, R_z[1]])
         # loop through trans elements in grid, find intersection points
-        for trans_ele in [self.Mesh_obj.trans_ele[i] for i in trans_ele_index]:
-            px1 = self.Mesh_obj.node_spec[trans_ele[1]]["coordinate"]  # point z 1
-            px2 = self.Mesh_obj.node_spec[trans_ele[2]]["coordinate"]  # point z 2
-            px1 = Point(px1[0], px1[1], px1[2])  # convert to point namedtuple
-            px2 = Point(px2[0], px2[1], px2[2])  # convert to point namedtuple
+        trans_ele_list = [self.Mesh_obj.trans_ele[i] for i in trans_ele_index]
+        for trans_ele, (px1, px2) in zip(
+            trans_ele_list, self._get_ele_node_coordinates(trans_ele_list)
+        ):
+            px1 = Point(*px1)  # convert to point namedtuple
+            px2 = Point(*px2)  # convert to point namedtuple
 
             # check potential for intersection or co linear condition
             intersect_x, colinear_x = check_intersect(px1, px2, p_1, p_2)
@@ -1397,15 +1552,12 @@ class OspGrillage:
                 Rx.append([R_x[0], px1.y, R_x[1]])
 
         # loop through edge elements in grid, find intersection points
-        for edge_ele in [self.Mesh_obj.edge_span_ele[i] for i in edge_ele_index]:
-            p_edge_1 = self.Mesh_obj.node_spec[edge_ele[1]]["coordinate"]  # point z 1
-            p_edge_2 = self.Mesh_obj.node_spec[edge_ele[2]]["coordinate"]  # point z 2
-            p_edge_1 = Point(
-                p_edge_1[0], p_edge_1[1], p_edge_1[2]
-            )  # convert to point namedtuple
-            p_edge_2 = Point(
-                p_edge_2[0], p_edge_2[1], p_edge_2[2]
-            )  # convert to point namedtuple
+        edge_ele_list = [self.Mesh_obj.edge_span_ele[i] for i in edge_ele_index]
+        for edge_ele, (p_edge_1, p_edge_2) in zip(
+            edge_ele_list, self._get_ele_node_coordinates(edge_ele_list)
+        ):
+            p_edge_1 = Point(*p_edge_1)  # convert to point namedtuple
+            p_edge_2 = Point(*p_edge_2)  # convert to point namedtuple
 
             intersect_edge, colinear_edge = check_intersect(
                 p_edge_1, p_edge_2, p_1, p_2
@@ -1437,24 +1589,29 @@ class OspGrillage:
     # Getter for Patch loads
     def _get_bounded_nodes(self, patch_load_obj):
         # function to return nodes bounded by patch load
-        point_list = [
-            patch_load_obj.load_point_1,
-            patch_load_obj.load_point_2,
-            patch_load_obj.load_point_3,
-            patch_load_obj.load_point_4,
-        ]
-        bounded_node = []
+        point_list = patch_load_obj.get_patch_vertices()
         bounded_grids = []
-        for node_tag, node_spec in self.Mesh_obj.node_spec.items():
-            coordinate = node_spec["coordinate"]
-            node = Point(coordinate[0], coordinate[1], coordinate[2])
-            flag = check_point_in_grid(node, point_list)
-            if flag:
-                # node is inside
-                bounded_node.append(node_tag)
-        # check if nodes form grid
-        for grid_number, grid_nodes in self.Mesh_obj.grid_number_dict.items():
-            check = all([nodes in bounded_node for nodes in grid_nodes])
+        # check all nodes of mesh inside patch at once, see check_point_in_grid()
+        coordinate = self.Mesh_obj.node_coordinate_array
+        vertex = np.array([[point.x, point.z] for point in point_list])
+        next_vertex = np.roll(vertex, -1, axis=0)
+        side = (coordinate[:, 2, None] - vertex[:, 1]) * (
+            next_vertex[:, 0] - vertex[:, 0]
+        ) - (coordinate[:, 0, None] - vertex[:, 0]) * (next_vertex[:, 1] - vertex[:, 1])
+        signed_area = check_points_direction(point_list)
+        outside = np.any(
+            ((side < 0) & (0 <= signed_area)) | ((side > 0) & (0 > signed_area)), axis=1
+        )
+        bounded_node = self.Mesh_obj.node_tag_array[~outside].tolist()
+        # check if nodes form grid, only grids of bounded nodes are checked
+        bounded_node_set = set(bounded_node)
+        for grid_number in sorted(
+            set().union(
+                *[self.Mesh_obj.node_to_grids.get(node, set()) for node in bounded_node]
+            )
+        ):
+            grid_nodes = self.Mesh_obj.grid_number_dict[grid_number]
+            check = all([nodes in bounded_node_set for nodes in grid_nodes])
             if check:
                 bounded_grids.append(grid_number)
         return bounded_node, bounded_grids
@@ -1462,102 +1619,112 @@ class OspGrillage:
     # Setter for Point loads
     def _assign_load_to_four_node(self, point, mag, shape_func="linear"):
         """Assign point load to four nodes in quadrilateral element or grid"""
-        node_mx = []
-        node_mz = []
-        # search grid where the point lies in
-        grid_nodes, _ = self._get_point_load_nodes(point=point)
-        if grid_nodes is None:
-            load_str = []
-            return load_str
-        # if corner or edge grid with 3 nodes, run specific assignment for triangular grids
-        # extract coordinates
-        p1 = self.Mesh_obj.node_spec[grid_nodes[0]]["coordinate"]
-        p2 = self.Mesh_obj.node_spec[grid_nodes[1]]["coordinate"]
-        p3 = self.Mesh_obj.node_spec[grid_nodes[2]]["coordinate"]
-
-        point_list = [
-            Point(p1[0], p1[1], p1[2]),
-            Point(p2[0], p2[1], p2[2]),
-            Point(p3[0], p3[1], p3[2]),
-        ]
-        if len(grid_nodes) == 3:
-            sorted_list, sorted_node_tag = sort_vertices(point_list, grid_nodes)
-            Nv = ShapeFunction.linear_triangular(
-                x=point[0],
-                z=point[2],
-                x1=sorted_list[0].x,
-                z1=sorted_list[0].z,
-                x2=sorted_list[1].x,
-                z2=sorted_list[1].z,
-                x3=sorted_list[2].x,
-                z3=sorted_list[2].z,
-            )
-            node_load = [mag * n for n in Nv]
-            node_mx = np.zeros(len(node_load))
-            node_mz = np.zeros(len(node_load))
-        else:  # else run assignment for quadrilateral grids
-            # extract coordinates of fourth point
-            p4 = self.Mesh_obj.node_spec[grid_nodes[3]][
-                "coordinate"
-            ]  # get coordinate of fourth point
-            point_list.append(Point(p4[0], p4[1], p4[2]))
-            sorted_list, sorted_node_tag = sort_vertices(point_list, grid_nodes)
-            # mapping coordinates to natural coordinate, then finds eta (x) and zeta (z) of the point xp,zp
-            eta, zeta = solve_zeta_eta(
-                xp=point[0],
-                zp=point[2],
-                x1=sorted_list[0].x,
-                z1=sorted_list[0].z,
-                x2=sorted_list[1].x,
-                z2=sorted_list[1].z,
-                x3=sorted_list[2].x,
-                z3=sorted_list[2].z,
-                x4=sorted_list[3].x,
-                z4=sorted_list[3].z,
-            )
+        return self._assign_points_to_four_node(
+            point_list=[list(point)[:3]], mag_list=[mag], shape_func_list=[shape_func]
+        )
 
-            # access shape function of line load
-            if shape_func == "hermite":
-                Nv, Nmx, Nmz = ShapeFunction.hermite_shape_function_2d(eta, zeta)
-                node_mx = [mag * n for n in Nmx]
-                # Mz
-                node_mz = [mag * n for n in Nmz]
-            else:  # linear shaep function
-                Nv = ShapeFunction.linear_shape_function(eta, zeta)
-            # Nv, Nmx, Nmz = ShapeFunction.hermite_shape_function_2d(eta, zeta)
-            # Fy
-            node_load = [mag * n for n in Nv]
+    def _assign_points_to_four_node(
+        self, point_list: list, mag_list: list, shape_func_list: list
+    ) -> np.ndarray:
+        """Assign multiple point loads to nodes of grids, locating all points in one call of locate_points()"""
+        nodal_load, _ = self._get_point_nodal_loads(
+            point_list, mag_list, shape_func_list
+        )
+        return sum_nodal_loads([nodal_load])
 
-        load_str = []
-        if shape_func == "hermite":
-            for count, node in enumerate(sorted_node_tag):
-                load_str.append(
-                    "ops.load({pt}, *{val})\n".format(
-                        pt=node,
-                        val=[0, node_load[count], 0, node_mx[count], 0, node_mz[count]],
-                    )
-                )
-        else:
-            for count, node in enumerate(sorted_node_tag):
-                load_str.append(
-                    "ops.load({pt}, *{val})\n".format(
-                        pt=node, val=[0, node_load[count], 0, 0, 0, 0]
-                    )
-                )
-        return load_str
+    def _get_point_nodal_loads(
+        self, point_list: list, mag_list: list, shape_func_list: list
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get nodal loads of each point load, before summing loads of the same node. Returns tuple of nodal load array
+        and index of point load of each row, in order of point_list.
+        """
+        if len(point_list) == 0:
+            return np.zeros((0, 7)), np.zeros(0, dtype=int)
+        points = np.array(point_list, dtype=float)
+        grid, sorted_node, natural_coordinate = self.locate_points(points)
+        mesh = self.Mesh_obj
+        mag = np.array(mag_list, dtype=float)
+        located = np.flatnonzero(grid >= 0)
+        # nodal weights [Nv, Nmx, Nmz] of each point on sorted nodes of grid, taken from the cache of weights where
+        # possible. Weights are translation invariant, hence keyed on the congruence class of grid, position of point
+        # relative to the first sorted vertex of grid, and the shape function
+        weight = np.zeros((len(grid), 3, 4))
+        relative = (
+            np.round(
+                points[located][:, [0, 2]]
+                - mesh.grid_sorted_vertex_array[grid[located], 0],
+                mesh.grid_shape_decimal,
+            )
+            + 0.0
+        )
+        key_list = [
+            (mesh.grid_shape_class[grid[count]], dx, dz, shape_func_list[count])
+            for count, (dx, dz) in zip(located, relative.tolist())
+        ]
+        miss_list = []
+        miss_key_list = []
+        for count, key in zip(located, key_list):
+            cached_weight = self._point_weight_cache.get(key)
+            if cached_weight is None:
+                miss_list.append(count)
+                miss_key_list.append(key)
+            else:
+                weight[count] = cached_weight
+        miss = np.array(miss_list, dtype=int)
+        # quadrilateral grids - map natural coordinates of points to shape functions
+        quad = miss[sorted_node[miss, 3] >= 0]
+        eta, zeta = natural_coordinate[quad].T
+        Nv = np.array(ShapeFunction.linear_shape_function(eta, zeta)).T
+        Nv_hermite, Nmx, Nmz = [
+            np.array(N).T for N in ShapeFunction.hermite_shape_function_2d(eta, zeta)
+        ]
+        quad_hermite = np.array(
+            [shape_func_list[count] == "hermite" for count in quad], dtype=bool
+        )[:, None]
+        weight[quad, 0] = np.where(quad_hermite, Nv_hermite, Nv)
+        weight[quad, 1] = np.where(quad_hermite, Nmx, 0)
+        weight[quad, 2] = np.where(quad_hermite, Nmz, 0)
+        # corner or edge grid with 3 nodes, run specific assignment for triangular grids
+        for count in miss[sorted_node[miss, 3] < 0]:
+            sorted_vertex = mesh.grid_sorted_vertex_array[grid[count]]
+            weight[count, 0, :3] = ShapeFunction.linear_triangular(
+                x=point_list[count][0],
+                z=point_list[count][2],
+                x1=sorted_vertex[0, 0],
+                z1=sorted_vertex[0, 1],
+                x2=sorted_vertex[1, 0],
+                z2=sorted_vertex[1, 1],
+                x3=sorted_vertex[2, 0],
+                z3=sorted_vertex[2, 1],
+            )
+        for count, key in zip(miss_list, miss_key_list):
+            self._point_weight_cache[key] = weight[count].copy()
+        # nodal load array, each row is [node_tag, Fx, Fy, Fz, Mx, My, Mz]
+        nodal_load = np.zeros((4 * len(located), 7))
+        nodal_load[:, 0] = sorted_node[located].ravel()
+        nodal_load[:, 2] = (mag[located, None] * weight[located, 0]).ravel()
+        nodal_load[:, 4] = (mag[located, None] * weight[located, 1]).ravel()
+        nodal_load[:, 6] = (mag[located, None] * weight[located, 2]).ravel()
+        # points outside mesh (grid = -1) are not assigned, nor the missing fourth node of triangular grids
+        assigned = nodal_load[:, 0] >= 0
+        return nodal_load[assigned], np.repeat(located, 4)[assigned]
 
     # Setter for Line loads and above
     def _assign_line_to_four_node(
         self, line_load_obj, line_grid_intersect, line_ele_colinear
-    ) -> list:
+    ) -> np.ndarray:
         # Function to assign line load to mesh. Procedure to assign line load is as follows:
         # . get properties of line on the grid
         # . convert line load to equivalent point load
         # . Find position of equivalent point load
         # . Runs assignment for point loads function (assign_point_to_four_node) using equivalent point load
 
+        # equivalent point loads of line load, assigned to nodes together in a single call
+        point_list = []
+        mag_list = []
+        shape_func_list = []
         # loop each grid
-        load_str_line = []
         for grid, points in line_grid_intersect.items():
             if (
                 "ends" not in points.keys()
@@ -1608,11 +1775,10 @@ class OspGrillage:
                 xbar=x_bar, point_coordinate=[p2[0], self.y_elevation, p2[2]]
             )
 
-            # uses point load assignment function to assign load point and mag to four nodes in grid
-            load_str = self._assign_load_to_four_node(
-                point=load_point, mag=W, shape_func=line_load_obj.shape_function
-            )
-            load_str_line += load_str  # append to major list for line load
+            # store equivalent point load, to be assigned to four nodes in grid
+            point_list.append(list(load_point)[:3])
+            mag_list.append(W)
+            shape_func_list.append(line_load_obj.shape_function)
 
         # loop through all colinear elements
         # for each colinear element, assign line load to two nodes of element
@@ -1634,13 +1800,24 @@ class OspGrillage:
                 load_point = line_load_obj.get_point_given_distance(
                     xbar=x_bar, point_coordinate=[p2.x, p2.y, p2.z]
                 )
-                load_str = self._assign_load_to_four_node(point=load_point, mag=mag)
-                load_str_line += load_str  # append to major list for line load
+                point_list.append(list(load_point)[:3])
+                mag_list.append(mag)
+                shape_func_list.append("linear")
                 assigned_ele.append(ele[0])
-        return load_str_line
+        # uses point load assignment function to assign load points and mags to nodes of grids
+        return self._assign_points_to_four_node(
+            point_list=point_list, mag_list=mag_list, shape_func_list=shape_func_list
+        )
+
+    def _get_ele_node_coordinates(self, ele_list: list) -> np.ndarray:
+        """Get coordinates of node i and j of elements in ele_list, as array (k, 2, 3) from the compact node storage"""
+        return self.Mesh_obj.get_node_coordinates(
+            [node for ele in ele_list for node in ele[1:3]]
+        ).reshape(-1, 2, 3)
 
-    def _assign_beam_ele_line_load(self, line_load_obj: LineLoading) -> list:
-        load_str_line = []
+    def _assign_beam_ele_line_load(self, line_load_obj: LineLoading) -> np.ndarray:
+        point_list = []  # equivalent point loads on elements
+        mag_list = []
         ele_group = []
         width_dict = None
         if line_load_obj.long_beam_ele_load_flag:
@@ -1649,13 +1826,14 @@ class OspGrillage:
         elif line_load_obj.trans_beam_ele_load_flag:
             ele_group = self.Mesh_obj.trans_ele
             width_dict = self.Mesh_obj.node_width_x_dict
-        for ele in ele_group:
+        ele_group = list(ele_group)
+        for ele, (p1_list, p2_list) in zip(
+            ele_group, self._get_ele_node_coordinates(ele_group)
+        ):
             if ele[3] != 0:  # exclude edge beams
                 p1 = ele[1]  # node tag i
                 p2 = ele[2]  # node tag j
                 # convert to point load tuple
-                p1_list = self.Mesh_obj.node_spec[p1]["coordinate"]
-                p2_list = self.Mesh_obj.node_spec[p2]["coordinate"]
                 p1_point = create_point(x=p1_list[0], z=p1_list[2])
                 p2_point = create_point(x=p2_list[0], z=p2_list[2])
                 L = get_distance(
@@ -1673,29 +1851,44 @@ class OspGrillage:
                 load_point = line_load_obj.get_point_given_distance(
                     xbar=x_bar, point_coordinate=[p2_point.x, p2_point.y, p2_point.z]
                 )
-                load_str = self._assign_load_to_four_node(point=load_point, mag=mag)
-                load_str_line += load_str  # append to major list for line load
+                point_list.append(list(load_point)[:3])
+                mag_list.append(mag)
 
-        return load_str_line
+        return self._assign_points_to_four_node(
+            point_list=point_list,
+            mag_list=mag_list,
+            shape_func_list=["linear"] * len(point_list),
+        )
 
     # setter for patch loads
-    def _assign_patch_load(self, patch_load_obj: PatchLoading) -> list:
+    def _assign_patch_load(self, patch_load_obj: PatchLoading) -> np.ndarray:
         # searches grid that encompass the patch load
-        # use getter for line load, 4 times for each point
+        # use getter for line load, once for each edge of patch
         # between 4 dictionaries record the common grids as having the corners of the patch - to be evaluated different
         bound_node, bound_grid = self._get_bounded_nodes(patch_load_obj)
-        patch_load_str = []  # final return str list
+        # patch magnitude of all bounded nodes, interpolated in a single call
+        bound_coordinate = self.Mesh_obj.node_coordinate_array[
+            [self.Mesh_obj.node_tag_to_row[tag] for tag in bound_node]
+        ].reshape(-1, 3)
+        node_mag = dict(
+            zip(
+                bound_node,
+                patch_load_obj.patch_mag_interpolate(
+                    bound_coordinate[:, 0], bound_coordinate[:, 2]
+                ).tolist(),
+            )
+        )
+        # equivalent point loads of patch on each grid, assigned to nodes together in a single call
+        point_list = []
+        mag_list = []
         # assign patch for grids fully bounded by patch
         for grid in bound_grid:
             nodes = self.Mesh_obj.grid_number_dict[grid]  # read grid nodes
             # get p value of each node
-            p_list = []
-            for tag in nodes:
-                coord = self.Mesh_obj.node_spec[tag]["coordinate"]
-                p = patch_load_obj.patch_mag_interpolate(coord[0], coord[2])[
-                    0
-                ]  # object function returns array like
-                p_list.append(LoadPoint(coord[0], coord[1], coord[2], p))
+            p_list = [
+                LoadPoint(*coord, node_mag[tag])
+                for tag, coord in zip(nodes, self.Mesh_obj.get_node_coordinates(nodes))
+            ]
             # get centroid of patch on grid
             xc, yc, zc = get_patch_centroid(p_list)
             inside_point = Point(xc, yc, zc)
@@ -1703,46 +1896,41 @@ class OspGrillage:
             A = self._get_node_area(inside_point=inside_point, p_list=p_list)
             # _, A = calculate_area_given_four_points(inside_point, p_list[0], p_list[1], p_list[2], p_list[3])
             mag = A * sum([point.p for point in p_list]) / len(p_list)
-            # assign point and mag to 4 nodes of grid
-            load_str = self._assign_load_to_four_node(
-                point=[xc, yc, zc], mag=mag, shape_func=patch_load_obj.shape_function
-            )
-            patch_load_str += load_str
+            # store point and mag to be assigned to 4 nodes of grid
+            point_list.append([xc, yc, zc])
+            mag_list.append(mag)
         # apply patch for full bound grids completed
 
-        # search the intersecting grids using line load function
-        intersect_grid_1, _ = self._get_line_load_nodes(
-            list_of_load_vertices=[
-                patch_load_obj.load_point_1,
-                patch_load_obj.load_point_2,
-            ]
-        )
-        intersect_grid_2, _ = self._get_line_load_nodes(
-            list_of_load_vertices=[
-                patch_load_obj.load_point_2,
-                patch_load_obj.load_point_3,
-            ]
-        )
-        intersect_grid_3, _ = self._get_line_load_nodes(
-            list_of_load_vertices=[
-                patch_load_obj.load_point_3,
-                patch_load_obj.load_point_4,
-            ]
-        )
-        intersect_grid_4, _ = self._get_line_load_nodes(
-            list_of_load_vertices=[
-                patch_load_obj.load_point_4,
-                patch_load_obj.load_point_1,
-            ]
-        )
-        # merging process of the intersect grid dicts
-        merged = check_dict_same_keys(intersect_grid_1, intersect_grid_2)
-        merged = check_dict_same_keys(merged, intersect_grid_3)
-        merged = check_dict_same_keys(merged, intersect_grid_4)
+        # search the intersecting grids using line load function, for each edge of patch
+        vertices = patch_load_obj.get_patch_vertices()
+        merged = dict()
+        for vertex_1, vertex_2 in zip(vertices, vertices[1:] + vertices[:1]):
+            intersect_grid, _ = self._get_line_load_nodes(
+                list_of_load_vertices=[vertex_1, vertex_2]
+            )
+            # merging process of the intersect grid dicts
+            merged = check_dict_same_keys(merged, intersect_grid)
         self.global_patch_int_dict.update(
             merged
         )  # save intersect grid dict to global dict
 
+        # patch magnitude of all intersection points, interpolated in a single call
+        int_point_array = np.array(
+            [
+                int_point
+                for int_point_list in merged.values()
+                for int_list in int_point_list.values()
+                for int_point in int_list
+                if int_point != []
+            ],
+            dtype=float,
+        ).reshape(-1, 3)
+        int_mag_iter = iter(
+            patch_load_obj.patch_mag_interpolate(
+                int_point_array[:, 0], int_point_array[:, 2]
+            ).tolist()
+        )
+
         # all lines are ordered in path counter clockwise - sorted hereafter via sort_vertices
         # get nodes in grid that are left (check inside variable greater than 0)
         for grid, int_point_list in merged.items():  # [x y z]
@@ -1755,28 +1943,22 @@ class OspGrillage:
             ]
             node_list = int_point_list  # sort
             p_list = []
-            # loop each int points - add extract coordinates, get patch magnitude using interpolation ,
+            # loop each int points - add extract coordinates, get interpolated patch magnitude ,
             # convert coordinate to namedtuple Loadpoint and append to point list p_list
             for int_list in int_point_list.values():
                 for int_point in int_list:  # [x y z]
-                    p = (
-                        patch_load_obj.patch_mag_interpolate(int_point[0], int_point[2])
-                        if int_point != []
-                        else []
-                    )  # object function returns array like
-                    # p is array object, extract
                     p_list.append(
-                        LoadPoint(int_point[0], int_point[1], int_point[2], p[0])
+                        LoadPoint(
+                            int_point[0], int_point[1], int_point[2], next(int_mag_iter)
+                        )
                         if int_point != []
                         else []
                     )
             # loop each node in grid points
-            for items in node_in_grid:
-                coord = self.Mesh_obj.node_spec[items]["coordinate"]
-                p = patch_load_obj.patch_mag_interpolate(coord[0], coord[2])[
-                    0
-                ]  # object function returns array like
-                p_list.append(LoadPoint(coord[0], coord[1], coord[2], p))
+            for items, coord in zip(
+                node_in_grid, self.Mesh_obj.get_node_coordinates(node_in_grid)
+            ):
+                p_list.append(LoadPoint(*coord, node_mag[items]))
             # Loop each p_list object to find duplicates if any, remove duplicate
             for count, point in enumerate(p_list):
                 dupe = [point == val for val in p_list]
@@ -1792,12 +1974,14 @@ class OspGrillage:
             # _, A = calculate_area_given_four_points(inside_point, p_list[0], p_list[1], p_list[2], p_list[3])
             A = self._get_node_area(inside_point=inside_point, p_list=p_list)
             mag = A * sum([point.p for point in p_list]) / len(p_list)
-            # assign point and mag to 4 nodes of grid
-            load_str = self._assign_load_to_four_node(
-                point=[xc, yc, zc], mag=mag, shape_func=patch_load_obj.shape_function
-            )
-            patch_load_str += load_str
-        return patch_load_str
+            # store point and mag to be assigned to 4 nodes of grid
+            point_list.append([xc, yc, zc])
+            mag_list.append(mag)
+        return self._assign_points_to_four_node(
+            point_list=point_list,
+            mag_list=mag_list,
+            shape_func_list=[patch_load_obj.shape_function] * len(point_list),
+        )
 
     @staticmethod
     def _get_node_area(inside_point, p_list) -> float:
@@ -1808,119 +1992,120 @@ class OspGrillage:
     #  functions to add load case and load combination
     def _distribute_load_types_to_model(
         self, load_case_obj: Union[LoadCase, CompoundLoad]
-    ) -> list:
+    ) -> np.ndarray:
         global load_groups
-        load_str = []
         # check the input parameter type, set load_groups parameter according to its type
         if isinstance(load_case_obj, LoadCase):
             load_groups = load_case_obj.load_groups
         elif isinstance(load_case_obj.load_groups[0]["load"], CompoundLoad):
             load_groups = load_case_obj.load_groups[0]["load"].compound_load_obj_list
-        # loop through each load object
-        load_str = []
+        # flatten load objects of load groups (and load objects within compound loads), point loads (e.g. wheels of
+        # compound vehicle loads) are located and assigned together
+        load_list = []
+        point_list = []
+        mag_list = []
+        shape_func_list = []
         for load_dict in load_groups:
             load_obj = load_dict["load"]
-            # if compound load, distribute each individual load types within the compound load
-            if isinstance(load_obj, CompoundLoad):
-                # load_obj is a Compound load class, start a nested loop through each load class within compound load
-                # nested loop through each load in compound load, assign and get
-                for nested_list_of_load in load_obj.compound_load_obj_list:
-                    if isinstance(nested_list_of_load, NodalLoad):
-                        load_str += nested_list_of_load.get_nodal_load_str()
-                    elif isinstance(nested_list_of_load, PointLoad):
-                        load_str += self._assign_load_to_four_node(
-                            point=list(nested_list_of_load.load_point_1)[:-1],
-                            mag=nested_list_of_load.load_point_1.p,
-                            shape_func=nested_list_of_load.shape_function,
-                        )
-                    elif isinstance(nested_list_of_load, LineLoading):
-                        if any(
-                            [
-                                nested_list_of_load.long_beam_ele_load_flag,
-                                nested_list_of_load.trans_beam_ele_load_flag,
-                            ]
-                        ):
-                            load_str += self._assign_beam_ele_line_load(
-                                line_load_obj=nested_list_of_load
-                            )
-                        else:
-                            (
-                                line_grid_intersect,
-                                line_ele_colinear,
-                            ) = self._get_line_load_nodes(
-                                line_load_obj=nested_list_of_load
-                            )  # returns self.line_grid_intersect
-                            self.global_line_int_dict.append(line_grid_intersect)
-                            load_str += self._assign_line_to_four_node(
-                                nested_list_of_load,
-                                line_grid_intersect=line_grid_intersect,
-                                line_ele_colinear=line_ele_colinear,
-                            )
-                    elif isinstance(nested_list_of_load, PatchLoading):
-                        load_str += self._assign_patch_load(nested_list_of_load)
-            # else, a single load type, assign it as it is
-            else:
-                # run single assignment of load type (load_obj is a load class)
-                if isinstance(load_obj, NodalLoad):
-                    load_str += [
-                        load_obj.get_nodal_load_str()
-                    ]  # here return load_str as list with single element
-                elif isinstance(load_obj, PointLoad):
-                    load_str += self._assign_load_to_four_node(
-                        point=list(load_obj.load_point_1)[:-1],
-                        mag=load_obj.load_point_1.p,
-                        shape_func=load_obj.shape_function,
+            nested_list_of_load = (
+                load_obj.compound_load_obj_list
+                if isinstance(load_obj, CompoundLoad)
+                else [load_obj]
+            )
+            for nested_load in nested_list_of_load:
+                if isinstance(nested_load, PointLoad):
+                    point_list.append(list(nested_load.load_point_1)[:-1])
+                    mag_list.append(nested_load.load_point_1.p)
+                    shape_func_list.append(nested_load.shape_function)
+                else:
+                    load_list.append(nested_load)
+        return self._distribute_loads(load_list, point_list, mag_list, shape_func_list)
+
+    def _distribute_loads(
+        self, load_list: list, point_list: list, mag_list: list, shape_func_list: list
+    ) -> np.ndarray:
+        """Distribute load objects in load_list, and point loads given by point_list, to nodes of mesh"""
+        # loop through each load object, store nodal load arrays of each load type
+        load_str = []
+        for load_obj in load_list:
+            if isinstance(load_obj, NodalLoad):
+                load_str.append(load_obj.get_nodal_load_array())
+            elif isinstance(load_obj, LineLoading):
+                if any(
+                    [
+                        load_obj.long_beam_ele_load_flag,
+                        load_obj.trans_beam_ele_load_flag,
+                    ]
+                ):
+                    load_str.append(
+                        self._assign_beam_ele_line_load(line_load_obj=load_obj)
                     )
-                elif isinstance(load_obj, LineLoading):
-                    if any(
-                        [
-                            load_obj.long_beam_ele_load_flag,
-                            load_obj.trans_beam_ele_load_flag,
-                        ]
-                    ):
-                        load_str += self._assign_beam_ele_line_load(
-                            line_load_obj=load_obj
-                        )
-                    else:
-                        (
-                            line_grid_intersect,
-                            line_ele_colinear,
-                        ) = self._get_line_load_nodes(
-                            line_load_obj=load_obj
-                        )  # returns self.line_grid_intersect
-                        self.global_line_int_dict.append(line_grid_intersect)
-                        load_str += self._assign_line_to_four_node(
+                else:
+                    (
+                        line_grid_intersect,
+                        line_ele_colinear,
+                    ) = self._get_line_load_nodes(
+                        line_load_obj=load_obj
+                    )  # returns self.line_grid_intersect
+                    self.global_line_int_dict.append(line_grid_intersect)
+                    load_str.append(
+                        self._assign_line_to_four_node(
                             load_obj,
                             line_grid_intersect=line_grid_intersect,
                             line_ele_colinear=line_ele_colinear,
                         )
-                elif isinstance(load_obj, PatchLoading):
-                    load_str += self._assign_patch_load(load_obj)
-
-        return load_str
+                    )
+            elif isinstance(load_obj, PatchLoading):
+                load_str.append(self._assign_patch_load(load_obj))
+        load_str.append(
+            self._assign_points_to_four_node(
+                point_list=point_list,
+                mag_list=mag_list,
+                shape_func_list=shape_func_list,
+            )
+        )
+        # sum nodal loads of all load types - single array of [node_tag, Fx, Fy, Fz, Mx, My, Mz] per loaded node
+        return sum_nodal_loads(load_str)
 
     # ---------------------------------------------------------------
     # interface functions for load analysis utilities
     def add_load_case(
-        self, load_case_obj: Union[LoadCase, MovingLoad], load_factor=1
+        self,
+        load_case_obj: Union[LoadCase, MovingLoad],
+        load_factor=1,
+        workers: int = None,
     ) -> None:
         """
-        Function to add load cases to Ospllage grillage model. Function also adds moving load cases
+        Function to add load cases to Ospllage grillage model. Function also adds moving load cases. Loads of the
+        load case are not distributed to the mesh here - distribution is deferred to
+        :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`, which distributes only the selected load cases.
+
+        For a moving load, one load case dict is stored in moving_load_case_dict for each increment, with
+        ``"loadcase": None`` - the LoadCase of an increment is created on demand with
+        :func:`~ospgrillage.load.MovingLoad.get_increment_load_case`.
 
         :param load_factor: Optional load factor for the prescribed load case. Default = 1
         :param load_case_obj: LoadCase or MovingLoad object
         :type load_case_obj: LoadCase,MovingLoad
+        :param workers: Optional number of worker processes to distribute loads of moving load increments. Each worker
+                        receives a copy of the mesh, and its nodal loads and records of line and patch intersections
+                        are merged in order of increments. Default None (single process)
+        :type workers: int
+
+        .. note::
+            Nodal weights of point loads (e.g. wheels of a moving load) are cached during the distribution of a load
+            case and reused for points at the same position relative to congruent grids. The cache is cleared once the
+            load case is distributed. Line and patch loads are not cached, and are distributed for each increment of
+            a moving load.
 
         """
 
         if isinstance(load_case_obj, LoadCase):
-            # update the load command list of load case object
-            load_str = self._distribute_load_types_to_model(load_case_obj=load_case_obj)
-            # store load case + load command in dict and add to load_case_list
+            # store load case in dict and add to load_case_list, load command is set on distribution
             load_case_dict = {
                 "name": load_case_obj.name,
                 "loadcase": deepcopy(load_case_obj),
-                "load_command": load_str,
+                "load_command": None,  # distributed on demand, see _distribute_load_cases()
                 "load_factor": load_factor,
             }  # FORMATTING HERE
 
@@ -1931,26 +2116,24 @@ class OspGrillage:
             # get the list of individual load cases
             list_of_incr_load_case_dict = []
             moving_load_obj = load_case_obj
-            # object method to create incremental load cases representing the position of the load
+            # object method to parse increments of the moving load - base load geometry and offsets of increments
             moving_load_obj.parse_moving_load_cases()
 
-            # for each load case, find the load commands of load distribution
-            for moving_load_case_list in moving_load_obj.moving_load_case:
-                for increment_load_case in moving_load_case_list:
-                    load_str = self._distribute_load_types_to_model(
-                        load_case_obj=increment_load_case
-                    )
+            for moving_load_group in moving_load_obj.moving_load_case:
+                for increment_name in moving_load_group["name"]:
                     increment_load_case_dict = {
-                        "name": increment_load_case.name,
-                        "loadcase": increment_load_case,
-                        "load_command": load_str,
+                        "name": increment_name,
+                        "loadcase": None,  # created on demand, see MovingLoad.query()
+                        "load_command": None,  # distributed on demand, see _distribute_load_cases()
                         "load_factor": load_factor,
                     }
                     list_of_incr_load_case_dict.append(increment_load_case_dict)
-                self.moving_load_case_dict[
-                    moving_load_obj.name
-                ] = list_of_incr_load_case_dict
-                
+            self.moving_load_case_dict[
+                moving_load_obj.name
+            ] = list_of_incr_load_case_dict
+            # shallow copy keeps parsed increments of moving load, should the moving load be parsed again later
+            self.moving_load_obj_dict[moving_load_obj.name] = copy(moving_load_obj)
+            self.moving_load_workers_dict[moving_load_obj.name] = workers
 
             if self.diagnostics:
                 print("Moving load case: {} created".format(moving_load_obj.name))
@@ -1959,31 +2142,163 @@ class OspGrillage:
                 "Input of add_load_case not a valid object. Hint:accepts only LoadCase or MovingLoad "
                 "objects"
             )
-    
-    def analyze(self, **kwargs) -> None:
+
+    def _distribute_load_cases(
+        self, basic_lc_list: list, moving_load_lc_dict: dict = None
+    ) -> None:
         """
-        Function to analyze defined load
+        Function to distribute loads of load cases added by
+        :func:`~ospgrillage.osp_grillage.OspGrillage.add_load_case` to nodes of the mesh. Nodal load arrays are stored
+        in "load_command" of the load case dicts, load cases which are already distributed are skipped.
 
-        :keyword:
+        :param basic_lc_list: list of load case dict of basic load cases
+        :param moving_load_lc_dict: dict of moving load name and list of load case dict of its increments
+        """
+        for load_case_dict in basic_lc_list:
+            if load_case_dict["load_command"] is None:
+                load_case_dict["load_command"] = self._distribute_load_types_to_model(
+                    load_case_obj=load_case_dict["loadcase"]
+                )
+        self._point_weight_cache = dict()
+        if not moving_load_lc_dict:
+            return
+        for ml_name, load_case_dict_list in moving_load_lc_dict.items():
+            if all(
+                [
+                    load_case_dict["load_command"] is not None
+                    for load_case_dict in load_case_dict_list
+                ]
+            ):
+                continue
+            moving_load_obj = self.moving_load_obj_dict[ml_name]
+            # increment load case dicts are in order of load groups, then of steps along path
+            task_list = [
+                (group_index, step)
+                for group_index, moving_load_group in enumerate(
+                    moving_load_obj.moving_load_case
+                )
+                for step in range(len(moving_load_group["name"]))
+            ]
+            num_workers = self.moving_load_workers_dict.get(ml_name, None)
+            if num_workers and num_workers > 1 and len(task_list) > 1:
+                load_command_list = self._distribute_increments_parallel(
+                    moving_load_obj, task_list, num_workers
+                )
+            else:
+                load_command_list = self._distribute_increments(
+                    moving_load_obj, task_list
+                )
+            for load_case_dict, load_command in zip(
+                load_case_dict_list, load_command_list
+            ):
+                load_case_dict["load_command"] = load_command
+            if self.diagnostics:
+                print("Moving load case: {} distributed".format(ml_name))
 
-        * all (`bool`): If True, runs all load cases. If not provided, default to True.
-        * load_case ('list' or 'str'): String or list of name strings for selected load case to be analyzed.
-        * set_verbose(`bool`): If True, incremental load case report is not printed to terminal (default True)
+    def _distribute_increments(
+        self, moving_load_obj: MovingLoad, task_list: list
+    ) -> list:
+        """
+        Function to distribute loads of moving load increments to nodes of the mesh. Point loads of all increments of a
+        load group are located in a single call of :func:`locate_points`.
 
-        :except: raise ValueError if missing arguments for either load_case=, or all=
+        :param moving_load_obj: MovingLoad object, parsed
+        :param task_list: list of tuple of (load group index, step) of increments
+        :returns: list of nodal load arrays, in order of task_list
+        """
+        # cache of nodal weights is scoped to the distribution of the moving load
+        self._point_weight_cache = dict()
+        load_command_list = []
+        for group_index, group_tasks in groupby(task_list, key=lambda task: task[0]):
+            increment_loads = [
+                moving_load_obj.get_increment_loads(group_index, step)
+                for _, step in group_tasks
+            ]
+            # locate point loads (e.g. wheels) of all increments of the load group in one call
+            point = np.vstack([inc_point for _, inc_point, _ in increment_loads])
+            nodal_load, point_index = self._get_point_nodal_loads(
+                point[:, :3],
+                point[:, 3],
+                [func for _, _, func_list in increment_loads for func in func_list],
+            )
+            # rows are in order of points, hence of increments - split rows by increment
+            increment_index = np.repeat(
+                np.arange(len(increment_loads)),
+                [len(inc_point) for _, inc_point, _ in increment_loads],
+            )[point_index]
+            point_nodal_load_list = np.split(
+                nodal_load,
+                np.searchsorted(increment_index, np.arange(1, len(increment_loads))),
+            )
+            for (load_list, _, _), point_nodal_load in zip(
+                increment_loads, point_nodal_load_list
+            ):
+                load_command_list.append(
+                    sum_nodal_loads(
+                        [
+                            self._distribute_loads(
+                                load_list,
+                                point_list=[],
+                                mag_list=[],
+                                shape_func_list=[],
+                            ),
+                            point_nodal_load,
+                        ]
+                    )
+                )
+        self._point_weight_cache = dict()
+        return load_command_list
 
+    def _distribute_increments_parallel(
+        self, moving_load_obj: MovingLoad, task_list: list, num_workers: int
+    ) -> list:
         """
-        print("inside analyze function")
-        # analyze all load case defined in self.load_case_dict for OspGrillage instance
-        # loop each load case dict
-        # get run options from kwargs
-        all_flag = True  # Default true
-        selected_load_case: list = kwargs.get("load_case", None)  #selected load case hwich will run, since we dont choose particular ones, all_flag wala statement runs
+        Function to distribute loads of moving load increments on a pool of worker processes. Load distribution does
+        not use the OpenSees model space, hence each worker receives only a snapshot of the mesh (see
+        :func:`_distribute_increment_slice`) and distributes a contiguous slice of increments.
 
-        # check if any load cases are defined
-        if self.load_case_list == [] and self.moving_load_case_dict == {}: # load case defined from add_load_case function final results
-            raise Exception("No load cases were defined")
+        :returns: list of nodal load arrays, in order of task_list
+        """
+        distribution_state = {
+            "Mesh_obj": self.Mesh_obj,
+            "y_elevation": self.y_elevation,
+        }
+        # split into contiguous slices, one per worker - increments of a load group are located in one call
+        num_workers = min(num_workers, len(task_list))
+        slice_size = math.ceil(len(task_list) / num_workers)
+        task_slices = [
+            task_list[i : i + slice_size] for i in range(0, len(task_list), slice_size)
+        ]
+        load_command_list = []
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            for (
+                load_command_slice,
+                line_int_list,
+                patch_int_dict,
+            ) in executor.map(
+                partial(
+                    _distribute_increment_slice,
+                    type(self),
+                    distribution_state,
+                    moving_load_obj,
+                ),
+                task_slices,
+            ):
+                # merge records of line and patch intersections in order of increments, as in serial distribution
+                load_command_list += load_command_slice
+                self.global_line_int_dict += line_int_list
+                self.global_patch_int_dict.update(patch_int_dict)
+        return load_command_list
+
+    def _select_load_cases(self, selected_load_case=None):
+        """
+        Function to select load cases by name. If selected_load_case is None, all load cases are selected.
 
+        :param selected_load_case: String or list of name strings of load cases
+        :returns: tuple of list of selected basic load case dict, and dict of selected moving load name and list of
+                  load case dict of its increments
+        """
+        all_flag = True  # Default true
         if selected_load_case:
             all_flag = False  # overwrite all flag to be false
         selected_moving_load_lc_list = None
@@ -2029,6 +2344,83 @@ class OspGrillage:
             raise Exception(
                 "missing kwargs for run options: hint: requires input for `load_case=`"
             )
+        return selected_basic_lc, selected_moving_load_lc_list
+
+    def distribute_load_cases(self, **kwargs) -> None:
+        """
+        Function to distribute loads of load cases to nodes of the mesh. Distribution is otherwise deferred to
+        :func:`~ospgrillage.osp_grillage.OspGrillage.analyze`. Use this function to inspect distributed loads (e.g.
+        "load_command" of load case dicts, or intersections of line loads in global_line_int_dict) before analysis.
+
+        :keyword:
+
+        * load_case ('list' or 'str'): String or list of name strings for selected load case to be distributed. If not
+          provided, all load cases are distributed.
+
+        """
+        self._distribute_load_cases(
+            *self._select_load_cases(kwargs.get("load_case", None))
+        )
+
+    def analyze(self, **kwargs) -> None:
+        """
+        Function to analyze defined load. Loads of the selected load cases are distributed to the mesh on the first
+        analysis, and reused on later analyses.
+
+        :keyword:
+
+        * all (`bool`): If True, runs all load cases. If not provided, default to True.
+        * load_case ('list' or 'str'): String or list of name strings for selected load case to be analyzed.
+        * set_verbose(`bool`): If True, incremental load case report is not printed to terminal (default True)
+        * factor_once (`bool`): If True, runs a linear static analysis where the stiffness matrix is assembled and
+          factorised once, and all selected load cases (including moving load increments) are solved by
+          back-substitution against the same factorisation. Default False.
+        * influence_surfaces (`bool`): If True, responses of selected load cases are evaluated from the unit load
+          responses computed by :func:`~ospgrillage.osp_grillage.OspGrillage.compute_influence_surfaces` instead of
+          running OpenSees analysis. Default False.
+        * parallel (`int`): Number of worker processes. If provided, selected load cases (including moving load
+          increments) are split among the workers, each rebuilding the model from the model commands and analyzing
+          its slice of load cases. Results are merged in the original load case order. Default None (single process)
+
+        :except: raise ValueError if missing arguments for either load_case=, or all=
+
+        """
+        print("inside analyze function")
+        # analyze all load case defined in self.load_case_dict for OspGrillage instance
+        # loop each load case dict
+        # get run options from kwargs
+        selected_load_case: list = kwargs.get("load_case", None)  #selected load case hwich will run, since we dont choose particular ones, all_flag wala statement runs
+        factor_once = kwargs.get("factor_once", False)
+        influence_flag = kwargs.get("influence_surfaces", False)
+        parallel = kwargs.get("parallel", None)
+        if influence_flag and self.influence_surfaces is None:
+            raise Exception(
+                "Influence surfaces not computed: Hint: run compute_influence_surfaces() first"
+            )
+        # flag for analysis objects in ops model space, set after the first load case is solved if factor_once
+        analysis_set_up = False
+
+        # check if any load cases are defined
+        if self.load_case_list == [] and self.moving_load_case_dict == {}: # load case defined from add_load_case function final results
+            raise Exception("No load cases were defined")
+
+        (
+            selected_basic_lc,
+            selected_moving_load_lc_list,
+        ) = self._select_load_cases(selected_load_case)
+
+        # distribute loads of selected load cases, previously distributed load cases are not redone
+        self._distribute_load_cases(selected_basic_lc, selected_moving_load_lc_list)
+
+        # run load cases on worker processes
+        if parallel and not influence_flag:
+            self._analyze_parallel(
+                selected_basic_lc,
+                selected_moving_load_lc_list,
+                num_workers=parallel,
+                factor_once=factor_once,
+            )
+            return
 
         # run basic load case
         for load_case_dict in selected_basic_lc:
@@ -2045,7 +2437,11 @@ class OspGrillage:
                 node_counter=self.Mesh_obj.node_counter,
                 ele_counter=self.Mesh_obj.element_counter,
                 constraint_type=self.constraint_type,
+                numberer=self.numberer,
+                system=self.system,
                 load_case=load_case_obj,
+                factor_once=factor_once,
+                setup_analysis=not analysis_set_up,
             )
             load_case_analysis.add_load_command(load_command, load_factor=load_factor)
             # run the Analysis object, collect results, and store Analysis object in the list for Analysis load case
@@ -2055,7 +2451,12 @@ class OspGrillage:
                 node_disp,
                 ele_force,
                 self.analysis_command,
-            ) = load_case_analysis.evaluate_analysis()
+            ) = (
+                load_case_analysis.evaluate_influence_surfaces(self.influence_surfaces)
+                if influence_flag
+                else load_case_analysis.evaluate_analysis()
+            )
+            analysis_set_up = factor_once
 
             # print to terminal
             if self.diagnostics:
@@ -2073,7 +2474,7 @@ class OspGrillage:
                     load_command = load_case_dict["load_command"]
                     load_factor = load_case_dict["load_factor"]
                     incremental_analysis = Analysis(
-                        analysis_name=load_case_obj.name,
+                        analysis_name=load_case_dict["name"],
                         ops_grillage_name=self.model_name,
                         pyfile=self.pyfile,
                         time_series_counter=self.global_time_series_counter,
@@ -2081,7 +2482,11 @@ class OspGrillage:
                         node_counter=self.Mesh_obj.node_counter,
                         ele_counter=self.Mesh_obj.element_counter,
                         constraint_type=self.constraint_type,
+                        numberer=self.numberer,
+                        system=self.system,
                         load_case=load_case_obj,
+                        factor_once=factor_once,
+                        setup_analysis=not analysis_set_up,
                     )
                     incremental_analysis.add_load_command(
                         load_command, load_factor=load_factor
@@ -2092,15 +2497,207 @@ class OspGrillage:
                         node_disp,
                         ele_force,
                         self.analysis_command,
-                    ) = incremental_analysis.evaluate_analysis()
+                    ) = (
+                        incremental_analysis.evaluate_influence_surfaces(
+                            self.influence_surfaces
+                        )
+                        if influence_flag
+                        else incremental_analysis.evaluate_analysis()
+                    )
+                    analysis_set_up = factor_once
                     list_of_inc_analysis.append(incremental_analysis)
                     if self.diagnostics:
-                        print("Analysis: {} completed".format(load_case_obj.name))
+                        print("Analysis: {} completed".format(load_case_dict["name"]))
                     # store result in Recorder object
                 self.results.extract_analysis(list_of_inc_analysis=list_of_inc_analysis)
                 if self.diagnostics:
                     print("Analysis: {} completed".format(ml_name))
 
+    def _analyze_parallel(
+        self,
+        selected_basic_lc: list,
+        selected_moving_load_lc_list: dict,
+        num_workers: int,
+        factor_once: bool = False,
+    ):
+        """
+        Function to analyze load cases on a pool of worker processes. OpenSees model space is global to a process,
+        hence each worker rebuilds the model from model_command_list before analyzing its slice of load cases.
+        """
+        if self.pyfile:
+            raise Exception(
+                "Parallel analysis requires OpenSees model instance: Hint: create_osp_model(pyfile=False)"
+            )
+        # flatten load cases to a list of (moving load name or None for basic load case, load case dict)
+        task_list = [(None, load_case_dict) for load_case_dict in selected_basic_lc]
+        if selected_moving_load_lc_list:
+            for ml_name, load_case_dict_list in selected_moving_load_lc_list.items():
+                task_list += [
+                    (ml_name, load_case_dict) for load_case_dict in load_case_dict_list
+                ]
+        if not task_list:
+            return
+        analysis_kwargs = {
+            "ops_grillage_name": self.model_name,
+            "pyfile": False,
+            "node_counter": self.Mesh_obj.node_counter,
+            "ele_counter": self.Mesh_obj.element_counter,
+            "constraint_type": self.constraint_type,
+            "numberer": self.numberer,
+            "system": self.system,
+            "factor_once": factor_once,
+        }
+        # split into contiguous slices, one per worker
+        num_workers = min(num_workers, len(task_list))
+        slice_size = math.ceil(len(task_list) / num_workers)
+        task_slices = [
+            task_list[i : i + slice_size] for i in range(0, len(task_list), slice_size)
+        ]
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            analysis_slices = executor.map(
+                partial(
+                    _analyze_load_case_slice,
+                    self.model_command_list,
+                    analysis_kwargs,
+                ),
+                [
+                    [
+                        {
+                            "name": load_case_dict["name"],
+                            "load_command": load_case_dict["load_command"],
+                            "load_factor": load_case_dict["load_factor"],
+                        }  # load case objects not sent to workers, only load commands are needed
+                        for _, load_case_dict in task_slice
+                    ]
+                    for task_slice in task_slices
+                ],
+            )
+            analysis_list = [
+                analysis_obj
+                for analysis_slice in analysis_slices
+                for analysis_obj in analysis_slice
+            ]
+
+        # merge results in order of load cases
+        moving_load_analysis_dict = dict()
+        for (ml_name, _), analysis_obj in zip(task_list, analysis_list):
+            if ml_name is None:
+                self.results.extract_analysis(analysis_obj=analysis_obj)
+            else:
+                moving_load_analysis_dict.setdefault(ml_name, []).append(analysis_obj)
+            if self.diagnostics:
+                print("Analysis: {} completed".format(analysis_obj.analysis_name))
+        for ml_name, list_of_inc_analysis in moving_load_analysis_dict.items():
+            self.results.extract_analysis(list_of_inc_analysis=list_of_inc_analysis)
+            if self.diagnostics:
+                print("Analysis: {} completed".format(ml_name))
+
+    def compute_influence_surfaces(self, **kwargs):
+        """
+        Function to compute influence surfaces of the grillage model. A unit vertical load (and for Hermite shape
+        function loads, unit moments about x and z axes) is solved at each node of the deck grids, and the responses
+        (node displacements and element forces) are stored as node-to-response matrices. Load cases can then be
+        evaluated by superposition using `analyze(influence_surfaces=True)`, without new OpenSees analysis.
+
+        :keyword:
+
+        * include_moments (`bool`): If True, unit moments Mx and Mz are solved in addition to unit vertical load. Required
+          for loads with Hermite shape function. Default True
+
+        :except: raise Exception if model is in output mode (pyfile=True)
+
+        """
+        if self.pyfile:
+            raise Exception(
+                "Influence surfaces requires OpenSees model instance: Hint: create_osp_model(pyfile=False)"
+            )
+        include_moments = kwargs.get("include_moments", True)
+        load_dofs = [1, 3, 5] if include_moments else [1]  # dof index of Fy, Mx, Mz
+        # nodes of deck grids - where loads are distributed to
+        deck_nodes = sorted(
+            set(
+                node
+                for grid_nodes in self.Mesh_obj.grid_number_dict.values()
+                for node in grid_nodes
+            )
+        )
+        node_tags = list(ops.getNodeTags())
+        ele_tags = list(ops.getEleTags())
+        load_dof_list = [(node, dof) for node in deck_nodes for dof in load_dofs]
+        disp_matrix = np.zeros((6 * len(node_tags), len(load_dof_list)))
+        local_force_matrix = None
+        global_force_matrix = None
+        local_force_slices = []
+        global_force_slices = []
+
+        for column, (node, dof) in enumerate(load_dof_list):
+            load_value = [0, 0, 0, 0, 0, 0]
+            load_value[dof] = 1
+            unit_analysis = Analysis(
+                analysis_name="unit load {} dof {}".format(node, dof),
+                ops_grillage_name=self.model_name,
+                pyfile=self.pyfile,
+                time_series_counter=self.global_time_series_counter,
+                pattern_counter=self.global_pattern_counter,
+                node_counter=self.Mesh_obj.node_counter,
+                ele_counter=self.Mesh_obj.element_counter,
+                constraint_type=self.constraint_type,
+                numberer=self.numberer,
+                system=self.system,
+                factor_once=True,
+                setup_analysis=column == 0,
+            )
+            unit_analysis.add_load_command(
+                np.array([[node, *load_value]]), load_factor=1
+            )
+            (
+                self.global_time_series_counter,
+                self.global_pattern_counter,
+                node_disp,
+                ele_force,
+                self.analysis_command,
+            ) = unit_analysis.evaluate_analysis()
+            # size force matrices from lengths of element responses on first unit load
+            if column == 0:
+                for force_dict, slices in zip(
+                    [ele_force, unit_analysis.global_ele_force],
+                    [local_force_slices, global_force_slices],
+                ):
+                    start = 0
+                    for ele_tag in ele_tags:
+                        slices.append(slice(start, start + len(force_dict[ele_tag])))
+                        start += len(force_dict[ele_tag])
+                local_force_matrix = np.zeros(
+                    (local_force_slices[-1].stop, len(load_dof_list))
+                )
+                global_force_matrix = np.zeros(
+                    (global_force_slices[-1].stop, len(load_dof_list))
+                )
+            disp_matrix[:, column] = np.concatenate(
+                [node_disp[node_tag] for node_tag in node_tags]
+            )
+            local_force_matrix[:, column] = np.concatenate(
+                [ele_force[ele_tag] for ele_tag in ele_tags]
+            )
+            global_force_matrix[:, column] = np.concatenate(
+                [unit_analysis.global_ele_force[ele_tag] for ele_tag in ele_tags]
+            )
+
+        self.influence_surfaces = {
+            "load_dof_index": {
+                load_dof: column for column, load_dof in enumerate(load_dof_list)
+            },
+            "node_tags": node_tags,
+            "ele_tags": ele_tags,
+            "local_force_slices": local_force_slices,
+            "global_force_slices": global_force_slices,
+            "displacements": disp_matrix,
+            "local_forces": local_force_matrix,
+            "global_forces": global_force_matrix,
+        }
+        if self.diagnostics:
+            print("Influence surfaces computed for {} nodes".format(len(deck_nodes)))
+
     def add_load_combination(
         self, load_combination_name: str, load_case_and_factor_dict: dict
     ):
@@ -2151,7 +2748,7 @@ class OspGrillage:
                     load_case_dict_list.append(inc_load_case_dict)
 
             # get the dict from self.load_case_list
-            # self.load_case_list has this format [{'loadcase':LoadCase object, 'load_command': list of str}...]
+            # self.load_case_list has this format [{'loadcase':LoadCase object, 'load_command': nodal load array}...]
 
         self.load_combination_dict.setdefault(
             load_combination_name, load_case_dict_list
@@ -2240,7 +2837,7 @@ class OspGrillage:
                     "Combination argument requires a dict or a list of dict: e.g. {'DL':1.2,'SIDL':1.5}"
                 )
 
-            # for load_case_dict_list in comb:  # {0:[{'loadcase':LoadCase object, 'load_command': list of str}
+            # for load_case_dict_list in comb:  # {0:[{'loadcase':LoadCase object, 'load_command': nodal load array}
             if self.diagnostics:
                 print("Obtaining load combinations ....")
 
@@ -2252,7 +2849,7 @@ class OspGrillage:
                 load_factor,
             ) in (
                 comb.items()
-            ):  # [{'loadcase':LoadCase object, 'load_command': list of str}.]
+            ):  # [{'loadcase':LoadCase object, 'load_command': nodal load array}.]
                 # if load case is a moving load, skip to next step
                 if load_case_name in self.moving_load_case_dict.keys():
                     list_of_moving_load_case.append(
@@ -2376,9 +2973,7 @@ class OspGrillage:
                     set(second_list) - set(first_list)
                 )  # get only unique nodes
                 # sort nodes based on x coordinate
-                node_x = [
-                    self.Mesh_obj.node_spec[tag]["coordinate"][0] for tag in return_list
-                ]
+                node_x = self.Mesh_obj.get_node_coordinates(return_list)[:, 0].tolist()
                 sorted_return_list.append(
                     [x for _, x in sorted(zip(node_x, return_list))]
                 )
@@ -2424,6 +3019,76 @@ class OspGrillage:
 
 
 # ---------------------------------------------------------------------------------------------------------------------
+def _get_cache_key_value(val):
+    """
+    Function to convert a meshing input to a value whose repr is exact, for hashing in
+    :func:`OspGrillage._get_mesh_cache_key`. NumPy arrays and scalars are converted to python lists and numbers, as
+    NumPy repr rounds floats and summarizes large arrays.
+    """
+    if isinstance(val, (np.ndarray, np.generic)):
+        return (str(val.dtype), val.shape, val.tolist())
+    if isinstance(val, (list, tuple)):
+        return type(val)([_get_cache_key_value(item) for item in val])
+    if isinstance(val, dict):
+        return sorted(
+            [(repr(key), _get_cache_key_value(item)) for key, item in val.items()]
+        )
+    return val
+
+
+def _analyze_load_case_slice(
+    model_command_list: list, analysis_kwargs: dict, load_case_dict_list: list
+) -> list:
+    """
+    Function run by worker processes of :func:`OspGrillage.analyze` with `parallel` option. Rebuilds the model in
+    the OpenSees model space of the worker process, then analyzes each load case in the slice.
+
+    :return: list of analyzed Analysis objects, in order of load_case_dict_list
+    """
+    for command in model_command_list:
+        command.execute()
+    analysis_list = []
+    for count, load_case_dict in enumerate(load_case_dict_list):
+        analysis_obj = Analysis(
+            analysis_name=load_case_dict["name"],
+            time_series_counter=count + 1,
+            pattern_counter=count + 1,
+            setup_analysis=not (analysis_kwargs["factor_once"] and count > 0),
+            **analysis_kwargs,
+        )
+        analysis_obj.add_load_command(
+            load_case_dict["load_command"], load_factor=load_case_dict["load_factor"]
+        )
+        analysis_obj.evaluate_analysis()
+        analysis_list.append(analysis_obj)
+    return analysis_list
+
+
+def _distribute_increment_slice(
+    grillage_class: type,
+    distribution_state: dict,
+    moving_load_obj: MovingLoad,
+    task_slice: list,
+) -> list:
+    """
+    Function run by worker processes of :func:`OspGrillage.add_load_case` with `workers` option. Creates a grillage
+    object holding only the mesh snapshot in distribution_state, then distributes the loads of each increment in the
+    slice.
+
+    :return: tuple of list of nodal load arrays in order of task_slice, list of line load intersections
+             (global_line_int_dict), and dict of patch load intersections (global_patch_int_dict) of the slice
+    """
+    grillage_obj = grillage_class.__new__(grillage_class)
+    grillage_obj.__dict__.update(distribution_state)
+    grillage_obj.global_line_int_dict = []
+    grillage_obj.global_patch_int_dict = dict()
+    return (
+        grillage_obj._distribute_increments(moving_load_obj, task_slice),
+        grillage_obj.global_line_int_dict,
+        grillage_obj.global_patch_int_dict,
+    )
+
+
 class Analysis:
     """
     Main class to handle the run/execution of load case, including incremental load cases of a moving load analysis.
@@ -2438,8 +3103,6 @@ class Analysis:
 
     """
 
-    remove_pattern_command: str
-
     def __init__(
         self,
         analysis_name: str,
@@ -2454,7 +3117,7 @@ class Analysis:
         step: int = 1,
         **kwargs,
     ):
-        
+
         self.analysis_name = analysis_name
         self.ops_grillage_name = ops_grillage_name
         self.time_series_tag = None
@@ -2474,6 +3137,10 @@ class Analysis:
         self.plain_counter = pattern_counter
         # variables from keyword args
         self.constraint_type = kwargs.get("constraint_type", "Plain")  # Default plain
+        # if True, the stiffness matrix is factorised once and reused for subsequent analyze() calls
+        self.factor_once = kwargs.get("factor_once", False)
+        # if False, reuse the analysis objects (system, numberer etc.) already set up in ops model space
+        self.setup_analysis = kwargs.get("setup_analysis", True)
         # Variables recording results of analysis
         self.node_disp = dict()  # key node tag, val list of dof
         self.ele_force = (
@@ -2487,22 +3154,26 @@ class Analysis:
             dict()
         )  # ditto for global ele force except only for shells
         # preset ops analysis commands
-        self.wipe_command = "ops.wipeAnalysis()\n"  # default wipe command
-        self.numberer_command = "ops.numberer('Plain')\n"  # default numberer is Plain
-        self.system_command = "ops.system('BandGeneral')\n"  # default band general
-        self.constraint_command = 'ops.constraints("{type}")\n'.format(
-            type=self.constraint_type
+        self.wipe_command = OpsCommand("wipeAnalysis")  # default wipe command
+        self.numberer_command = OpsCommand(
+            "numberer", (kwargs.get("numberer", "Plain"),)
+        )  # default Plain
+        self.system_command = OpsCommand(
+            "system", (kwargs.get("system", "BandGeneral"),)
+        )  # default band general
+        self.constraint_command = OpsCommand(
+            "constraints", (self.constraint_type,)
         )  # default plain
-        self.algorithm_command = "ops.algorithm('Linear')\n"  # default linear
-        self.analyze_command = "ops.analyze({})\n".format(self.step)  # default 1 step
-        self.analysis_command = 'ops.analysis("{}")\n'.format(analysis_type)
-        self.intergrator_command = "ops.integrator('LoadControl', 1)\n"
-        self.sensitivity_integrator_command = "ops."
+        if self.factor_once:
+            # linear static - factorise stiffness matrix only on first solve, back-substitute thereafter
+            self.algorithm_command = OpsCommand("algorithm", ("Linear", "-factorOnce"))
+        else:
+            self.algorithm_command = OpsCommand("algorithm", ("Linear",))  # default linear
+        self.analyze_command = OpsCommand("analyze", (step,))  # default 1 step
+        self.analysis_command = OpsCommand("analysis", (analysis_type,))
+        self.intergrator_command = OpsCommand("integrator", ("LoadControl", 1))
         self.mesh_node_counter = node_counter  # set node counter based on current Mesh
         self.mesh_ele_counter = ele_counter  # set ele counter based on current Mesh
-        self.remove_pattern_command = (
-            "ops.remove('loadPattern',{})\n"  # default remove load command
-        )
         # save deepcopy of load case object
         self.load_cases_obj = deepcopy(load_case)
         # var to store all eval command
@@ -2530,22 +3201,24 @@ class Analysis:
                 )
 
     def _time_series_command(self, load_factor):
-        time_series = "ops.timeSeries('Constant', {}, '-factor',{})\n".format(
-            self.time_series_counter, load_factor
+        time_series = OpsCommand(
+            "timeSeries", ("Constant", self.time_series_counter, "-factor", load_factor)
         )
         self.time_series_counter += 1  # update counter by 1
         return time_series
 
     def _pattern_command(self):
-        pattern_command = "ops.pattern('Plain', {}, {})\n".format(
-            self.plain_counter, self.time_series_counter - 1
+        pattern_command = OpsCommand(
+            "pattern", ("Plain", self.plain_counter, self.time_series_counter - 1)
         )
         # minus 1 to time series counter for time_series_command() precedes pattern_command() and incremented the time
         # series counter
         self.plain_counter += 1
         return pattern_command
 
-    def add_load_command(self, load_str: list, load_factor): #load_factor is the load factor and load_str contains the list containing ops.load in following format ops.load(nodeTag, fx, fy, fz, mx, my, mz)
+    def add_load_command(
+        self, load_str: np.ndarray, load_factor
+    ):  # load_factor is the load factor and load_str is the nodal load array, each row in following format [nodeTag, fx, fy, fz, mx, my, mz]
 
         # create time series for added load case
         print("inside add_load_command function")
@@ -2557,59 +3230,53 @@ class Analysis:
             "time_series": time_series,
             "pattern": pattern_command,
             "load_command": load_str,
+            "load_factor": load_factor,
         }
         self.load_cases_dict_list.append(time_series_dict)  # add dict to list
 
     def evaluate_analysis(self):
         # write/execute ops.load commands for load groups
         print("inside evaluate_analysis function")
+        analysis_setup_commands = [
+            self.intergrator_command,
+            self.numberer_command,
+            self.system_command,
+            self.constraint_command,
+            self.algorithm_command,
+            self.analysis_command,
+        ]
         if self.pyfile:
             with open(self.analysis_file_name, "a") as file_handle:
-                file_handle.write(self.wipe_command)
+                file_handle.write(self.wipe_command.render())
                 for load_dict in self.load_cases_dict_list:
-                    file_handle.write(load_dict["time_series"])
-                    file_handle.write(load_dict["pattern"])
-                    for load_command in load_dict["load_command"]:
-                        file_handle.write(load_command)
-                file_handle.write(self.intergrator_command)
-                file_handle.write(self.numberer_command)
-                file_handle.write(self.system_command)
-                file_handle.write(self.constraint_command)
-                file_handle.write(self.algorithm_command)
-                file_handle.write(self.analysis_command)
-                file_handle.write(self.analyze_command)
+                    file_handle.write(load_dict["time_series"].render())
+                    file_handle.write(load_dict["pattern"].render())
+                    for load_command in self._get_nodal_load_commands(
+                        load_dict["load_command"]
+                    ):
+                        file_handle.write(load_command.render())
+                for command in analysis_setup_commands:
+                    file_handle.write(command.render())
+                file_handle.write(self.analyze_command.render())
         else:
-            eval(self.wipe_command)
-            self.all_command.append(self.wipe_command)
-            if (
-                self.plain_counter - 1 != 1
-            ):  # plain counter increments by 1 upon self.pattern_command function, so -1 here
-                for count in range(1, self.plain_counter - 1):
-                    remove_command = self.remove_pattern_command.format(count)
-                    eval(remove_command)  # remove previous load pattern if any
-                    self.all_command.append(remove_command)
+            command_list = []
+            if self.setup_analysis:
+                command_list.append(self.wipe_command)
+            # remove previous load pattern if any - only patterns existing in ops model space
+            command_list += [
+                OpsCommand("remove", ("loadPattern", count))
+                for count in ops.getPatterns()
+            ]
             for load_dict in self.load_cases_dict_list:
-                eval(load_dict["time_series"])
-                self.all_command.append(load_dict["time_series"])
-                eval(load_dict["pattern"])
-                self.all_command.append(load_dict["pattern"])
-                for load_command in load_dict["load_command"]:
-                    eval(load_command)
-                    self.all_command.append(load_command)
-            eval(self.intergrator_command)
-            eval(self.numberer_command)
-            eval(self.system_command)
-            eval(self.constraint_command)
-            eval(self.algorithm_command)
-            eval(self.analysis_command)
-            eval(self.analyze_command)
-            self.all_command.append(self.intergrator_command)
-            self.all_command.append(self.numberer_command)
-            self.all_command.append(self.system_command)
-            self.all_command.append(self.constraint_command)
-            self.all_command.append(self.algorithm_command)
-            self.all_command.append(self.analysis_command)
-            self.all_command.append(self.analyze_command)
+                command_list.append(load_dict["time_series"])
+                command_list.append(load_dict["pattern"])
+                command_list += self._get_nodal_load_commands(load_dict["load_command"])
+            if self.setup_analysis:
+                command_list += analysis_setup_commands
+            command_list.append(self.analyze_command)
+            for command in command_list:
+                command.execute()
+            self.all_command += command_list
 
         # extract results
         self.extract_grillage_responses()
@@ -2622,6 +3289,70 @@ class Analysis:
             self.all_command,
         )
 
+    @staticmethod
+    def _get_nodal_load_commands(nodal_load: np.ndarray) -> list:
+        # convert nodal load array [node_tag, Fx, Fy, Fz, Mx, My, Mz] to ops.load() commands, one per loaded node
+        return [
+            OpsCommand("load", (int(row[0]), *row[1:]))
+            for row in np.asarray(nodal_load).tolist()
+        ]
+
+    def evaluate_influence_surfaces(self, influence_surfaces: dict):
+        """
+        Function to evaluate the responses of the load case by superposition of unit load responses stored in
+        influence surfaces, i.e. without running an OpenSees analysis. Influence surfaces are computed by
+        :func:`OspGrillage.compute_influence_surfaces`.
+
+        :param influence_surfaces: dict of unit load response matrices
+        :type influence_surfaces: dict
+        :return: same outputs as evaluate_analysis()
+        """
+        load_dof_index = influence_surfaces["load_dof_index"]
+        # sum nodal loads of all load commands into weights of the unit load columns
+        weights = dict()  # key column index of unit load, val load magnitude
+
+        for load_dict in self.load_cases_dict_list:
+            load_factor = load_dict["load_factor"]
+            for nodal_load in load_dict["load_command"].tolist():
+                node_tag, *load_value = nodal_load
+                node_tag = int(node_tag)
+                for dof, value in enumerate(load_value):
+                    if value == 0:
+                        continue
+                    column = load_dof_index.get((node_tag, dof), None)
+                    if column is None:
+                        raise Exception(
+                            "Load on node {} dof {} of load case {} is not within the computed influence surfaces".format(
+                                node_tag, dof, self.analysis_name
+                            )
+                        )
+                    weights[column] = weights.get(column, 0) + load_factor * value
+        columns = list(weights.keys())
+        weight_array = np.array(list(weights.values()))
+        # matrix product of unit load responses and load magnitudes
+        disp = influence_surfaces["displacements"][:, columns] @ weight_array
+        local_forces = influence_surfaces["local_forces"][:, columns] @ weight_array
+        global_forces = influence_surfaces["global_forces"][:, columns] @ weight_array
+        for count, node_tag in enumerate(influence_surfaces["node_tags"]):
+            self.node_disp.setdefault(
+                node_tag, list(disp[6 * count : 6 * (count + 1)])
+            )
+        for ele_tag, local_slice, global_slice in zip(
+            influence_surfaces["ele_tags"],
+            influence_surfaces["local_force_slices"],
+            influence_surfaces["global_force_slices"],
+        ):
+            self.ele_force.setdefault(ele_tag, list(local_forces[local_slice]))
+            self.global_ele_force.setdefault(ele_tag, list(global_forces[global_slice]))
+
+        return (
+            self.time_series_counter,
+            self.plain_counter,
+            self.node_disp,
+            self.ele_force,
+            self.all_command,
+        )
+
     # function to extract grillage model responses (dx,dy,dz,rotx,roty,rotz,N,Vy,Vz,Mx,My,Mz) and store to Result class
     def extract_grillage_responses(self):
         """
@@ -3073,7 +3804,7 @@ class OspGrillageShell(OspGrillage):
         # model variables specific to Shell type
         self.shell_element_command_list = (
             []
-        )  # list of str for ops.element() shell command
+        )  # list of OpsCommand for ops.element() shell command
 
         # create mesh and model
         super().__init__(
@@ -3132,16 +3863,18 @@ class OspGrillageShell(OspGrillage):
         self._run_mesh_generation()
 
         # create shell element commands
-        for ele_str in self.shell_element_command_list:
+        for ele_command in self.shell_element_command_list:
             if self.pyfile:
                 with open(self.filename, "a") as file_handle:
-                    file_handle.write(ele_str)
+                    file_handle.write(ele_command.render())
             else:
-                eval(ele_str)
+                ele_command.execute()
+                self.model_command_list.append(ele_command)
         # create rigid link command
         self._write_rigid_link()
         # create the result file for the Mesh object
         self.results = Results(self.Mesh_obj)
+        self.influence_surfaces = None  # reset influence surfaces of previous model
         # flag
 
     # overwrites base class for beam element grillage - specific for Shell model
@@ -3278,13 +4011,13 @@ class OspGrillageShell(OspGrillage):
         # for each grid in Mesh, create a shell element
         for grid_nodes_list in self.Mesh_obj.grid_number_dict.values():
             shell_counter = self.global_ele_counter
-            ele_str = grillage_member_obj.get_element_command_str(
+            ele_command = grillage_member_obj.get_element_command(
                 ele_tag=shell_counter,
                 node_tag_list=grid_nodes_list,
                 materialtag=material_tag,
                 sectiontag=section_tag,
             )
-            self.shell_element_command_list.append(ele_str)
+            self.shell_element_command_list.append(ele_command)
             self.global_ele_counter += 1
 
     # overwrite base fix() command procedure
@@ -3299,12 +4032,12 @@ class OspGrillageShell(OspGrillage):
             with open(self.filename, "a") as file_handle:
                 file_handle.write("# Boundary condition implementation\n")
         for node_tag, edge_group_num in mesh_obj.edge_support_nodes.items():
-            fix_str = "ops.fix({}, *{})\n".format(
-                node_tag, self.edge_support_type_dict[edge_group_num]
+            fix_command = OpsCommand(
+                "fix", (node_tag, *self.edge_support_type_dict[edge_group_num])
             )
             if self.pyfile:  # if writing py file
                 with open(self.filename, "a") as file_handle:
-                    file_handle.write(fix_str)
+                    file_handle.write(fix_command.render())
             else:  # run instance
-                eval(fix_str)
-                self.model_command_list.append(fix_str)
+                fix_command.execute()
+                self.model_command_list.append(fix_command)
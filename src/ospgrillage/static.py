@@ -8,7 +8,6 @@ for their workflow.
 
 import numpy as np
 from scipy.spatial import distance
-from scipy.optimize import fsolve, root
 import warnings
 
 
@@ -203,39 +202,54 @@ def get_slope(pt1, pt2):
 
 
 def solve_zeta_eta(xp, zp, x1, z1, x2, z2, x3, z3, x4, z4):
-    # create function to solve for eta and zeta - dynamically for varying parameters x1-x4, z1-z4, zp,xp
-
-    # mapping of natural coordinate eta{-1:1}, zeta{-1:1} to global coordinate (x,z)
-    def obj_func(x, xp, zp, x1, x2, x3, x4, z1, z2, z3, z4):
-        eta = 4 * zp - (
-            (1 - x[0]) * (1 - x[1]) * z1
-            + (1 + x[0]) * (1 - x[1]) * z2
-            + (1 + x[0]) * (1 + x[1]) * z3
-            + (1 - x[0]) * (1 + x[1]) * z4
-        )
-        zeta = 4 * xp - (
-            (1 - x[0]) * (1 - x[1]) * x1
-            + (1 + x[0]) * (1 - x[1]) * x2
-            + (1 + x[0]) * (1 + x[1]) * x3
-            + (1 - x[0]) * (1 + x[1]) * x4
-        )
-        return eta, zeta
+    # mapping of global coordinate (x,z) of point to natural coordinate eta{-1:1}, zeta{-1:1} of a single grid
+    # wrapper of solve_zeta_eta_array()
+    eta, zeta = solve_zeta_eta_array([xp], [zp], [[x1, x2, x3, x4]], [[z1, z2, z3, z4]])
+    return eta[0], zeta[0]
 
-    # if initial xp zp is very close (order 1e-8) to the centre (0,0,0) of natural coordinate,
-    # avoid fsolve RunTimeWarning by
-    if all([np.isclose(xp, (x1 + x2) / 2), np.isclose(zp, (z1 + z3) / 2)]):
-        root_func = [0, 0]
 
-    else:
-        root_func = fsolve(
-            obj_func,
-            np.array([-0.4444444444444, 0.99999999]),
-            args=(xp, zp, x1, x2, x3, x4, z1, z2, z3, z4),
-        )  # here the initial values are chosen to avoid RunTimeWarning where initial guess is very close
-        # to the final solution of eta and zeta
-
-    eta = root_func[0]
-    zeta = root_func[1]
+def solve_zeta_eta_array(xp, zp, x_vertices, z_vertices):
+    """
+    Vectorised function to map points (xp, zp) to natural coordinates (eta, zeta) of quadrilateral grids. Row i of
+    x_vertices and z_vertices are the coordinates of the four sorted (counterclockwise) vertices of the grid containing
+    point i. The inverse of the bilinear mapping is solved in closed form as a quadratic equation of zeta.
+
+    :param xp: Array of x coordinates of points (N,)
+    :param zp: Array of z coordinates of points (N,)
+    :param x_vertices: Array of x coordinates of grid vertices (N, 4)
+    :param z_vertices: Array of z coordinates of grid vertices (N, 4)
+    :return: Arrays of eta and zeta (N,)
+    """
+    x1, x2, x3, x4 = np.asarray(x_vertices, dtype=float).reshape(-1, 4).T
+    z1, z2, z3, z4 = np.asarray(z_vertices, dtype=float).reshape(-1, 4).T
+    # bilinear mapping x = a0 + a1 * eta + a2 * zeta + a3 * eta * zeta, likewise for z with b0 to b3
+    dx = np.asarray(xp, dtype=float) - 0.25 * (x1 + x2 + x3 + x4)
+    dz = np.asarray(zp, dtype=float) - 0.25 * (z1 + z2 + z3 + z4)
+    a1 = 0.25 * (-x1 + x2 + x3 - x4)
+    a2 = 0.25 * (-x1 - x2 + x3 + x4)
+    a3 = 0.25 * (x1 - x2 + x3 - x4)
+    b1 = 0.25 * (-z1 + z2 + z3 - z4)
+    b2 = 0.25 * (-z1 - z2 + z3 + z4)
+    b3 = 0.25 * (z1 - z2 + z3 - z4)
+    # eliminate eta, giving A * zeta**2 + B * zeta + C = 0. A = 0 for parallelogram grids
+    A = a3 * b2 - a2 * b3
+    B = a1 * b2 - a2 * b1 + b3 * dx - a3 * dz
+    C = b1 * dx - a1 * dz
+    # numerically stable roots of quadratic, root C/q remains valid when A = 0
+    q = -0.5 * (B + np.where(B < 0, -1, 1) * np.sqrt(np.maximum(B**2 - 4 * A * C, 0)))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        zeta_1 = np.where(q != 0, C / q, 0)
+        zeta_2 = np.where(A != 0, q / A, np.inf)
+        # select root within (or closest to) the grid, i.e. -1 <= zeta <= 1
+        zeta = np.where(np.abs(zeta_1) <= np.abs(zeta_2), zeta_1, zeta_2)
+        # back substitute zeta, using the equation (x or z) with larger denominator
+        denominator_x = a1 + a3 * zeta
+        denominator_z = b1 + b3 * zeta
+        eta = np.where(
+            np.abs(denominator_x) >= np.abs(denominator_z),
+            (dx - a2 * zeta) / denominator_x,
+            (dz - b2 * zeta) / denominator_z,
+        )
     return eta, zeta
 
 
@@ -469,6 +483,27 @@ def get_patch_centroid(point_list):
     return xc, yc, zc
 
 
+def sum_nodal_loads(nodal_load_list: list) -> np.ndarray:
+    """
+    Function to stack nodal load arrays and sum the loads applied to the same node.
+
+    :param nodal_load_list: list of nodal load arrays, each row is [node_tag, Fx, Fy, Fz, Mx, My, Mz]
+    :type nodal_load_list: list
+    :return: Array of nodal loads with one row per node, sorted by node tag
+    """
+    nodal_load_list = [
+        loads for loads in nodal_load_list if len(loads) > 0
+    ]  # skip empty loads
+    if not nodal_load_list:
+        return np.zeros((0, 7))
+    loads = np.vstack(nodal_load_list)
+    node_tags, node_index = np.unique(loads[:, 0], return_inverse=True)
+    summed_loads = np.zeros((len(node_tags), 7))
+    summed_loads[:, 0] = node_tags
+    np.add.at(summed_loads[:, 1:], node_index, loads[:, 1:])
+    return summed_loads
+
+
 # abstracted function for assigning patch loading
 def check_dict_same_keys(d_1, d_2):
     merged = {**d_1, **d_2}
@@ -382,6 +382,62 @@ def beam_link_bridge(
     return example_bridge
 
 
+# bridge with load cases for comparing an analysis mode (e.g. factor once, parallel) against the default analysis
+@pytest.fixture
+def analysis_mode_bridge(bridge_model_42_negative):
+    # line, patch and moving load cases are added twice, named "<load case> default" and "<load case> mode". Default
+    # analysis of the "default" load cases is run. Returns bridge and list of load case names without suffix
+    og.ops.wipeAnalysis()
+    example_bridge = bridge_model_42_negative
+    barrier = og.create_load(
+        loadtype="line",
+        name="Barrier curb load",
+        point1=og.create_load_vertex(x=5, y=0, z=1, p=2),
+        point2=og.create_load_vertex(x=10, y=0, z=1, p=2),
+        shape_function="hermite",
+    )
+    lane = og.create_load(
+        loadtype="patch",
+        name="Lane 1",
+        point1=og.create_load_vertex(x=5, z=3, p=5),
+        point2=og.create_load_vertex(x=8, z=3, p=5),
+        point3=og.create_load_vertex(x=8, z=5, p=5),
+        point4=og.create_load_vertex(x=5, z=5, p=5),
+    )
+    M1600 = og.CompoundLoad("M1600 LM")
+    M1600.add_load(
+        load_obj=og.create_load(
+            loadtype="point",
+            name="back wheel",
+            point1=og.LoadPoint(5, 0, 2, 20),
+            shape_function="hermite",
+        )
+    )
+    M1600.add_load(
+        load_obj=og.create_load(
+            loadtype="point", name="front wheel", point1=og.LoadPoint(2, 0, 2, 50)
+        )
+    )
+    M1600.set_global_coord(og.Point(0, 0, 0))
+    single_path = og.create_moving_path(
+        start_point=og.Point(2, 0, 2), end_point=og.Point(4, 0, 3)
+    )
+    for suffix in ["default", "mode"]:
+        barrier_load_case = og.create_load_case(name="Barrier " + suffix)
+        barrier_load_case.add_load(barrier)
+        example_bridge.add_load_case(barrier_load_case)
+        lane_load_case = og.create_load_case(name="Lane " + suffix)
+        lane_load_case.add_load(lane)
+        example_bridge.add_load_case(lane_load_case, load_factor=1.5)
+        truck = og.create_moving_load(name="Truck " + suffix)
+        truck.set_path(path_obj=single_path)
+        truck.add_load(load_obj=M1600)
+        example_bridge.add_load_case(truck)
+    load_case_names = ["Barrier", "Lane", "Truck"]
+    example_bridge.analyze(load_case=[name + " default" for name in load_case_names])
+    return example_bridge, load_case_names
+
+
 # create and run both comparable beam and shell_beam model to obtain results from a point load analysis
 @pytest.fixture
 def run_beam_model_point_load(beam_element_bridge, shell_link_bridge):
@@ -12,6 +12,7 @@ import json
 import numpy as np
 import pandas
 import sys, os
+import time
 import ospgrillage as ospg
 from pathlib import Path
 
@@ -939,3 +940,111 @@ def extract_lusas_ele_forces(list_of_ele, df_force, component: str):
         output.append(ele_output)
 
     return output
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Benchmark of numberers - opt in, run with environment variable OSPGRILLAGE_BENCHMARK=1, e.g.
+#   OSPGRILLAGE_BENCHMARK=1 pytest tests/test_benchmark.py -k numberer -s
+def create_scaled_super_t_grillage(
+    numberer, n_l, n_t, angle=0, mesh_type="Ortho", scale=10
+):
+    # Super-T 28m model of create_json_bridge() with span and width scaled up
+    bridge = create_json_bridge()
+    grid_prop = bridge["grid"]
+    concrete = ospg.create_material(
+        material=bridge["material"]["mat_type"],
+        code=bridge["material"]["code_use"],
+        grade=bridge["material"]["mat_grade"],
+    )
+    member_dict = dict()
+    for prop_name in ["longitudinal", "edge", "transverse", "end_slab"]:
+        member_dict[prop_name] = ospg.create_member(
+            section=ospg.create_section(
+                **bridge[prop_name], unit_width=prop_name == "transverse"
+            ),
+            material=concrete,
+        )
+    grid = ospg.create_grillage(
+        bridge_name="scaled " + grid_prop["name"],
+        long_dim=grid_prop["span"] * scale,
+        width=grid_prop["width"] * scale,
+        skew=angle,
+        num_long_grid=n_l,
+        num_trans_grid=n_t,
+        edge_beam_dist=grid_prop["edge_dist"],
+        mesh_type=mesh_type,
+        numberer=numberer,
+    )
+    for member in ["interior_main_beam", "exterior_main_beam_1", "exterior_main_beam_2"]:
+        grid.set_member(member_dict["longitudinal"], member=member)
+    grid.set_member(member_dict["edge"], member="edge_beam")
+    grid.set_member(member_dict["transverse"], member="transverse_slab")
+    grid.set_member(member_dict["end_slab"], member="start_edge")
+    grid.set_member(member_dict["end_slab"], member="end_edge")
+    grid.create_osp_model(pyfile=False)
+    return grid
+
+
+@pytest.mark.skipif(
+    not os.environ.get("OSPGRILLAGE_BENCHMARK"),
+    reason="benchmark, set OSPGRILLAGE_BENCHMARK=1 to run",
+)
+@pytest.mark.parametrize(
+    "n_l, n_t, angle, mesh_type, auto_numberer",
+    [
+        (7, 110, 0, "Ortho", "RCM"),  # narrow band after RCM: 13**2 <= 770 nodes
+        (22, 35, 0, "Ortho", "AMD"),  # band still wide after RCM: 43**2 > 770 nodes
+        (22, 35, 20, "Oblique", "Plain"),  # Plain numbering already narrower than RCM
+    ],
+)
+def test_numberer_benchmark(n_l, n_t, angle, mesh_type, auto_numberer):
+    # time per solve of Plain, RCM and AMD numberers on the 28m Super-T model scaled up tenfold (770 nodes)
+    timing = dict()
+    displacement_dict = dict()
+    for numberer in ["Plain", "RCM", "AMD", "auto"]:
+        grid = create_scaled_super_t_grillage(numberer, n_l, n_t, angle, mesh_type)
+        point_load_case = ospg.create_load_case(name="point")
+        point_load_case.add_load(
+            ospg.create_load(
+                loadtype="point",
+                name="point",
+                point1=ospg.create_load_vertex(x=140, z=35, p=1),
+            )
+        )
+        grid.add_load_case(point_load_case)
+        grid.analyze()  # sets up analysis objects of numberer
+        displacement_dict[numberer] = (
+            grid.get_results()["displacements"].values.astype(float)
+        )
+        # median time of solves, each assembles and factorises the system of equations
+        solve_time = []
+        for _ in range(3):
+            start = time.perf_counter()
+            ospg.ops.analyze(1)
+            solve_time.append(time.perf_counter() - start)
+        if numberer == "auto":
+            numberer = "auto ({})".format(grid.numberer)
+        timing[numberer] = np.median(solve_time)
+        mesh = grid.Mesh_obj
+    print(
+        "\n{} x {} {} skew {}: {} nodes, bandwidth Plain {}, RCM {}".format(
+            n_l,
+            n_t,
+            mesh_type,
+            angle,
+            len(mesh.node_tag_array),
+            mesh.get_node_bandwidth(),
+            mesh.get_node_bandwidth(mesh.get_rcm_ordering()),
+        )
+    )
+    for numberer, solve_time in timing.items():
+        print("  {:12s}: {:10.1f} ms".format(numberer, solve_time * 1e3))
+    assert grid.numberer == auto_numberer
+    for numberer in ["RCM", "AMD"]:
+        assert np.allclose(
+            displacement_dict[numberer],
+            displacement_dict["Plain"],
+            rtol=1e-6,
+            atol=1e-12,
+            equal_nan=True,
+        )
@@ -2,6 +2,8 @@
 
 """
 
+from copy import deepcopy
+
 from fixtures import *
 
 sys.path.insert(0, os.path.abspath("../"))
@@ -20,6 +22,16 @@ MPa = N / ((mm) ** 2)
 GPa = kilo * MPa
 
 
+def get_ref_nodal_load(ref_answer):
+    # convert reference ops.load() strings to summed nodal load array [node_tag, Fx, Fy, Fz, Mx, My, Mz]
+    nodal_load_list = []
+    for ref in ref_answer:
+        node_tag = int(ref[ref.find("(") + 1 : ref.find(",")])
+        load_value = eval(ref[ref.find("[") : ref.find("]") + 1])
+        nodal_load_list.append(np.array([[node_tag, *load_value]]))
+    return og.sum_nodal_loads(nodal_load_list)
+
+
 # =====================================================================================================================
 # Tests
 # =====================================================================================================================
@@ -90,12 +102,17 @@ def test_point_load_getter(
     example_bridge.add_load_case(ULS_DL)
     og.ops.wipe()
 
-    assert example_bridge.load_case_list[0]["load_command"] == [
-        "ops.load(12, *[0, 0.6075807082987842, 0, 0.37389582049155967, 0, 0.34166943132701877])\n",
-        "ops.load(17, *[0, 1.4724192917012129, 0, 0.9061041795084391, 0, -0.613915767971676])\n",
-        "ops.load(18, *[0, 12.685458513118162, 0, -3.6244167180337583, 0, -5.289120462525217])\n",
-        "ops.load(13, *[0, 5.234541486881841, 0, -1.4955832819662394, 0, 2.943613562202012])\n",
+    # nodal load array sorted by node tag, each row [node_tag, Fx, Fy, Fz, Mx, My, Mz]
+    ref_load = [
+        [12, 0, 0.6075807082987842, 0, 0.37389582049155967, 0, 0.34166943132701877],
+        [13, 0, 5.234541486881841, 0, -1.4955832819662394, 0, 2.943613562202012],
+        [17, 0, 1.4724192917012129, 0, 0.9061041795084391, 0, -0.613915767971676],
+        [18, 0, 12.685458513118162, 0, -3.6244167180337583, 0, -5.289120462525217],
     ]
+    example_bridge.distribute_load_cases()
+    assert example_bridge.load_case_list[0]["load_command"] == pytest.approx(
+        np.array(ref_load)
+    )
 
 
 # test point load returning None when point (loadpoint) is outside of mesh
@@ -230,6 +247,7 @@ def test_line_load_vertical_and_cross_outside_mesh(bridge_model_42_negative):
     ULS_DL = og.create_load_case(name="Barrier")
     ULS_DL.add_load(Barrier)  # ch
     example_bridge.add_load_case(ULS_DL)
+    example_bridge.distribute_load_cases()
     ref_ans = {
         1: {
             "long_intersect": [[2, 0, 0.0], [2, 0, 1.0]],
@@ -271,6 +289,7 @@ def test_line_load_coincide_long_edge(bridge_model_42_negative):
     ULS_DL = og.create_load_case(name="Barrier")
     ULS_DL.add_load(Barrier)  # ch
     example_bridge.add_load_case(ULS_DL)
+    example_bridge.distribute_load_cases()
 
     ref_answer = [
         {
@@ -369,14 +388,10 @@ def test_line_load_coincide_transverse_member(bridge_42_0_angle_mesh):
         "ops.load(56, *[0, 0.0, 0, 0, 0, 0])\n",
     ]
 
-    for i, load_command in enumerate(example_bridge.load_case_list[0]["load_command"]):
-        start = load_command.find("[")
-        end = load_command.find("]")
-        pos = eval(load_command[start : (end + 1)])
-        start_ref = ref_answer[i].find("[")
-        end_ref = ref_answer[i].find("]")
-        pos_ref = eval(ref_answer[i][start_ref : (end_ref + 1)])
-        assert pos == pytest.approx(pos_ref)
+    example_bridge.distribute_load_cases()
+    assert example_bridge.load_case_list[0]["load_command"] == pytest.approx(
+        get_ref_nodal_load(ref_answer)
+    )
 
 
 def test_line_load_coincide_edge_beam(bridge_model_42_negative):
@@ -396,6 +411,7 @@ def test_line_load_coincide_edge_beam(bridge_model_42_negative):
     ULS_DL = og.create_load_case(name="Barrier")
     ULS_DL.add_load(Barrier)  # ch
     example_bridge.add_load_case(ULS_DL)
+    example_bridge.distribute_load_cases()
 
     ref_ans = [
         {
@@ -464,6 +480,7 @@ def test_line_load_outside_of_mesh(bridge_model_42_negative):
     ULS_DL = og.create_load_case(name="Barrier")
     ULS_DL.add_load(Barrier)  # ch
     example_bridge.add_load_case(ULS_DL)
+    example_bridge.distribute_load_cases()
     assert example_bridge.global_line_int_dict == [{}]
 
 
@@ -538,14 +555,10 @@ def test_patch_load(bridge_model_42_negative):
         "ops.load(15, *[0, 0.10620730762527884, 0, -0.05310365381263942, 0, 0.06601456784167829])\n",
     ]
 
-    for i, load_command in enumerate(example_bridge.load_case_list[0]["load_command"]):
-        start = load_command.find("[")
-        end = load_command.find("]")
-        pos = eval(load_command[start : (end + 1)])
-        start_ref = ref_answer[i].find("[")
-        end_ref = ref_answer[i].find("]")
-        pos_ref = eval(ref_answer[i][start_ref : (end_ref + 1)])
-        assert pos == pytest.approx(pos_ref)  # check each pos
+    example_bridge.distribute_load_cases()
+    assert example_bridge.load_case_list[0]["load_command"] == pytest.approx(
+        get_ref_nodal_load(ref_answer)
+    )
 
 
 # test for patch load with linear shape function for load distribution
@@ -618,14 +631,56 @@ def test_patch_load_using_linear_shape_function(bridge_model_42_negative):
         "ops.load(15, *[0, 0.22482308181507565, 0, 0, 0, 0])\n",
     ]
 
-    for i, load_command in enumerate(example_bridge.load_case_list[0]["load_command"]):
-        start = load_command.find("[")
-        end = load_command.find("]")
-        pos = eval(load_command[start : (end + 1)])
-        start_ref = ref_answer[i].find("[")
-        end_ref = ref_answer[i].find("]")
-        pos_ref = eval(ref_answer[i][start_ref : (end_ref + 1)])
-        assert pos == pytest.approx(pos_ref)
+    example_bridge.distribute_load_cases()
+    assert example_bridge.load_case_list[0]["load_command"] == pytest.approx(
+        get_ref_nodal_load(ref_answer)
+    )
+
+
+# test interpolation of patch load magnitude over quadrilateral and triangle patches
+def test_patch_magnitude_interpolation():
+    quad_patch = og.create_load(
+        loadtype="patch",
+        point1=og.create_load_vertex(x=5, z=3, p=2),
+        point2=og.create_load_vertex(x=8, z=3, p=4),
+        point3=og.create_load_vertex(x=8, z=5, p=8),
+        point4=og.create_load_vertex(x=5, z=5, p=6),
+    )
+    # single point returns array like
+    assert quad_patch.patch_mag_interpolate(8, 5) == pytest.approx([8])
+    # bilinear surface through vertices, evaluated for arrays of points in one call
+    x = np.array([5, 8, 6.5, 6.5, 5.75])
+    z = np.array([3, 5, 4, 3, 3.5])
+    ref = [2, 8, 5, 3, 3.5]
+    assert quad_patch.patch_mag_interpolate(x, z) == pytest.approx(ref)
+    # interpolation follows patch when moved
+    quad_patch.move_load(og.Point(1, 0, 1))
+    assert quad_patch.patch_mag_interpolate(x + 1, z + 1) == pytest.approx(ref)
+
+    triangle_patch = og.create_load(
+        loadtype="patch",
+        point1=og.create_load_vertex(x=5, z=3, p=2),
+        point2=og.create_load_vertex(x=8, z=3, p=5),
+        point3=og.create_load_vertex(x=8, z=5, p=9),
+    )
+    assert triangle_patch.patch_mag_interpolate(
+        [5, 8, 8, 7], [3, 3, 5, 4]
+    ) == pytest.approx([2, 5, 9, 2 + 2 + 2])
+
+
+# test triangle patch load distributes its total load to nodes
+def test_triangle_patch_load(bridge_model_42_negative):
+    example_bridge = bridge_model_42_negative
+    triangle_patch = og.create_load(
+        loadtype="patch",
+        name="Triangle",
+        point1=og.create_load_vertex(x=5, y=0, z=3, p=5),
+        point2=og.create_load_vertex(x=8, y=0, z=3, p=5),
+        point3=og.create_load_vertex(x=8, y=0, z=5, p=5),
+        shape_function="linear",
+    )
+    nodal_load = example_bridge._assign_patch_load(triangle_patch)
+    assert nodal_load[:, 2].sum() == pytest.approx(5 * 3)
 
 
 def test_local_vs_global_coord_settings():
@@ -758,6 +813,156 @@ def test_moving_compound_load(bridge_model_42_negative):
     print("finish test compound moving load")
 
 
+def test_moving_load_increments(bridge_model_42_negative):
+    # test compact representation of moving load increments, and load case of increment created on query
+    example_bridge = bridge_model_42_negative
+    front_wheel = og.create_load(
+        loadtype="point", name="front wheel", point1=og.LoadPoint(2, 0, 2, 50)
+    )
+    barrier = og.create_load(
+        loadtype="point", name="barrier", point1=og.LoadPoint(1, 0, 1, 10)
+    )
+    truck = og.create_moving_load(name="Truck 2")
+    truck.set_path(
+        path_obj=og.create_moving_path(
+            start_point=og.Point(2, 0, 2), end_point=og.Point(4, 0, 2), increments=5
+        )
+    )
+    truck.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(truck)
+
+    moving_load_group = truck.moving_load_case[0]
+    assert moving_load_group["offset"].shape == (5, 3)
+    assert moving_load_group["point"].tolist() == [[2, 0, 2, 50]]
+    load_list, point, shape_func_list = truck.get_increment_loads(0, 4)
+    assert not load_list
+    assert point.tolist() == [[6, 0, 4, 50]]
+    assert shape_func_list == ["linear"]
+    # no load case objects are stored for increments
+    assert all(
+        [
+            load_case_dict["loadcase"] is None
+            for load_case_dict in example_bridge.moving_load_case_dict["Truck 2"]
+        ]
+    )
+    # load case of increment created on query
+    name = moving_load_group["name"][4]
+    assert name == "Truck 2 at global position [4.00,0.00,2.00]"
+    load_case = truck.get_increment_load_case(name)
+    assert load_case.load_groups[0]["load"].load_point_1 == og.LoadPoint(6, 0, 4, 50)
+    assert truck.query(incremental_lc_name=name) == [
+        load_case.load_groups[0]["load"].point_list
+    ]
+    # static load added to increments
+    truck.add_load(load_obj=barrier)
+    truck.load_case_dict_list[-1]["path"] = []
+    truck.parse_moving_load_cases()
+    load_list, point, shape_func_list = truck.get_increment_loads(0, 0)
+    assert point.tolist() == [[4, 0, 4, 50], [1, 0, 1, 10]]
+    assert len(truck.get_increment_load_case(name).load_groups) == 2
+
+
+def test_moving_patch_and_line_increments(bridge_model_42_negative):
+    # test increments moved as shallow copies give the same nodal loads as deep copied load cases of increments, and
+    # leave the base load objects unchanged
+    example_bridge = bridge_model_42_negative
+    lane = og.create_load(
+        loadtype="patch",
+        name="Lane",
+        point1=og.create_load_vertex(x=0, z=3, p=5),
+        point2=og.create_load_vertex(x=3, z=3, p=5),
+        point3=og.create_load_vertex(x=3, z=5, p=5),
+        point4=og.create_load_vertex(x=0, z=5, p=5),
+    )
+    barrier = og.create_load(
+        loadtype="line",
+        name="Barrier",
+        point1=og.create_load_vertex(x=1, z=1, p=2),
+        point2=og.create_load_vertex(x=4, z=1, p=2),
+    )
+    wheel = og.create_load(
+        loadtype="point", name="wheel", point1=og.LoadPoint(2, 0, 2, 50)
+    )
+    vehicle = og.create_compound_load(name="vehicle")
+    for load_obj in [lane, barrier, wheel]:
+        vehicle.add_load(load_obj=load_obj)
+    move_lane = og.create_moving_load(name="moving lane")
+    move_lane.set_path(
+        og.create_moving_path(
+            start_point=og.Point(0, 0, 0), end_point=og.Point(4, 0, 1), increments=5
+        )
+    )
+    move_lane.add_load(load_obj=vehicle)
+    example_bridge.add_load_case(move_lane)
+    base_load_list = move_lane.moving_load_case[0]["load_list"]
+    base_state = [deepcopy(vars(load_obj)) for load_obj in base_load_list]
+    example_bridge.distribute_load_cases()
+
+    for load_case_dict in example_bridge.moving_load_case_dict["moving lane"]:
+        ref_load_case = move_lane.get_increment_load_case(load_case_dict["name"])
+        assert load_case_dict["load_command"] == pytest.approx(
+            example_bridge._distribute_load_types_to_model(load_case_obj=ref_load_case)
+        )
+    for load_obj, state in zip(base_load_list, base_state):
+        assert load_obj.point_list == state["point_list"]
+        assert load_obj.load_point_1 == state["load_point_1"]
+        if isinstance(load_obj, og.PatchLoading):
+            assert load_obj.line_1.load_point_1 == state["line_1"].load_point_1
+            assert load_obj.line_3.load_point_2 == state["line_3"].load_point_2
+
+
+def test_deferred_load_distribution(bridge_model_42_negative):
+    # test loads are distributed only for selected load cases, and distributed loads are reused
+    example_bridge = bridge_model_42_negative
+    for name, x in [("Point 1", 3), ("Point 2", 6)]:
+        point_load_case = og.create_load_case(name=name)
+        point_load_case.add_load(
+            og.create_load(
+                loadtype="point", name=name, point1=og.LoadPoint(x, 0, 2, 20)
+            )
+        )
+        example_bridge.add_load_case(point_load_case)
+    front_wheel = og.create_load(
+        loadtype="point", name="front wheel", point1=og.LoadPoint(2, 0, 2, 50)
+    )
+    truck = og.create_moving_load(name="Truck")
+    truck.set_path(
+        path_obj=og.create_moving_path(
+            start_point=og.Point(2, 0, 2), end_point=og.Point(4, 0, 2), increments=5
+        )
+    )
+    truck.add_load(load_obj=front_wheel)
+    example_bridge.add_load_case(truck)
+    # nothing distributed on adding load cases
+    assert all([lc["load_command"] is None for lc in example_bridge.load_case_list])
+    assert all(
+        [
+            lc["load_command"] is None
+            for lc in example_bridge.moving_load_case_dict["Truck"]
+        ]
+    )
+
+    example_bridge.distribute_load_cases(load_case=["Point 2", "Truck"])
+    # cache of nodal weights is not kept once load cases are distributed
+    assert not example_bridge._point_weight_cache
+    assert example_bridge.load_case_list[0]["load_command"] is None
+    load_command = example_bridge.load_case_list[1]["load_command"]
+    assert load_command[:, 2].sum() == pytest.approx(20)
+    for load_case_dict, step in zip(
+        example_bridge.moving_load_case_dict["Truck"], range(5)
+    ):
+        _, point, shape_func_list = truck.get_increment_loads(0, step)
+        assert load_case_dict["load_command"] == pytest.approx(
+            example_bridge._assign_points_to_four_node(
+                point[:, :3].tolist(), point[:, 3].tolist(), shape_func_list
+            )
+        )
+    # distributed loads are not redone
+    example_bridge.distribute_load_cases()
+    assert example_bridge.load_case_list[1]["load_command"] is load_command
+    assert example_bridge.load_case_list[0]["load_command"] is not None
+
+
 # checks if patch load is correctly-distributed when patch exceeds the bounds of the grillage
 def test_patch_partially_outside_mesh(bridge_model_42_negative):
     example_bridge = bridge_model_42_negative
@@ -840,14 +1045,10 @@ def test_patch_partially_outside_mesh(bridge_model_42_negative):
         "ops.load(27, *[0, 0.016175126143379157, 0, -0.0103982953778866, 0, 0.008087563071689568])\n",
     ]
 
-    for i, load_command in enumerate(example_bridge.load_case_list[0]["load_command"]):
-        start = load_command.find("[")
-        end = load_command.find("]")
-        pos = eval(load_command[start : (end + 1)])
-        start_ref = ref_answer[i].find("[")
-        end_ref = ref_answer[i].find("]")
-        pos_ref = eval(ref_answer[i][start_ref : (end_ref + 1)])
-        assert pos == pytest.approx(pos_ref)
+    example_bridge.distribute_load_cases()
+    assert example_bridge.load_case_list[0]["load_command"] == pytest.approx(
+        get_ref_nodal_load(ref_answer)
+    )
 
 
 def test_clearing_results(bridge_model_42_negative):
@@ -1113,3 +1314,128 @@ def test_compare_shell_beam_analysis(run_beam_model_point_load):
     )
     pass
     og.opsv.plot_defo()
+
+
+def assert_mode_matches_default(example_bridge, load_case_names):
+    # results of "<load case> mode" must match results of "<load case> default", see analysis_mode_bridge fixture
+    for lc_name in load_case_names:
+        default_results = example_bridge.get_results(load_case=lc_name + " default")
+        mode_results = example_bridge.get_results(load_case=lc_name + " mode")
+        for var in ["displacements", "forces"]:
+            assert np.allclose(
+                default_results[var].values.astype(float),
+                mode_results[var].values.astype(float),
+                equal_nan=True,
+            )
+
+
+def record_ops_calls(monkeypatch, function):
+    # record arguments of calls to OpenSeesPy function, the function is still called
+    calls = []
+    ops_function = getattr(og.ops, function)
+
+    def recorded_function(*args):
+        calls.append(args)
+        return ops_function(*args)
+
+    monkeypatch.setattr(og.ops, function, recorded_function)
+    return calls
+
+
+# test linear static analysis which factorise stiffness matrix once, results must match default analysis
+def test_factor_once_analysis(analysis_mode_bridge, monkeypatch):
+    example_bridge, load_case_names = analysis_mode_bridge
+    algorithm_calls = record_ops_calls(monkeypatch, "algorithm")
+    analyze_calls = record_ops_calls(monkeypatch, "analyze")
+    example_bridge.analyze(
+        load_case=[name + " mode" for name in load_case_names], factor_once=True
+    )
+    # analysis objects are set up once, all load cases and increments are solved with the factorised matrix
+    assert algorithm_calls == [("Linear", "-factorOnce")]
+    num_increment = len(example_bridge.moving_load_case_dict["Truck mode"])
+    assert len(analyze_calls) == 2 + num_increment
+    assert_mode_matches_default(example_bridge, load_case_names)
+
+
+# test evaluating load cases from influence surfaces, results must match default analysis
+def test_influence_surfaces(analysis_mode_bridge, monkeypatch):
+    example_bridge, load_case_names = analysis_mode_bridge
+    with pytest.raises(Exception):
+        example_bridge.analyze(load_case=["Lane mode"], influence_surfaces=True)
+    example_bridge.compute_influence_surfaces()
+    # unit load responses for each deck node
+    num_column = len(example_bridge.influence_surfaces["load_dof_index"])
+    assert (
+        example_bridge.influence_surfaces["displacements"].shape[1] == num_column > 0
+    )
+    analyze_calls = record_ops_calls(monkeypatch, "analyze")
+    example_bridge.analyze(
+        load_case=[name + " mode" for name in load_case_names], influence_surfaces=True
+    )
+    # load cases are evaluated by superposition, without OpenSees analysis
+    assert analyze_calls == []
+    assert_mode_matches_default(example_bridge, load_case_names)
+
+
+# test analysis of load cases on worker processes, results must match default analysis
+def test_parallel_analysis(analysis_mode_bridge, monkeypatch):
+    example_bridge, load_case_names = analysis_mode_bridge
+    analyze_calls = record_ops_calls(monkeypatch, "analyze")
+    example_bridge.analyze(
+        load_case=[name + " mode" for name in load_case_names], parallel=3
+    )
+    # load cases are analyzed in worker processes only, results merged in order of load cases
+    assert analyze_calls == []
+    assert_mode_matches_default(example_bridge, load_case_names)
+
+
+# test distribution of moving load increments on worker processes, nodal loads must match serial distribution
+def test_parallel_load_distribution(bridge_model_42_negative):
+    example_bridge = bridge_model_42_negative
+    lane_point_1 = og.create_load_vertex(x=0, z=3, p=5)
+    lane_point_2 = og.create_load_vertex(x=3, z=3, p=5)
+    lane_point_3 = og.create_load_vertex(x=3, z=5, p=5)
+    lane_point_4 = og.create_load_vertex(x=0, z=5, p=5)
+    lane = og.create_load(
+        loadtype="patch",
+        name="Lane 1",
+        point1=lane_point_1,
+        point2=lane_point_2,
+        point3=lane_point_3,
+        point4=lane_point_4,
+    )
+    front_wheel = og.create_load(
+        loadtype="point",
+        name="front wheel",
+        point1=og.LoadPoint(2, 0, 2, 50),
+        shape_function="hermite",
+    )
+    barrier = og.create_load(
+        loadtype="line",
+        name="Barrier curb load",
+        point1=og.create_load_vertex(x=1, y=0, z=1, p=2),
+        point2=og.create_load_vertex(x=4, y=0, z=1, p=2),
+    )
+    single_path = og.create_moving_path(
+        start_point=og.Point(0, 0, 0), end_point=og.Point(4, 0, 0), increments=7
+    )
+    for suffix, workers in [("default", None), ("parallel", 3)]:
+        move_lane = og.create_moving_load(name="moving lane " + suffix)
+        move_lane.set_path(single_path)
+        move_lane.add_load(load_obj=lane)
+        move_lane.add_load(load_obj=front_wheel)
+        move_lane.add_load(load_obj=barrier)
+        example_bridge.add_load_case(move_lane, workers=workers)
+    example_bridge.distribute_load_cases()
+
+    default_lc = example_bridge.moving_load_case_dict["moving lane default"]
+    parallel_lc = example_bridge.moving_load_case_dict["moving lane parallel"]
+    assert len(default_lc) == len(parallel_lc) == 21
+    for default_dict, parallel_dict in zip(default_lc, parallel_lc):
+        assert parallel_dict["load_command"] == pytest.approx(
+            default_dict["load_command"]
+        )
+    # records of line load intersections are merged back from workers
+    line_int_list = example_bridge.global_line_int_dict
+    assert len(line_int_list) == 14
+    assert line_int_list[7:] == line_int_list[:7]
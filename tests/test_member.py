@@ -43,7 +43,10 @@ def test_section_command(ref_bridge_properties):
     example_bridge.set_shell_members(slab_shell)
 
     example_bridge.create_osp_model(pyfile=False)
-    assert example_bridge.section_command_list == [
+    assert [
+        section_command.render()
+        for section_command in example_bridge.section_command_list
+    ] == [
         'ops.section("ElasticMembranePlateSection", 1, 34800000000.0, 0.2, 0.2, 2400.0)\n'
     ]
 
@@ -371,8 +371,8 @@ def test_member_reassignment_feature(ref_bridge_properties):
     # og.opsv.plot_model(element_labels=0, az_el=(-90, 0))  # plotting using ops_vis
     # og.plt.show()
     assert (
-        variant_one_model.element_command_list[2]
-        == 'ops.element("elasticBeamColumn", 2, *[2, 3], *[9.963e-02, 3.480e+10, 1.450e+10, 5.850e-04, 2.475e-04, 5.445e-04], 1, 106.272)\n'
+        variant_one_model.element_command_list[2].render()
+        == 'ops.element("elasticBeamColumn", 2, 2, 3, 0.09963, 34800000000.0, 14500000000.0, 0.000585, 0.0002475, 0.0005445, 1, 106.272)\n'
     )
 
 
@@ -699,3 +699,361 @@ def test_multispan_with_ortho_40deg_skew(ref_bridge_properties):
             [0.0, 5.335, 10.67, 16.005, 21.34, 26.675, 32.01],
         )
     )
+
+
+def test_grid_spatial_index(bridge_model_42_negative):
+    # test point-in-grid search using spatial index of grids returns same grid as search over all grids
+    example_bridge = bridge_model_42_negative
+    mesh = example_bridge.Mesh_obj
+    for x, z in [(5, 2), (5.2, 3.9), (10.0, 0.5), (27.5, 6.8), (33.0, 1.0), (-2, 3)]:
+        _, grid = example_bridge._get_point_load_nodes(point=[x, 0, z])
+        ref_grid = None
+        for grid_tag, grid_nodes in mesh.grid_number_dict.items():
+            point_list = [
+                og.Point(*mesh.node_spec[node]["coordinate"]) for node in grid_nodes
+            ]
+            if og.check_point_in_grid(og.Point(x, 0, z), point_list):
+                ref_grid = grid_tag
+        assert grid == ref_grid
+        if grid is not None:
+            assert grid in mesh.get_candidate_grids(x, z)
+
+
+def test_candidate_grid_pairs(bridge_model_42_negative):
+    # test vectorised bucket look up gives the same candidate grids as look up of each point
+    mesh = bridge_model_42_negative.Mesh_obj
+    x = og.np.array([5, 5.2, 10.0, 27.5, 33.0, -2, 100])
+    z = og.np.array([2, 3.9, 0.5, 6.8, 1.0, 3, 3])
+    point_index, grid = mesh.get_candidate_grid_pairs(x, z)
+    for count in range(len(x)):
+        assert sorted(grid[point_index == count]) == mesh.get_candidate_grids(
+            x[count], z[count]
+        )
+
+
+def test_locate_points(bridge_model_42_negative):
+    # test vectorised point location returns same grid, nodes and natural coordinates as single point search
+    example_bridge = bridge_model_42_negative
+    points = og.np.array([[5, 0, 2], [5.2, 0, 3.9], [27.5, 0, 6.8], [-2, 0, 3]])
+    grid, sorted_node, natural_coordinate = example_bridge.locate_points(points)
+    for count, point in enumerate(points):
+        grid_nodes, ref_grid = example_bridge._get_point_load_nodes(
+            point=list(point)
+        )
+        if ref_grid is None:
+            assert grid[count] == -1
+            continue
+        assert grid[count] == ref_grid
+        point_list = [
+            og.Point(*example_bridge.Mesh_obj.node_spec[node]["coordinate"])
+            for node in grid_nodes
+        ]
+        sorted_point, sorted_tag = og.sort_vertices(point_list, grid_nodes)
+        assert list(sorted_node[count]) == sorted_tag
+        eta, zeta = og.solve_zeta_eta(
+            point[0],
+            point[2],
+            *[c for p in sorted_point for c in (p.x, p.z)],
+        )
+        assert natural_coordinate[count] == pytest.approx([eta, zeta])
+
+
+def test_point_load_weight_cache(bridge_model_42_negative):
+    # test grid hints and cached nodal weights of point loads give the same nodal loads as uncached assignment
+    example_bridge = bridge_model_42_negative
+    mesh = example_bridge.Mesh_obj
+    points = og.np.array([[5, 0, 2], [5.2, 0, 3.9], [27.5, 0, 6.8], [-2, 0, 3]])
+    grid, _, _ = example_bridge.locate_points(points)
+    # wrong hints (e.g. wheel moved to the next grid) fall back to the spatial index
+    for grid_hint in [grid, og.np.roll(grid, 1), og.np.zeros(4, dtype=int)]:
+        hinted_grid, _, _ = example_bridge.locate_points(points, grid_hint=grid_hint)
+        assert list(hinted_grid) == list(grid)
+    # congruent grids share a class
+    assert len(set(mesh.grid_shape_class)) < len(mesh.grid_number_dict)
+    # same wheels moved along a path, assigned with and without cache
+    mag_list = [20, 50, 10, 5]
+    shape_func_list = ["hermite", "linear", "hermite", "linear"]
+    ref_list = []
+    for step in og.np.linspace(0, 3, 7):
+        example_bridge._point_weight_cache = dict()
+        ref_list.append(
+            example_bridge._assign_points_to_four_node(
+                (points + [step, 0, 0]).tolist(), mag_list, shape_func_list
+            )
+        )
+    for step, ref in zip(og.np.linspace(0, 3, 7), ref_list):
+        nodal_load = example_bridge._assign_points_to_four_node(
+            (points + [step, 0, 0]).tolist(), mag_list, shape_func_list
+        )
+        assert nodal_load == pytest.approx(ref)
+    assert example_bridge._point_weight_cache
+
+
+def test_grid_walk_along_line(bridge_model_42_negative):
+    # test grids searched for line load are only those along the line
+    example_bridge = bridge_model_42_negative
+    mesh = example_bridge.Mesh_obj
+    point_1 = og.create_load_vertex(x=2, z=1, p=2)
+    point_2 = og.create_load_vertex(x=15, z=5, p=2)
+    line_grid_intersect, _ = example_bridge._get_line_load_nodes(
+        list_of_load_vertices=[point_1, point_2]
+    )
+    candidate_grids = mesh.get_candidate_grids_along_line(2, 1, 15, 5)
+    assert line_grid_intersect
+    assert all([grid in candidate_grids for grid in line_grid_intersect.keys()])
+    assert len(candidate_grids) < len(mesh.grid_number_dict)
+
+
+def test_node_pair_to_element(bridge_model_42_negative):
+    # test element look up by node pair returns the element joining the nodes
+    mesh = bridge_model_42_negative.Mesh_obj
+    ele_lists = {
+        "long": mesh.long_ele,
+        "trans": mesh.trans_ele,
+        "edge": mesh.edge_span_ele,
+    }
+    for ele in mesh.long_ele + mesh.trans_ele + mesh.edge_span_ele:
+        element_kind, index = mesh.node_pair_to_element[frozenset([ele[2], ele[1]])]
+        assert ele_lists[element_kind][index] == ele
+
+
+def test_node_to_grids(bridge_model_42_negative):
+    # test inverted index of node to grids is consistent with grid_number_dict
+    mesh = bridge_model_42_negative.Mesh_obj
+    for node, grids in mesh.node_to_grids.items():
+        assert grids == {
+            grid
+            for grid, grid_nodes in mesh.grid_number_dict.items()
+            if node in grid_nodes
+        }
+
+
+def test_node_incidence(bridge_model_42_negative):
+    # test node incidence table and widths of nodes in z direction
+    mesh = bridge_model_42_negative.Mesh_obj
+    for node, incidence in mesh.node_incidence_dict.items():
+        assert incidence["trans"] == [
+            i for i, ele in enumerate(mesh.trans_ele) if node in ele[1:3]
+        ]
+    for ele in mesh.long_ele:
+        width = mesh.node_width_z_dict[ele[1]]
+        assert len(width) == len(mesh.node_incidence_dict[ele[1]]["trans"])
+        for ele_width, index in zip(width, mesh.node_incidence_dict[ele[1]]["trans"]):
+            trans_ele = mesh.trans_ele[index]
+            assert og.np.allclose(
+                ele_width,
+                og.np.abs(
+                    og.np.array(mesh.node_spec[trans_ele[1]]["coordinate"])
+                    - og.np.array(mesh.node_spec[trans_ele[2]]["coordinate"])
+                ),
+            )
+
+
+def test_compact_mesh_storage(shell_link_bridge):
+    # test node and element arrays of mesh with read-only node_spec and element list views
+    mesh = shell_link_bridge.Mesh_obj
+    assert mesh.node_coordinate_array.shape == (len(mesh.node_spec), 3)
+    for row, (node_tag, node) in enumerate(mesh.node_spec.items()):
+        assert node["tag"] == node_tag == mesh.node_tag_array[row]
+        assert node["coordinate"] == list(mesh.node_coordinate_array[row])
+    assert mesh.get_node_coordinates([1, 2]).tolist() == [
+        mesh.node_spec[1]["coordinate"],
+        mesh.node_spec[2]["coordinate"],
+    ]
+    # offset nodes with str groups
+    assert any(isinstance(node["z_group"], str) for node in mesh.node_spec.values())
+    assert mesh.long_ele[0] == mesh.ele_connectivity_dict["long"][0].tolist()
+    assert len(mesh.long_ele + mesh.trans_ele) == len(mesh.long_ele) + len(
+        mesh.trans_ele
+    )
+    with pytest.raises(TypeError):
+        mesh.node_spec[1] = {}
+    with pytest.raises(AttributeError):
+        mesh.long_ele.append([])
+
+
+def test_mesh_cache(tmp_path, monkeypatch):
+    # test mesh is stored in and loaded from mesh cache dir
+    kwargs = dict(
+        bridge_name="cache_bridge",
+        long_dim=10,
+        width=7,
+        skew=12,
+        num_long_grid=5,
+        num_trans_grid=6,
+        edge_beam_dist=1,
+        mesh_type="Oblique",
+        mesh_cache_dir=str(tmp_path),
+    )
+    model = og.create_grillage(**kwargs)
+    assert len(list(tmp_path.glob("mesh_*.npz"))) == 1
+
+    # meshing procedure is not called for same meshing inputs
+    def no_meshing(self):
+        raise Exception("Mesh not loaded from cache")
+
+    monkeypatch.setattr(og.Mesh, "_mesh_grillage", no_meshing)
+    cached_model = og.create_grillage(**kwargs)
+    assert cached_model.Mesh_obj is not model.Mesh_obj
+    assert og.np.array_equal(
+        cached_model.Mesh_obj.node_coordinate_array,
+        model.Mesh_obj.node_coordinate_array,
+    )
+    assert cached_model.Mesh_obj.long_ele == model.Mesh_obj.long_ele
+    assert cached_model.Mesh_obj.grid_number_dict == model.Mesh_obj.grid_number_dict
+    # different meshing inputs are meshed
+    with pytest.raises(Exception, match="Mesh not loaded from cache"):
+        og.create_grillage(**dict(kwargs, num_trans_grid=7))
+    # cache key of array inputs is exact - NumPy repr rounds floats and summarizes large arrays
+    get_key = model._get_mesh_cache_key
+    assert get_key(spacing=og.np.array([1.000000001, 2.0])) != get_key(
+        spacing=og.np.array([1.000000002, 2.0])
+    )
+    large_array = og.np.zeros(2000)
+    changed_array = large_array.copy()
+    changed_array[1000] = 1
+    assert get_key(spacing=large_array) != get_key(spacing=changed_array)
+    assert get_key(spacing=[og.np.float64(1.000000001)]) != get_key(
+        spacing=[og.np.float64(1.000000002)]
+    )
+    # cache dir does not affect the mesh
+    assert get_key(num_long_grid=5, mesh_cache_dir="a") == get_key(num_long_grid=5)
+
+
+def test_mesh_cache_file(tmp_path, shell_link_bridge):
+    # test mesh cache file restores state of shell and curved meshes, and is read without pickle
+    curved_mesh = og.create_grillage(
+        bridge_name="curve_bridge",
+        long_dim=33.5,
+        width=11.565,
+        skew=15,
+        num_long_grid=9,
+        num_trans_grid=21,
+        edge_beam_dist=1.0875,
+        mesh_type="Ortho",
+        mesh_radius=100,
+    ).Mesh_obj
+    for mesh in [shell_link_bridge.Mesh_obj, curved_mesh]:
+        cache_file = tmp_path / "mesh.npz"
+        og.save_mesh_cache(mesh, str(cache_file))
+        cached_mesh = og.load_mesh_cache(str(cache_file))
+        assert type(cached_mesh) is type(mesh)
+        assert cached_mesh.node_spec[5] == mesh.node_spec[5]
+        assert cached_mesh.trans_ele == mesh.trans_ele
+        assert cached_mesh.node_pair_to_element == mesh.node_pair_to_element
+        assert cached_mesh.link_str_list == mesh.link_str_list
+        assert cached_mesh.start_edge_line.node_list == mesh.start_edge_line.node_list
+        # stored state is identical
+        arrays, cached_arrays = dict(), dict()
+        assert og.mesh._encode_mesh_state(
+            cached_mesh, cached_arrays
+        ) == og.mesh._encode_mesh_state(mesh, arrays)
+        for key, array in arrays.items():
+            assert og.np.array_equal(cached_arrays[key], array, equal_nan=True)
+    # objects other than mesh objects are not stored
+    with pytest.raises(TypeError):
+        og.save_mesh_cache(shell_link_bridge, str(cache_file))
+
+
+def test_search_x_point():
+    # test search of point on curved sweep path whose normal intersects edge nodes
+    model = og.create_grillage(
+        bridge_name="curve_bridge",
+        long_dim=33.5,
+        width=11.565,
+        skew=15,
+        num_long_grid=9,
+        num_trans_grid=21,
+        edge_beam_dist=1.0875,
+        mesh_type="Ortho",
+        mesh_radius=100,
+    )
+    mesh = model.Mesh_obj
+    # same as increment search for start edge nodes
+    for int_point in mesh.start_edge_line.node_list:
+        assert mesh._search_x_point(int_point) == pytest.approx(
+            mesh._search_x_point_increment(int_point)
+        )
+    # search of all points of an edge line in one call same as point by point search
+    assert mesh._search_x_points(mesh.end_edge_line.node_list) == [
+        mesh._search_x_point(int_point) for int_point in mesh.end_edge_line.node_list
+    ]
+    for int_point in mesh.end_edge_line.node_list:
+        x, z = mesh._search_x_point(int_point)
+        projected_x = mesh.sweep_path.get_projected_x(int_point[0], int_point[2])
+        assert abs(x - projected_x) <= mesh.search_x_inc / 2
+        assert z == pytest.approx(mesh.sweep_path.get_line_function(x))
+        # projection is closest point on sweep path
+        x_range = projected_x + og.np.linspace(-0.01, 0.01, 21)
+        dist = og.np.hypot(
+            x_range - int_point[0],
+            mesh.sweep_path.get_line_function(x_range) - int_point[2],
+        )
+        assert og.np.argmin(dist) == 10
+
+
+def test_numberer(bridge_42_0_angle_mesh):
+    # test bandwidth of node numbering and selection of numberer and system of equations
+    model = bridge_42_0_angle_mesh
+    mesh = model.Mesh_obj
+    assert (model.numberer, model.system) == ("Plain", "BandGeneral")
+    rcm_ordering = mesh.get_rcm_ordering()
+    assert sorted(rcm_ordering) == list(range(len(mesh.node_tag_array)))
+    assert mesh.get_node_bandwidth(rcm_ordering) <= mesh.get_node_bandwidth()
+    assert model._select_numberer("RCM") == ("RCM", "BandGeneral")
+    assert model._select_numberer("AMD") == ("AMD", "UmfPack")
+    # RCM reduces bandwidth of the fixture from 36 to 8, still wide for its 56 nodes (8**2 > 56), hence AMD
+    assert (mesh.get_node_bandwidth(), mesh.get_node_bandwidth(rcm_ordering)) == (36, 8)
+    assert model._select_numberer("auto") == ("AMD", "UmfPack")
+    with pytest.raises(ValueError):
+        model._select_numberer("Reverse")
+
+
+def test_numberer_displacements(ref_bridge_properties):
+    # test analyses with RCM and AMD numberers give the same displacements as Plain numbering
+    I_beam, slab, exterior_I_beam, concrete = ref_bridge_properties
+    displacement_dict = dict()
+    for numberer in ["Plain", "RCM", "AMD"]:
+        model = og.OspGrillage(
+            bridge_name="SuperT_10m",
+            long_dim=10,
+            width=7,
+            skew=[42, 0],
+            num_long_grid=7,
+            num_trans_grid=5,
+            edge_beam_dist=1,
+            mesh_type="Ortho",
+            numberer=numberer,
+        )
+        model.set_member(I_beam, member="interior_main_beam")
+        for member in [
+            "exterior_main_beam_1",
+            "exterior_main_beam_2",
+            "edge_beam",
+            "start_edge",
+            "end_edge",
+        ]:
+            model.set_member(exterior_I_beam, member=member)
+        model.set_member(slab, member="transverse_slab")
+        model.create_osp_model(pyfile=False)
+        assert model.numberer == numberer
+        point_load_case = og.create_load_case(name="point")
+        point_load_case.add_load(
+            og.create_load(
+                loadtype="point", name="point", point1=og.LoadPoint(5, 0, 3, 20)
+            )
+        )
+        model.add_load_case(point_load_case)
+        model.analyze()
+        displacement_dict[numberer] = (
+            model.get_results()["displacements"].values.astype(float)
+        )
+    assert og.np.nanmax(og.np.abs(displacement_dict["Plain"])) > 0
+    for numberer in ["RCM", "AMD"]:
+        assert og.np.allclose(
+            displacement_dict[numberer],
+            displacement_dict["Plain"],
+            rtol=1e-6,
+            atol=1e-12,
+            equal_nan=True,
+        )
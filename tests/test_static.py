@@ -48,3 +48,23 @@ def test_rotating_points():
     print(rotated_coord)
     assert og.np.isclose(rotated_coord[0], 5.585100198856649)
     assert og.np.isclose(rotated_coord[1], -1.3146163850505417)
+
+
+def test_solve_zeta_eta():
+    # check inverse bilinear mapping of points in a skewed grid returns natural coordinates of the points
+    x = og.np.array([0, 2, 3.5, 0.5])
+    z = og.np.array([0, 0.2, 1.8, 1])
+    eta_ref = og.np.array([-0.5, 0.3, 0.9, 0])
+    zeta_ref = og.np.array([0.7, -0.2, 0.4, 0])
+    N = og.ShapeFunction.linear_shape_function(eta_ref, zeta_ref)
+    xp = sum([n * xi for n, xi in zip(N, x)])
+    zp = sum([n * zi for n, zi in zip(N, z)])
+    eta, zeta = og.solve_zeta_eta_array(
+        xp, zp, og.np.tile(x, (4, 1)), og.np.tile(z, (4, 1))
+    )
+    assert og.np.allclose(eta, eta_ref)
+    assert og.np.allclose(zeta, zeta_ref)
+    # single point wrapper
+    assert og.solve_zeta_eta(
+        xp[0], zp[0], x[0], z[0], x[1], z[1], x[2], z[2], x[3], z[3]
+    ) == pytest.approx((eta_ref[0], zeta_ref[0]))